@@ -0,0 +1,561 @@
+"""Banc d'essai du client d'administration contre un serveur local simulé
+
+Usage :
+    python benchmark.py [--users N] [--articles N] [--categories N] [--tokens N]
+                        [--latency MS] [--repeat N] [--json FICHIER] [--compare FICHIER]
+
+Le serveur simulé reproduit /api/auth/login, /api/users, /api/articles,
+/api/categories, /api/tokens, /api/rest/articles* (JSON et XML) et le service
+SOAP UserWebService, avec des volumes de données et une latence configurables.
+
+Les scénarios d'interface (connexion, tableau de bord, actualisation, frappe
+dans le filtre, rendu REST) nécessitent un affichage : sans $DISPLAY, Xvfb est
+lancé s'il est installé ; sinon seuls les scénarios sans interface sont mesurés.
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "complete-news-admin-app.py")
+SOAP_NS = "http://soap.newsplatform.com/"
+ENVELOPE_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+
+
+def load_app():
+    """Importe l'application (nom de fichier non importable directement)"""
+    spec = importlib.util.spec_from_file_location("news_admin_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["news_admin_app"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- Données simulées ------------------------------------------------------
+
+class MockDataset:
+    """Jeu de données déterministe aux volumes demandés"""
+    def __init__(self, users=200, articles=2000, categories=12, tokens=50):
+        roles = ["VISITOR", "EDITOR", "ADMIN"]
+        statuses = ["draft", "published", "archived"]
+
+        self.categories = [
+            {"id": i, "name": f"Categorie{i}", "description": f"Description de la catégorie {i}"}
+            for i in range(1, categories + 1)
+        ]
+        self.users = [
+            {"id": i, "username": f"user{i}", "email": f"user{i}@example.com",
+             "firstName": f"Prénom{i}", "lastName": f"Nom{i}", "role": roles[i % 3],
+             "active": i % 5 != 0}
+            for i in range(1, users + 1)
+        ]
+        self.articles = []
+        for i in range(1, articles + 1):
+            category = self.categories[i % categories] if categories else {"name": ""}
+            day = 1 + i % 28
+            self.articles.append({
+                "id": i, "title": f"Titre de l'article {i}",
+                "summary": f"Résumé de l'article {i}",
+                "content": f"Contenu de l'article {i}. " * 20,
+                "categoryName": category["name"], "authorName": f"user{1 + i % max(users, 1)}",
+                "status": statuses[i % 3],
+                "createdDate": f"2024-03-{day:02d}T10:{i % 60:02d}:00",
+                "publishedDate": f"2024-03-{day:02d}T12:{i % 60:02d}:00",
+            })
+        self.tokens = [
+            {"id": i, "token": f"tok{i:04d}" + "x" * 60, "description": f"Jeton {i}",
+             "createdAt": "2024-01-01T00:00:00", "expiresAt": "2025-01-01T00:00:00",
+             "revoked": i % 7 == 0, "expired": False}
+            for i in range(1, tokens + 1)
+        ]
+        self.lock = threading.Lock()
+
+    def collection(self, name):
+        return getattr(self, name)
+
+
+def to_xml(value, tag="List"):
+    """Sérialisation XML à la manière de Jackson (listes en <item>)"""
+    element = ET.Element(tag)
+    if isinstance(value, list):
+        for item in value:
+            element.append(to_xml(item, "item"))
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            element.append(to_xml(item, key))
+    elif value is not None:
+        element.text = str(value).lower() if isinstance(value, bool) else str(value)
+    return element
+
+
+WSDL_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<wsdl:definitions name="UserWebServiceService" targetNamespace="{ns}"
+    xmlns:wsdl="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:tns="{ns}" xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <wsdl:types>
+    <xs:schema targetNamespace="{ns}" elementFormDefault="unqualified">
+      <xs:complexType name="user">
+        <xs:sequence>
+          <xs:element name="id" type="xs:long" minOccurs="0"/>
+          <xs:element name="username" type="xs:string" minOccurs="0"/>
+          <xs:element name="email" type="xs:string" minOccurs="0"/>
+          <xs:element name="firstName" type="xs:string" minOccurs="0"/>
+          <xs:element name="lastName" type="xs:string" minOccurs="0"/>
+          <xs:element name="role" type="xs:string" minOccurs="0"/>
+          <xs:element name="active" type="xs:boolean" minOccurs="0"/>
+          <xs:element name="password" type="xs:string" minOccurs="0"/>
+        </xs:sequence>
+      </xs:complexType>
+      <xs:element name="authenticate"><xs:complexType><xs:sequence>
+        <xs:element name="username" type="xs:string" minOccurs="0"/>
+        <xs:element name="password" type="xs:string" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="authenticateResponse"><xs:complexType><xs:sequence>
+        <xs:element name="return" type="xs:boolean"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="listUsers"><xs:complexType><xs:sequence>
+        <xs:element name="authToken" type="xs:string" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="listUsersResponse"><xs:complexType><xs:sequence>
+        <xs:element name="return" type="tns:user" minOccurs="0" maxOccurs="unbounded"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="addUser"><xs:complexType><xs:sequence>
+        <xs:element name="authToken" type="xs:string" minOccurs="0"/>
+        <xs:element name="user" type="tns:user" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="addUserResponse"><xs:complexType><xs:sequence>
+        <xs:element name="return" type="tns:user" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="updateUser"><xs:complexType><xs:sequence>
+        <xs:element name="authToken" type="xs:string" minOccurs="0"/>
+        <xs:element name="userId" type="xs:long" minOccurs="0"/>
+        <xs:element name="user" type="tns:user" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="updateUserResponse"><xs:complexType><xs:sequence>
+        <xs:element name="return" type="tns:user" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="deleteUser"><xs:complexType><xs:sequence>
+        <xs:element name="authToken" type="xs:string" minOccurs="0"/>
+        <xs:element name="userId" type="xs:long" minOccurs="0"/>
+      </xs:sequence></xs:complexType></xs:element>
+      <xs:element name="deleteUserResponse"><xs:complexType><xs:sequence/></xs:complexType></xs:element>
+    </xs:schema>
+  </wsdl:types>
+{messages}
+  <wsdl:portType name="UserWebService">
+{port_operations}
+  </wsdl:portType>
+  <wsdl:binding name="UserWebServiceServiceSoapBinding" type="tns:UserWebService">
+    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+{binding_operations}
+  </wsdl:binding>
+  <wsdl:service name="UserWebServiceService">
+    <wsdl:port name="UserWebServicePort" binding="tns:UserWebServiceServiceSoapBinding">
+      <soap:address location="{location}"/>
+    </wsdl:port>
+  </wsdl:service>
+</wsdl:definitions>
+"""
+
+SOAP_OPERATIONS = ["authenticate", "listUsers", "addUser", "updateUser", "deleteUser"]
+
+
+def build_wsdl(location):
+    messages, port_operations, binding_operations = [], [], []
+    for name in SOAP_OPERATIONS:
+        for suffix in ("", "Response"):
+            messages.append(f'  <wsdl:message name="{name}{suffix}">'
+                            f'<wsdl:part name="parameters" element="tns:{name}{suffix}"/></wsdl:message>')
+        port_operations.append(f'    <wsdl:operation name="{name}">'
+                               f'<wsdl:input message="tns:{name}"/>'
+                               f'<wsdl:output message="tns:{name}Response"/></wsdl:operation>')
+        binding_operations.append(f'    <wsdl:operation name="{name}"><soap:operation soapAction=""/>'
+                                  '<wsdl:input><soap:body use="literal"/></wsdl:input>'
+                                  '<wsdl:output><soap:body use="literal"/></wsdl:output></wsdl:operation>')
+    return WSDL_TEMPLATE.format(ns=SOAP_NS, location=location, messages="\n".join(messages),
+                                port_operations="\n".join(port_operations),
+                                binding_operations="\n".join(binding_operations))
+
+
+# --- Serveur simulé --------------------------------------------------------
+
+class MockBackendHandler(BaseHTTPRequestHandler):
+    """Routes REST et SOAP du backend ; self.server porte dataset et latency"""
+    protocol_version = "HTTP/1.1"
+    # En-têtes et corps partent en deux écritures : sans TCP_NODELAY, l'ACK
+    # retardé ajouterait ~40 ms à chaque requête keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    # Réponses
+
+    def send_body(self, status, body=b"", content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_data(self, value, status=200):
+        if "xml" in self.headers.get("Accept", ""):
+            body = ET.tostring(to_xml(value), encoding="utf-8")
+            self.send_body(status, body, "application/xml")
+        else:
+            self.send_body(status, json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def route(self, method):
+        time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        path, query = unquote(url.path), parse_qs(url.query)
+        dataset = self.server.dataset
+
+        if path == "/soap/users":
+            if method == "GET":
+                location = f"http://{self.headers.get('Host')}/soap/users"
+                return self.send_body(200, build_wsdl(location).encode("utf-8"), "text/xml")
+            return self.handle_soap()
+
+        if path == "/api/auth/login" and method == "POST":
+            credentials = json.loads(self.read_body() or b"{}")
+            return self.send_data({"token": "mock-jwt", "username": credentials.get("username"),
+                                   "role": "ADMIN", "userId": 1})
+
+        if path.startswith("/api/rest/articles"):
+            return self.handle_rest(path)
+
+        match = re.fullmatch(r"/api/(users|articles|categories|tokens)(?:/(\d+))?(/status)?", path)
+        if not match:
+            return self.send_body(404)
+        name, item_id, status_suffix = match.groups()
+        records = dataset.collection(name)
+
+        if item_id is None:
+            if method == "GET":
+                if "page" in query:
+                    page, size = int(query["page"][0]), int(query.get("size", ["20"])[0])
+                    content = records[page * size:(page + 1) * size]
+                    return self.send_data({"content": content, "totalElements": len(records),
+                                           "last": (page + 1) * size >= len(records)})
+                return self.send_data(records)
+            if method == "POST":
+                record = json.loads(self.read_body() or b"{}")
+                with dataset.lock:
+                    record["id"] = max((r["id"] for r in records), default=0) + 1
+                    records.append(record)
+                return self.send_data(record, 201)
+            return self.send_body(405)
+
+        record = next((r for r in records if r["id"] == int(item_id)), None)
+        if record is None:
+            return self.send_body(404)
+        if method == "GET":
+            return self.send_data(record)
+        if method in ("PUT", "PATCH"):
+            self.read_body()
+            return self.send_data(record)
+        if method == "DELETE":
+            return self.send_body(204)
+        return self.send_body(405)
+
+    def handle_rest(self, path):
+        articles = self.server.dataset.articles
+        if path == "/api/rest/articles":
+            return self.send_data(articles)
+        if path == "/api/rest/articles/grouped":
+            grouped = {}
+            for article in articles:
+                grouped.setdefault(article["categoryName"], []).append(article)
+            return self.send_data(grouped)
+        match = re.fullmatch(r"/api/rest/articles/category/(.+)", path)
+        if match:
+            return self.send_data([a for a in articles if a["categoryName"] == match.group(1)])
+        return self.send_body(404)
+
+    def handle_soap(self):
+        request = ET.fromstring(self.read_body())
+        operation = request.find(f"{{{ENVELOPE_NS}}}Body")[0]
+        name = operation.tag.split("}")[-1]
+
+        if name == "authenticate":
+            result = "<return>true</return>"
+        elif name == "listUsers":
+            result = "".join(
+                "<return>" + "".join(f"<{key}>{str(value).lower() if isinstance(value, bool) else value}</{key}>"
+                                     for key, value in user.items()) + "</return>"
+                for user in self.server.dataset.users)
+        elif name in ("addUser", "updateUser"):
+            result = "<return><id>1</id></return>"
+        else:
+            result = ""
+
+        body = (f'<soap:Envelope xmlns:soap="{ENVELOPE_NS}"><soap:Body>'
+                f'<ns2:{name}Response xmlns:ns2="{SOAP_NS}">{result}</ns2:{name}Response>'
+                '</soap:Body></soap:Envelope>')
+        self.send_body(200, body.encode("utf-8"), "text/xml; charset=utf-8")
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_PUT(self):
+        self.route("PUT")
+
+    def do_PATCH(self):
+        self.route("PATCH")
+
+    def do_DELETE(self):
+        self.route("DELETE")
+
+
+def start_mock_server(dataset, latency_ms=0):
+    """Démarre le serveur simulé dans un thread ; retourne (serveur, URL de base)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockBackendHandler)
+    server.daemon_threads = True
+    server.dataset = dataset
+    server.latency = latency_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# --- Mesures ---------------------------------------------------------------
+
+class Benchmark:
+    """Exécute les scénarios et conserve les durées (ms) par scénario"""
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = {}
+
+    def measure(self, name, func, setup=None):
+        """Exécute func `repeat` fois ; une erreur est notée sans arrêter la suite"""
+        samples = []
+        try:
+            for _ in range(self.repeat):
+                if setup:
+                    setup()
+                start = time.perf_counter()
+                func()
+                samples.append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            print(f"  {name}: échec ({e})", file=sys.stderr)
+            return
+        self.results[name] = samples
+
+    def summary(self):
+        rows = {}
+        for name, samples in self.results.items():
+            ordered = sorted(samples)
+            rows[name] = {
+                "median": statistics.median(ordered),
+                "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+                "min": ordered[0],
+                "runs": len(ordered),
+            }
+        return rows
+
+
+def run_api_scenarios(app, bench, base_url, dataset):
+    """Scénarios sans interface : client synchrone, asynchrone et export"""
+    api = app.NewsApiClient(base_url)
+
+    bench.measure("connexion REST", lambda: api.login("admin", "admin"))
+
+    def soap_session():
+        client = app.NewsApiClient(base_url)
+        client.login("admin", "admin")
+        client.list_users()
+    bench.measure("connexion + SOAP listUsers", soap_session)
+
+    bench.measure("liste des articles", api.list_articles)
+
+    def dashboard():
+        async_api = app.AsyncNewsApiClient(api)
+
+        async def load():
+            results = await async_api.gather(async_api.get_json("/api/users"),
+                                             async_api.list_articles(),
+                                             async_api.list_categories())
+            await async_api.aclose()
+            return results
+        asyncio.run(load())
+    bench.measure("tableau de bord (3 requêtes simultanées)", dashboard)
+
+    with tempfile.TemporaryDirectory() as directory:
+        destination = os.path.join(directory, "articles.jsonl")
+        bench.measure("export articles JSON Lines (pages de 500)",
+                      lambda: app.export_collection(api, "articles", destination))
+
+    # Parsing et mise en forme hors Tk (méthodes indépendantes de l'affichage)
+    formatter = object.__new__(app.NewsAdminApp)
+    for format_type in ("JSON", "XML"):
+        status, content, _ = api.fetch_rest("/api/rest/articles", format_type)
+        bench.measure(f"REST {format_type} : réseau",
+                      lambda f=format_type: api.fetch_rest("/api/rest/articles", f))
+        bench.measure(f"REST {format_type} : parsing et mise en forme",
+                      lambda c=content, f=format_type: formatter.format_rest_content(c, f))
+
+
+def ensure_display():
+    """Lance Xvfb si aucun affichage n'est disponible ; retourne le processus ou None"""
+    if os.environ.get("DISPLAY") or shutil.which("Xvfb") is None:
+        return None
+    display = f":{90 + os.getpid() % 100}"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1600x900x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def run_ui_scenarios(app, bench, base_url, dataset):
+    """Scénarios d'interface, pilotés sans interaction via la boucle Tk"""
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.geometry("1400x800")
+    # Pas de boîte de confirmation bloquante pendant les mesures
+    app.messagebox.askyesno = lambda *args, **kwargs: True
+    gui = app.NewsAdminApp(root)
+    gui.api.base_url = base_url
+
+    def pump_until(condition, timeout=30):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                raise TimeoutError("délai dépassé")
+            root.update()
+            time.sleep(0.001)
+        root.update_idletasks()
+
+    expected_users = str(len(dataset.users))
+
+    def login():
+        gui.setup_login_screen()
+        gui.username_entry.set("admin")
+        gui.password_entry.set("admin")
+        gui.login()
+        pump_until(lambda: "content_area" in gui.__dict__ and gui.content_area.winfo_exists()
+                   and gui.current_view is not None)
+
+    def login_to_dashboard():
+        login()
+        pump_until(lambda: gui.dashboard_stats["users"].get() == expected_users)
+    bench.measure("UI : connexion jusqu'à l'interface principale", login)
+    bench.measure("UI : connexion jusqu'au tableau de bord rempli", login_to_dashboard)
+
+    def dashboard():
+        gui.dashboard_stats["users"].set("")
+        gui.show_dashboard()
+        pump_until(lambda: gui.dashboard_stats["users"].get() == expected_users)
+    bench.measure("UI : tableau de bord", dashboard)
+
+    gui.show_article_management()
+    pump_until(lambda: True)
+
+    def refresh():
+        gui.refresh_articles()
+        root.update_idletasks()
+    bench.measure("UI : actualisation des articles", refresh)
+
+    queries = iter(f"article {i}" for i in range(10 ** 6))
+
+    def keystroke():
+        gui.article_search_entry.set(next(queries))
+        gui.filter_articles()
+        root.update_idletasks()
+    bench.measure("UI : frappe dans le filtre des articles", keystroke)
+
+    gui.show_rest_services()
+    pump_until(lambda: True)
+    for format_type in ("JSON", "XML"):
+        status, content, _ = gui.api.fetch_rest("/api/rest/articles", format_type)
+        bench.measure(f"UI : rendu REST {format_type}",
+                      lambda c=content, f=format_type: gui.display_rest_response(c, f))
+
+    root.destroy()
+
+
+def print_summary(rows, baseline=None):
+    header = f"{'scénario':<48}{'médiane':>10}{'p90':>10}{'min':>10}"
+    if baseline:
+        header += f"{'écart':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, row in rows.items():
+        line = f"{name:<48}{row['median']:>10.1f}{row['p90']:>10.1f}{row['min']:>10.1f}"
+        if baseline and name in baseline:
+            reference = baseline[name]["median"]
+            line += f"{(row['median'] - reference) / reference * 100 if reference else 0:>+9.0f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai du client contre un serveur simulé")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0, help="latence injectée par requête (ms)")
+    parser.add_argument("--repeat", type=int, default=10, help="exécutions par scénario")
+    parser.add_argument("--no-ui", action="store_true", help="ignorer les scénarios d'interface")
+    parser.add_argument("--json", help="écrire les résultats dans ce fichier")
+    parser.add_argument("--compare", help="résultats de référence (--json d'une version précédente)")
+    args = parser.parse_args(argv)
+
+    app = load_app()
+    dataset = MockDataset(args.users, args.articles, args.categories, args.tokens)
+    server, base_url = start_mock_server(dataset, args.latency)
+    bench = Benchmark(max(1, args.repeat))
+    xvfb = None
+
+    print(f"Serveur simulé {base_url} : {args.users} utilisateurs, {args.articles} articles, "
+          f"{args.categories} catégories, {args.tokens} jetons, latence {args.latency} ms",
+          file=sys.stderr)
+    try:
+        run_api_scenarios(app, bench, base_url, dataset)
+        if not args.no_ui:
+            xvfb = ensure_display()
+            if os.environ.get("DISPLAY"):
+                run_ui_scenarios(app, bench, base_url, dataset)
+            else:
+                print("Aucun affichage (ni $DISPLAY ni Xvfb) : scénarios d'interface ignorés",
+                      file=sys.stderr)
+    finally:
+        server.shutdown()
+        if xvfb is not None:
+            xvfb.terminate()
+
+    rows = bench.summary()
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+    print_summary(rows, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump({"parameters": vars(args), "results": rows}, stream, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,95 +1,1373 @@
+import time
+_MODULE_START = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
-import requests
-from zeep import Client
-from zeep.transports import Transport
+import importlib
+import importlib.util
 import json
+import csv
+import os
+import sys
+import argparse
+import atexit
+import base64
+import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import tkinter.font as tkFont
 import threading
-import time
-from functools import wraps
+from functools import wraps, lru_cache, partial
+from contextlib import contextmanager
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit, quote
+import hashlib
+import heapq
+import math
+import socket
+import zlib
+import statistics
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-class ModernButton(tk.Frame):
-    """Bouton moderne avec effet de survol"""
-    def __init__(self, parent, text="", command=None, style="primary", icon="", width=None, **kwargs):
-        super().__init__(parent, **kwargs)
-        
-        # Couleurs selon le style
-        colors = {
-            "primary": {"bg": "#007AFF", "hover": "#0051D5", "fg": "white"},
-            "success": {"bg": "#34C759", "hover": "#248A3D", "fg": "white"},
-            "danger": {"bg": "#FF3B30", "hover": "#C70F0F", "fg": "white"},
-            "secondary": {"bg": "#5E5CE6", "hover": "#4B4BC8", "fg": "white"},
-            "dark": {"bg": "#1C1C1E", "hover": "#2C2C2E", "fg": "white"},
-            "warning": {"bg": "#FF9500", "hover": "#E07F00", "fg": "white"},
+log = logging.getLogger("news_admin")
+
+# Modules lourds (requests, zeep, asyncio, http.client...) importés au premier
+# usage ; durées conservées pour le rapport de démarrage
+LAZY_IMPORT_TIMES = {}
+
+
+def lazy_import(name):
+    """Importe un module à la demande et note la durée du premier import"""
+    # import_module attend la fin d'un import en cours dans un autre thread
+    loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not loaded:
+        LAZY_IMPORT_TIMES[name] = (time.perf_counter() - start) * 1000
+    return module
+
+
+@lru_cache(maxsize=None)
+def optional_import(name):
+    """lazy_import pour une dépendance facultative (httpx, pyarrow) ; None si absente"""
+    try:
+        return lazy_import(name)
+    except ImportError:
+        return None
+
+
+def timed_get(url, headers=None, timeout=30):
+    """Effectue un GET HTTP en mesurant chaque phase (DNS, connexion, TTFB, téléchargement)
+
+    Retourne (status, texte, métriques) où les durées sont en millisecondes.
+    """
+    parts = urlsplit(url)
+    secure = parts.scheme == "https"
+    host = parts.hostname
+    port = parts.port or (443 if secure else 80)
+    # http.client envoie le chemin tel quel : espaces et accents doivent être
+    # encodés (les séquences %XX déjà présentes sont conservées)
+    path = quote(parts.path or "/", safe="/%:@!$&'()*+,;=~")
+    if parts.query:
+        path += "?" + quote(parts.query, safe="/%:@!$&'()*+,;=~?")
+
+    request_headers = {"Accept-Encoding": "gzip, deflate"}
+    request_headers.update(headers or {})
+
+    metrics = {}
+    start = time.perf_counter()
+
+    # Résolution DNS
+    address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4]
+    t_dns = time.perf_counter()
+    metrics["dns"] = (t_dns - start) * 1000
+
+    # Connexion TCP (+ TLS)
+    ssl = lazy_import("ssl")
+    http_client = lazy_import("http.client")
+    sock = socket.create_connection(address[:2], timeout=timeout)
+    if secure:
+        sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+    conn = (http_client.HTTPSConnection if secure else http_client.HTTPConnection)(
+        host, port, timeout=timeout)
+    conn.sock = sock
+    t_connect = time.perf_counter()
+    metrics["connect"] = (t_connect - t_dns) * 1000
+
+    try:
+        # Envoi de la requête et attente du premier octet
+        conn.request("GET", path, headers=request_headers)
+        response = conn.getresponse()
+        t_first_byte = time.perf_counter()
+        metrics["ttfb"] = (t_first_byte - t_connect) * 1000
+
+        # Téléchargement du corps
+        raw = response.read()
+        t_download = time.perf_counter()
+        metrics["download"] = (t_download - t_first_byte) * 1000
+    finally:
+        conn.close()
+
+    # Décompression éventuelle
+    encoding = (response.getheader("Content-Encoding") or "").lower()
+    if encoding == "gzip":
+        body = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        body = zlib.decompress(raw)
+    else:
+        body = raw
+
+    metrics["status"] = response.status
+    metrics["wire_bytes"] = len(raw)
+    metrics["bytes"] = len(body)
+    metrics["compression"] = len(raw) / len(body) if body else 1.0
+
+    charset = response.msg.get_content_charset() or "utf-8"
+    return response.status, body.decode(charset, errors="replace"), metrics
+
+
+class RequestTracer:
+    """Traces des appels REST et SOAP : journal JSON et compteurs Prometheus
+
+    Chaque appel donne un événement (protocole, méthode, point d'accès,
+    statut, octets, durée, tentatives, bascule SOAP -> REST) écrit sur le
+    logger news_admin.trace au niveau DEBUG et agrégé pour render_prometheus.
+    Les identifiants numériques des chemins sont remplacés par {id}. Le
+    fichier de métriques est réécrit par un thread dédié (start_flushing),
+    jamais sur le chemin des requêtes.
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, metrics_path=None, flush_interval=15):
+        self.logger = logging.getLogger("news_admin.trace")
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.recent = deque(maxlen=500)
+        self.requests = {}     # (protocole, méthode, point d'accès, statut) -> nombre
+        self.durations = {}    # (protocole, méthode, point d'accès) -> [compteurs par borne, somme, nombre]
+        self.bytes = {}        # (protocole, méthode, point d'accès) -> octets reçus
+        self.retries = {}      # (protocole, méthode, point d'accès) -> tentatives supplémentaires
+        self.fallbacks = {}    # point d'accès REST -> bascules SOAP -> REST
+        self.metrics_path = metrics_path
+        self.flush_interval = flush_interval
+        self.flush_lock = threading.Lock()
+        self.flush_stop = None
+
+    @staticmethod
+    def endpoint(path):
+        """Chemin sans requête ni identifiants, pour borner le nombre de séries"""
+        segments = urlsplit(path).path.split("/")
+        return "/".join("{id}" if segment.isdigit() else segment for segment in segments)
+
+    @contextmanager
+    def span(self, protocol, method, path, fallback=False):
+        """Chronomètre un appel ; le bloc renseigne status, bytes et retries"""
+        span = {"status": None, "bytes": 0, "retries": 0, "error": None}
+        start = time.perf_counter()
+        try:
+            yield span
+        except Exception as e:
+            span["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(protocol, method, path, span["status"], time.perf_counter() - start,
+                        span["bytes"], span["retries"], fallback, span["error"])
+
+    def record(self, protocol, method, path, status, duration, size=0, retries=0,
+               fallback=False, error=None):
+        endpoint = self.endpoint(path) if protocol == "rest" else path
+        event = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "protocol": protocol,
+            "method": method,
+            "endpoint": endpoint,
+            "status": status if status is not None else "error",
+            "bytes": size,
+            "duration_ms": round(duration * 1000, 2),
+            "retries": retries,
+            "fallback": fallback,
         }
+        if error:
+            event["error"] = error
+
+        series = (protocol, method, endpoint)
+        with self.lock:
+            self.recent.append(event)
+            key = series + (str(event["status"]),)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            histogram = self.durations.setdefault(series, [[0] * len(self.BUCKETS), 0.0, 0])
+            for index, bound in enumerate(self.BUCKETS):
+                if duration <= bound:
+                    histogram[0][index] += 1
+            histogram[1] += duration
+            histogram[2] += 1
+            self.bytes[series] = self.bytes.get(series, 0) + size
+            if retries:
+                self.retries[series] = self.retries.get(series, 0) + retries
+            if fallback:
+                self.fallbacks[endpoint] = self.fallbacks.get(endpoint, 0) + 1
+
+        level = logging.WARNING if error or (isinstance(status, int) and status >= 500) else logging.DEBUG
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, json.dumps(event, ensure_ascii=False))
+
+    def http_hook(self, response, *args, **kwargs):
+        """Hook requests du transport SOAP : mémorise statut et taille de la réponse"""
+        self.local.last_response = (response.status_code, len(response.content))
+
+    def last_response(self):
+        """Statut et taille de la dernière réponse HTTP SOAP de ce thread"""
+        response, self.local.last_response = getattr(self.local, "last_response", None), None
+        return response or (None, 0)
+
+    @staticmethod
+    def escape(value):
+        """Échappement d'une valeur d'étiquette Prometheus"""
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def render_prometheus(self):
+        """Métriques au format texte Prometheus / OpenMetrics"""
+        def labels(protocol, method, endpoint, **extra):
+            pairs = {"protocol": protocol, "method": method, "endpoint": endpoint, **extra}
+            return "{" + ",".join(f'{key}="{self.escape(value)}"' for key, value in pairs.items()) + "}"
+
+        lines = []
+        with self.lock:
+            lines += ["# HELP news_admin_requests_total Appels REST et SOAP par point d'accès et statut",
+                      "# TYPE news_admin_requests_total counter"]
+            for (protocol, method, endpoint, status), count in sorted(self.requests.items()):
+                lines.append(f"news_admin_requests_total{labels(protocol, method, endpoint, status=status)} {count}")
+
+            lines += ["# HELP news_admin_request_duration_seconds Durée des appels",
+                      "# TYPE news_admin_request_duration_seconds histogram"]
+            for series, (buckets, total, count) in sorted(self.durations.items()):
+                for bound, value in zip(self.BUCKETS, buckets):
+                    lines.append(f"news_admin_request_duration_seconds_bucket{labels(*series, le=bound)} {value}")
+                lines.append(f"news_admin_request_duration_seconds_bucket{labels(*series, le='+Inf')} {count}")
+                lines.append(f"news_admin_request_duration_seconds_sum{labels(*series)} {total:.6f}")
+                lines.append(f"news_admin_request_duration_seconds_count{labels(*series)} {count}")
+
+            lines += ["# HELP news_admin_response_bytes_total Octets reçus",
+                      "# TYPE news_admin_response_bytes_total counter"]
+            for series, size in sorted(self.bytes.items()):
+                lines.append(f"news_admin_response_bytes_total{labels(*series)} {size}")
+
+            lines += ["# HELP news_admin_retries_total Tentatives supplémentaires",
+                      "# TYPE news_admin_retries_total counter"]
+            for series, count in sorted(self.retries.items()):
+                lines.append(f"news_admin_retries_total{labels(*series)} {count}")
+
+            lines += ["# HELP news_admin_soap_fallbacks_total Appels REST effectués en secours de SOAP",
+                      "# TYPE news_admin_soap_fallbacks_total counter"]
+            for endpoint, count in sorted(self.fallbacks.items()):
+                lines.append(f'news_admin_soap_fallbacks_total{{endpoint="{self.escape(endpoint)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_metrics(self, path=None):
+        """Écrit les métriques dans un fichier (remplacement atomique) ; False en cas d'échec"""
+        path = path or self.metrics_path
+        if not path:
+            return False
+        with self.flush_lock:
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(self.render_prometheus())
+                os.replace(tmp, path)
+            except OSError as e:
+                log.warning("Métriques non écrites dans %s: %s", path, e)
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                return False
+        return True
+
+    def start_flushing(self):
+        """Réécrit metrics_path toutes les flush_interval secondes (thread démon)"""
+        if self.flush_stop is not None or not self.metrics_path:
+            return
+        self.flush_stop = threading.Event()
+
+        def loop(stop):
+            while not stop.wait(self.flush_interval):
+                self.write_metrics()
+
+        threading.Thread(target=loop, args=(self.flush_stop,), daemon=True,
+                         name="metrics-flush").start()
+
+    def stop_flushing(self):
+        """Arrête le thread d'écriture et écrit une dernière fois les métriques"""
+        if self.flush_stop is not None:
+            self.flush_stop.set()
+            self.flush_stop = None
+        self.write_metrics()
+
+    def serve_metrics(self, port, host="127.0.0.1"):
+        """Expose GET /metrics sur un serveur HTTP local (thread démon)"""
+        http_server = lazy_import("http.server")
+        tracer = self
+
+        class MetricsHandler(http_server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = tracer.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = http_server.ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+@lru_cache(maxsize=8192)
+def _format_iso_date(value, fmt):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime(fmt)
+    except ValueError:
+        return value
+
+
+def format_iso_date(value, fmt="%d/%m/%Y %H:%M"):
+    """Formate une date ISO 8601 pour l'affichage (mémoïsé par chaîne brute)"""
+    if not value or not isinstance(value, str):
+        return value
+    return _format_iso_date(value, fmt)
+
+
+class JwtManager:
+    """Cycle de vie du JWT d'un NewsApiClient
+
+    L'expiration vient du claim exp du jeton (signature non vérifiée). Le
+    serveur n'a pas de point de rafraîchissement : renouveler revient à se
+    reconnecter avec les identifiants gardés en mémoire, avant l'expiration
+    (marge refresh_margin) ou une fois après un 401. Avec persist, le jeton
+    est conservé dans le trousseau du système (module keyring, facultatif)
+    pour reprendre la session au prochain lancement.
+    """
+    KEYRING_SERVICE = "news-platform-admin"
+    SESSION_FILE = os.path.join(os.path.expanduser("~"), ".config", "news-admin", "session.json")
+
+    def __init__(self, api, refresh_margin=120):
+        self.api = api
+        self.refresh_margin = refresh_margin
+        self.credentials = None
+        self.persist = False
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def claims(token):
+        """Charge utile du JWT ({} si illisible)"""
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        except (AttributeError, IndexError, ValueError):
+            return {}
+        return claims if isinstance(claims, dict) else {}
+
+    def seconds_left(self, token=None):
+        """Secondes avant l'expiration, None si le jeton n'en indique pas"""
+        exp = self.claims(token or self.api.jwt_token).get("exp")
+        return exp - time.time() if isinstance(exp, (int, float)) else None
+
+    def needs_refresh(self):
+        left = self.seconds_left()
+        return left is not None and left < self.refresh_margin
+
+    def can_refresh(self):
+        return self.credentials is not None
+
+    def remember(self, username, password):
+        """Garde les identifiants en mémoire (jamais sur disque) pour les renouvellements"""
+        self.credentials = (username, password)
+
+    def ensure_fresh(self):
+        """Renouvelle le jeton s'il expire bientôt et que c'est possible"""
+        if self.needs_refresh() and self.can_refresh():
+            self.refresh()
+
+    def refresh(self, rejected_token=None):
+        """Reconnexion ; True si un jeton utilisable est disponible
+
+        rejected_token est le jeton refusé par un 401 : s'il a déjà été
+        remplacé par un autre thread, aucune nouvelle connexion n'est faite.
+        Si le serveur refuse les identifiants (mot de passe changé, compte
+        désactivé), ils sont oubliés : plus aucune reconnexion n'est tentée.
+        """
+        with self.lock:
+            if rejected_token is not None and self.api.jwt_token != rejected_token:
+                return True
+            if rejected_token is None and not self.needs_refresh():
+                return True
+            if self.credentials is None:
+                return False
+            if self.api.login(*self.credentials) is None:
+                log.warning("Reconnexion refusée : le JWT ne sera plus renouvelé")
+                self.credentials = None
+                return False
+            return True
+
+    def save(self):
+        """Conserve le jeton (trousseau) et l'utilisateur associé (SESSION_FILE)"""
+        keyring = optional_import("keyring")
+        if keyring is None or not self.api.jwt_token:
+            return False
+        try:
+            keyring.set_password(self.KEYRING_SERVICE, self.api.base_url, self.api.jwt_token)
+            os.makedirs(os.path.dirname(self.SESSION_FILE), exist_ok=True)
+            with open(self.SESSION_FILE, "w", encoding="utf-8") as f:
+                json.dump({"base_url": self.api.base_url, "user": self.api.user}, f)
+        except Exception as e:
+            log.warning("Session non conservée: %s", e)
+            return False
+        return True
+
+    def restore(self):
+        """Reprend la session conservée si son jeton est encore valide ; retourne l'utilisateur"""
+        if not os.path.exists(self.SESSION_FILE):
+            return None
+        keyring = optional_import("keyring")
+        if keyring is None:
+            return None
+        try:
+            with open(self.SESSION_FILE, encoding="utf-8") as f:
+                session = json.load(f)
+            token = None
+            if session.get("base_url") == self.api.base_url:
+                token = keyring.get_password(self.KEYRING_SERVICE, self.api.base_url)
+        except Exception as e:
+            log.warning("Session conservée illisible: %s", e)
+            return None
+
+        left = self.seconds_left(token) if token else None
+        if left is None or left < self.refresh_margin or not session.get("user"):
+            self.forget()
+            return None
+        self.api.jwt_token = token
+        self.api.user = session["user"]
+        self.persist = True
+        return self.api.user
+
+    def forget(self):
+        """Oublie identifiants et session conservée"""
+        self.credentials = None
+        self.persist = False
+        if not os.path.exists(self.SESSION_FILE):
+            return
+        try:
+            os.remove(self.SESSION_FILE)
+            keyring = optional_import("keyring")
+            if keyring is not None:
+                keyring.delete_password(self.KEYRING_SERVICE, self.api.base_url)
+        except Exception as e:
+            log.warning("Session conservée non supprimée: %s", e)
+
+
+class NewsApiClient:
+    """Client des services REST et SOAP de la plateforme, indépendant de l'interface
+    
+    Les lectures retournent les données (ou None si le serveur refuse), les
+    écritures retournent True/False ; les erreurs réseau sont propagées.
+    """
+    def __init__(self, base_url="http://localhost:8080", timeout=30, tracer=None):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.tracer = tracer or RequestTracer()
+        self.auth = JwtManager(self)
+        self._session = None
+        # Verrou propre à la session HTTP : l'initialisation SOAP (self.lock)
+        # ne doit pas bloquer les requêtes REST
+        self.session_lock = threading.Lock()
+        self.soap_client = None
+        self.soap_pending = None
+        self.lock = threading.Lock()
+        self.auth_token = None
+        self.jwt_token = None
+        self.user = None
         
-        self.colors = colors.get(style, colors["primary"])
-        self.configure(bg=self.colors["bg"])
+    # --- Transport ---------------------------------------------------------
+    
+    @property
+    def session(self):
+        # requests n'est importé qu'à la première requête
+        if self._session is None:
+            with self.session_lock:
+                if self._session is None:
+                    self._session = lazy_import("requests").Session()
+        return self._session
+        
+    def headers(self):
+        return {'Authorization': f'Bearer {self.jwt_token}'}
+        
+    def request(self, method, path, fallback=False, **kwargs):
+        """Requête REST authentifiée et tracée (fallback : secours d'un appel SOAP)
+        
+        Le JWT est renouvelé avant expiration ; après un 401, la requête est
+        rejouée une fois si la reconnexion réussit.
+        """
+        self.auth.ensure_fresh()
+        extra_headers = kwargs.pop('headers', {})
+        with self.tracer.span("rest", method, path, fallback) as span:
+            for attempt in range(2):
+                token = self.jwt_token
+                headers = self.headers()
+                headers.update(extra_headers)
+                response = self.session.request(method, f"{self.base_url}{path}", headers=headers,
+                                                timeout=self.timeout, **kwargs)
+                if response.status_code != 401 or attempt or not self.auth.refresh(token):
+                    break
+                span["retries"] += 1
+            span["status"] = response.status_code
+            span["bytes"] = len(response.content)
+        return response
+        
+    def get_json(self, path, **kwargs):
+        response = self.request('GET', path, **kwargs)
+        return response.json() if response.status_code == 200 else None
+        
+    def iter_pages(self, path, page_size=500):
+        """Parcourt une collection page par page (paramètres page/size)
+        
+        Produit des tuples (enregistrements, total). Accepte une Page Spring
+        ({content, last, totalElements}) ou une simple liste ; si le serveur
+        ignore la pagination, la collection arrive en une seule page.
+        """
+        page = 0
+        previous_first = None
+        while True:
+            response = self.request('GET', path, params={'page': page, 'size': page_size})
+            if response.status_code != 200:
+                raise RuntimeError(f"{path}: HTTP {response.status_code}")
+                
+            data = response.json()
+            if isinstance(data, dict):
+                records = data.get('content', [])
+                total = data.get('totalElements')
+                last = data.get('last', len(records) < page_size)
+            else:
+                records = data
+                total = None
+                # Page identique à la précédente : paramètres ignorés par le serveur
+                if records and records[0] == previous_first:
+                    return
+                previous_first = records[0] if records else None
+                last = len(records) != page_size
+                
+            if records:
+                yield records, total
+            if last or not records:
+                return
+            page += 1
+        
+    # --- Authentification --------------------------------------------------
+    
+    def login(self, username, password):
+        """Authentification REST ; retourne l'utilisateur connecté ou None"""
+        with self.tracer.span("rest", "POST", "/api/auth/login") as span:
+            response = self.session.post(f"{self.base_url}/api/auth/login",
+                                         json={"username": username, "password": password},
+                                         timeout=self.timeout)
+            span["status"] = response.status_code
+            span["bytes"] = len(response.content)
+        if response.status_code != 200:
+            return None
+            
+        data = response.json()
+        self.jwt_token = data['token']
+        self.user = {
+            'username': data['username'],
+            'role': data['role'],
+            'id': data['userId']
+        }
+        # Le client SOAP sera créé au premier appel qui en a besoin (voir soap)
+        self.soap_client = None
+        self.soap_pending = (username, password)
+        self.auth.remember(username, password)
+        if self.auth.persist:
+            self.auth.save()
+        return self.user
+        
+    def connect_soap(self, username, password):
+        """Initialise le client SOAP avec le JWT et teste l'authentification"""
+        zeep = lazy_import("zeep")
+        transport = lazy_import("zeep.transports").Transport()
+        transport.session.headers['Authorization'] = f'Bearer {self.jwt_token}'
+        transport.session.hooks['response'].append(self.tracer.http_hook)
+        with self.tracer.span("soap", "GET", "/soap/users?wsdl") as span:
+            self.soap_client = zeep.Client(f'{self.base_url}/soap/users?wsdl', transport=transport)
+            span["status"], span["bytes"] = self.tracer.last_response()
+        return self.soap_call(self.soap_client, "authenticate", username, password)
+        
+    def soap_call(self, soap_client, operation, *args):
+        """Appel d'une opération SOAP, tracé comme /soap/users/<opération>"""
+        with self.tracer.span("soap", "POST", f"/soap/users/{operation}") as span:
+            try:
+                return getattr(soap_client.service, operation)(*args)
+            finally:
+                span["status"], span["bytes"] = self.tracer.last_response()
+        
+    def soap(self):
+        """Client SOAP, initialisé (et zeep importé) lors du premier besoin
+        
+        Une seule tentative par connexion ; retourne None en cas d'échec.
+        """
+        with self.lock:
+            if self.soap_client is None and self.soap_pending is not None:
+                credentials, self.soap_pending = self.soap_pending, None
+                try:
+                    self.connect_soap(*credentials)
+                except Exception as e:
+                    log.warning("Erreur SOAP: %s", e)
+                    self.soap_client = None
+            return self.soap_client
         
-        # Frame interne pour le padding
-        self.inner_frame = tk.Frame(self, bg=self.colors["bg"])
-        self.inner_frame.pack(fill="both", expand=True, padx=1, pady=1)
+    def logout(self):
+        self.auth.forget()
+        self.jwt_token = None
+        self.auth_token = None
+        self.soap_client = None
+        self.soap_pending = None
+        self.user = None
         
-        # Contenu (icône + texte)
-        content_frame = tk.Frame(self.inner_frame, bg=self.colors["bg"])
-        content_frame.pack(expand=True, padx=15, pady=8)
+    # --- Utilisateurs (SOAP puis REST) -------------------------------------
+    
+    def list_users(self):
+        users = []
+        soap_client = self.soap()
+        if soap_client:
+            try:
+                soap_users = self.soap_call(soap_client, "listUsers", self.auth_token)
+                if soap_users:
+                    users = soap_users
+            except Exception as e:
+                log.warning("Erreur SOAP, basculement vers REST: %s", e)
+                
+        if not users:
+            users = self.get_json("/api/users", fallback=True) or []
+        return users
+        
+    def get_user(self, user_id):
+        return self.get_json(f"/api/users/{user_id}")
+        
+    def save_user(self, user_obj, user_id=None):
+        """Crée (user_id None) ou modifie un utilisateur"""
+        success = False
+        soap_client = self.soap()
+        if soap_client:
+            try:
+                if user_id is not None:
+                    success = self.soap_call(soap_client, "updateUser", self.auth_token, user_id, user_obj)
+                else:
+                    success = self.soap_call(soap_client, "addUser", self.auth_token, user_obj) is not None
+            except Exception as e:
+                log.warning("Erreur SOAP: %s", e)
+                
+        if not success:
+            if user_id is not None:
+                response = self.request('PUT', f"/api/users/{user_id}", fallback=True, json=user_obj)
+            else:
+                response = self.request('POST', "/api/users", fallback=True, json=user_obj)
+            success = response.status_code in [200, 201]
+        return success
+        
+    def delete_user(self, user_id):
+        success = False
+        soap_client = self.soap()
+        if soap_client:
+            try:
+                success = self.soap_call(soap_client, "deleteUser", self.auth_token, user_id)
+            except Exception as e:
+                log.warning("Erreur SOAP: %s", e)
+                
+        if not success:
+            success = self.request('DELETE', f"/api/users/{user_id}", fallback=True).status_code == 204
+        return success
         
-        if icon:
-            icon_label = tk.Label(content_frame, text=icon, bg=self.colors["bg"], 
-                                 fg=self.colors["fg"], font=("Segoe UI", 12))
-            icon_label.pack(side="left", padx=(0, 5))
+    # --- Articles ----------------------------------------------------------
+    
+    def list_articles(self):
+        return self.get_json("/api/articles")
         
-        self.label = tk.Label(content_frame, text=text, bg=self.colors["bg"], 
-                             fg=self.colors["fg"], font=("Segoe UI", 10, "bold"))
-        self.label.pack(side="left")
+    def get_article(self, article_id):
+        return self.get_json(f"/api/articles/{article_id}")
         
-        # Bindings
-        self.bind("<Enter>", self.on_enter)
-        self.bind("<Leave>", self.on_leave)
-        self.bind("<Button-1>", lambda e: command() if command else None)
+    def save_article(self, article_obj, article_id=None):
+        if article_id is not None:
+            response = self.request('PUT', f"/api/articles/{article_id}", json=article_obj)
+        else:
+            response = self.request('POST', "/api/articles", json=article_obj)
+        return response.status_code in [200, 201]
         
-        for widget in [self.inner_frame, content_frame] + content_frame.winfo_children():
-            widget.bind("<Enter>", self.on_enter)
-            widget.bind("<Leave>", self.on_leave)
-            widget.bind("<Button-1>", lambda e: command() if command else None)
+    def update_article_status(self, article_id, status):
+        response = self.request('PATCH', f"/api/articles/{article_id}/status", json={'status': status})
+        return response.status_code == 200
         
-        # Curseur
-        self.configure(cursor="hand2")
-        for widget in [self.inner_frame, content_frame] + content_frame.winfo_children():
-            widget.configure(cursor="hand2")
+    def delete_article(self, article_id):
+        return self.request('DELETE', f"/api/articles/{article_id}").status_code == 204
         
+    # --- Catégories --------------------------------------------------------
+    
+    def list_categories(self):
+        return self.get_json("/api/categories")
+        
+    def get_category(self, category_id):
+        return self.get_json(f"/api/categories/{category_id}")
+        
+    def save_category(self, category_obj, category_id=None):
+        if category_id is not None:
+            response = self.request('PUT', f"/api/categories/{category_id}", json=category_obj)
+        else:
+            response = self.request('POST', "/api/categories", json=category_obj)
+        return response.status_code in [200, 201]
+        
+    def delete_category(self, category_id):
+        return self.request('DELETE', f"/api/categories/{category_id}").status_code == 204
+        
+    # --- Jetons ------------------------------------------------------------
+    
+    def list_tokens(self):
+        return self.get_json("/api/tokens")
+        
+    def get_token(self, token_id):
+        return self.get_json(f"/api/tokens/{token_id}")
+        
+    def create_token(self, description, validity_days):
+        response = self.request('POST', "/api/tokens",
+                                json={'description': description, 'validityDays': validity_days})
+        return response.json() if response.status_code == 201 else None
+        
+    def revoke_token(self, token_id):
+        return self.request('DELETE', f"/api/tokens/{token_id}").status_code in [200, 204]
+        
+    # --- Services REST publics ---------------------------------------------
+    
+    def fetch_rest(self, path, format_type):
+        """GET instrumenté (voir timed_get) d'un service /api/rest en JSON ou XML"""
+        headers = {'Accept': f'application/{format_type.lower()}'}
+        status, content, metrics = timed_get(f"{self.base_url}{path}", headers=headers,
+                                             timeout=self.timeout)
+        metrics["endpoint"] = path
+        metrics["format"] = format_type
+        duration = sum(metrics[phase] for phase in ("dns", "connect", "ttfb", "download")) / 1000
+        self.tracer.record("rest", "GET", path, status, duration, metrics["wire_bytes"])
+        return status, content, metrics
+
+
+class AsyncNewsApiClient:
+    """Version asyncio de NewsApiClient, limitée à max_concurrency requêtes simultanées
+    
+    Partage le JWT et l'URL du client synchrone. Avec httpx, REST et SOAP
+    (zeep AsyncClient) tournent sur le thread de la boucle ; sinon les appels
+    synchrones sont délégués à un exécuteur de même taille.
+    """
+    def __init__(self, api, max_concurrency=8):
+        self.api = api
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self.executor = None
+        self.http = None
+        self.soap_client = None
+        self.soap_token = None
+        self.soap_http = None    # (httpx.AsyncClient, httpx.Client) du transport SOAP
+        self._soap_lock = None
+        
+    @property
+    def semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = lazy_import("asyncio").Semaphore(self.max_concurrency)
+        return self._semaphore
+        
+    @property
+    def soap_lock(self):
+        if self._soap_lock is None:
+            self._soap_lock = lazy_import("asyncio").Lock()
+        return self._soap_lock
+        
+    async def call(self, func, *args, **kwargs):
+        """Exécute un appel synchrone dans l'exécuteur borné"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        loop = lazy_import("asyncio").get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        
+    # --- Transport ---------------------------------------------------------
+    
+    async def request(self, method, path, fallback=False, **kwargs):
+        """Requête REST authentifiée et tracée (au plus max_concurrency en vol)"""
+        httpx = optional_import("httpx")
+        async with self.semaphore:
+            if httpx is None:
+                return await self.call(self.api.request, method, path, fallback, **kwargs)
+                
+            if self.http is None:
+                self.http = httpx.AsyncClient(base_url=self.api.base_url, timeout=self.api.timeout)
+            auth = self.api.auth
+            if auth.needs_refresh() and auth.can_refresh():
+                await self.call(auth.refresh)
+            extra_headers = kwargs.pop('headers', {})
+            with self.api.tracer.span("rest", method, path, fallback) as span:
+                for attempt in range(2):
+                    token = self.api.jwt_token
+                    headers = self.api.headers()
+                    headers.update(extra_headers)
+                    response = await self.http.request(method, path, headers=headers, **kwargs)
+                    if (response.status_code != 401 or attempt or not auth.can_refresh()
+                            or not await self.call(auth.refresh, token)):
+                        break
+                    span["retries"] += 1
+                span["status"] = response.status_code
+                span["bytes"] = len(response.content)
+            return response
+            
+    async def soap_call(self, client, operation, *args):
+        """Appel SOAP asynchrone tracé (statut 200 si zeep ne lève pas d'erreur)"""
+        async with self.semaphore:
+            with self.api.tracer.span("soap", "POST", f"/soap/users/{operation}") as span:
+                result = await getattr(client.service, operation)(*args)
+                span["status"] = 200
+                return result
+            
+    async def get_json(self, path, **kwargs):
+        response = await self.request('GET', path, **kwargs)
+        return response.json() if response.status_code == 200 else None
+        
+    async def soap(self):
+        """Client SOAP asynchrone, recréé quand le JWT change
+        
+        Un seul chargement du WSDL à la fois ; les clients HTTP du transport
+        remplacé sont fermés.
+        """
+        async with self.soap_lock:
+            if self.soap_client is None or self.soap_token != self.api.jwt_token:
+                await self.close_soap()
+                httpx = lazy_import("httpx")
+                token = self.api.jwt_token
+                headers = self.api.headers()
+                self.soap_http = (httpx.AsyncClient(headers=headers), httpx.Client(headers=headers))
+                transport = lazy_import("zeep.transports").AsyncTransport(
+                    client=self.soap_http[0], wsdl_client=self.soap_http[1])
+                # Le chargement du WSDL est synchrone : hors de la boucle
+                self.soap_client = await self.call(lazy_import("zeep").AsyncClient,
+                                                   f'{self.api.base_url}/soap/users?wsdl',
+                                                   transport=transport)
+                self.soap_token = token
+            return self.soap_client
+            
+    async def close_soap(self):
+        """Ferme les clients HTTP du transport SOAP courant"""
+        self.soap_client = None
+        self.soap_token = None
+        if self.soap_http is not None:
+            async_client, sync_client = self.soap_http
+            self.soap_http = None
+            await async_client.aclose()
+            sync_client.close()
+        
+    async def gather(self, *aws):
+        """Attend plusieurs appels ; les erreurs sont retournées à la place des résultats"""
+        return await lazy_import("asyncio").gather(*aws, return_exceptions=True)
+        
+    async def map(self, func, items):
+        """Applique func (coroutine) à chaque élément, dans l'ordre des éléments"""
+        return await self.gather(*(func(item) for item in items))
+        
+    async def aclose(self):
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+        await self.close_soap()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            
+    # --- Utilisateurs (SOAP puis REST) -------------------------------------
+    
+    async def list_users(self):
+        if optional_import("httpx") is None:
+            async with self.semaphore:
+                return await self.call(self.api.list_users)
+                
+        users = []
+        if await self.call(self.api.soap) is not None:
+            try:
+                client = await self.soap()
+                users = await self.soap_call(client, "listUsers", self.api.auth_token) or []
+            except Exception as e:
+                log.warning("Erreur SOAP, basculement vers REST: %s", e)
+                
+        if not users:
+            users = await self.get_json("/api/users", fallback=True) or []
+        return users
+        
+    async def delete_user(self, user_id):
+        success = False
+        if optional_import("httpx") is not None and await self.call(self.api.soap) is not None:
+            try:
+                client = await self.soap()
+                success = await self.soap_call(client, "deleteUser", self.api.auth_token, user_id)
+            except Exception as e:
+                log.warning("Erreur SOAP: %s", e)
+                
+        if not success:
+            success = (await self.request('DELETE', f"/api/users/{user_id}", fallback=True)).status_code == 204
+        return success
+        
+    # --- Articles, catégories, jetons --------------------------------------
+    
+    async def list_articles(self):
+        return await self.get_json("/api/articles")
+        
+    async def get_article(self, article_id):
+        return await self.get_json(f"/api/articles/{article_id}")
+        
+    async def save_article(self, article_obj, article_id=None):
+        if article_id is not None:
+            response = await self.request('PUT', f"/api/articles/{article_id}", json=article_obj)
+        else:
+            response = await self.request('POST', "/api/articles", json=article_obj)
+        return response.status_code in [200, 201]
+        
+    async def update_article_status(self, article_id, status):
+        response = await self.request('PATCH', f"/api/articles/{article_id}/status",
+                                      json={'status': status})
+        return response.status_code == 200
+        
+    async def delete_article(self, article_id):
+        return (await self.request('DELETE', f"/api/articles/{article_id}")).status_code == 204
+        
+    async def list_categories(self):
+        return await self.get_json("/api/categories")
+        
+    async def delete_category(self, category_id):
+        return (await self.request('DELETE', f"/api/categories/{category_id}")).status_code == 204
+        
+    async def list_tokens(self):
+        return await self.get_json("/api/tokens")
+        
+    async def revoke_token(self, token_id):
+        return (await self.request('DELETE', f"/api/tokens/{token_id}")).status_code in [200, 204]
+
+
+class RecordExporter:
+    """Écrit des enregistrements au fil de l'eau en CSV, JSON Lines ou Parquet
+    
+    Les colonnes sont fixées par la première page ; pour CSV et Parquet les
+    valeurs imbriquées (listes, objets) sont écrites en JSON.
+    """
+    FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+    
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.format = fmt or self.FORMATS.get(os.path.splitext(path)[1].lower(), "jsonl")
+        if self.format == "parquet" and optional_import("pyarrow.parquet") is None:
+            raise RuntimeError("L'export Parquet nécessite le paquet pyarrow")
+        self.file = None
+        self.writer = None
+        self.columns = None
+        self.schema = None
+        self.count = 0
+        
+    def flatten(self, record):
+        row = {}
+        for column in self.columns:
+            value = record.get(column)
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False, default=str)
+            row[column] = value
+        return row
+        
+    def write(self, records):
+        """Ajoute une page d'enregistrements au fichier"""
+        if self.columns is None:
+            self.columns = list(dict.fromkeys(key for record in records for key in record))
+            
+        if self.format == "jsonl":
+            if self.file is None:
+                self.file = open(self.path, "w", encoding="utf-8")
+            for record in records:
+                self.file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                
+        elif self.format == "csv":
+            if self.writer is None:
+                self.file = open(self.path, "w", encoding="utf-8", newline="")
+                self.writer = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction="ignore")
+                self.writer.writeheader()
+            self.writer.writerows(self.flatten(record) for record in records)
+            
+        else:
+            pa = lazy_import("pyarrow")
+            rows = [self.flatten(record) for record in records]
+            if self.writer is None:
+                # Colonnes entièrement vides sur la première page : typées texte
+                table = pa.Table.from_pylist(rows)
+                self.schema = pa.schema([
+                    pa.field(field.name, pa.string() if pa.types.is_null(field.type) else field.type)
+                    for field in table.schema
+                ])
+                self.writer = lazy_import("pyarrow.parquet").ParquetWriter(self.path, self.schema)
+            self.writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+            
+        self.count += len(records)
+        
+    def close(self):
+        if self.format == "parquet" and self.writer is not None:
+            self.writer.close()
+        if self.file is not None:
+            self.file.close()
+        self.writer = None
+        self.file = None
+        
+    def abort(self):
+        """Ferme et supprime un fichier incomplet"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Collections exportables et masquage des valeurs sensibles
+EXPORT_PATHS = {
+    'users': "/api/users",
+    'articles': "/api/articles",
+    'categories': "/api/categories",
+    'tokens': "/api/tokens",
+}
+
+
+def mask_token(record):
+    """Ne conserve que le préfixe du secret d'un jeton"""
+    record = dict(record)
+    if record.get('token'):
+        record['token'] = record['token'][:8] + '...'
+    return record
+
+
+EXPORT_TRANSFORMS = {'tokens': mask_token}
+
+
+def export_collection(api, resource, destination, fmt=None, page_size=500,
+                      progress=None, cancel=None):
+    """Exporte une collection page par page sans la charger entièrement
+    
+    progress(nombre, total ou None) est appelé après chaque page ; si
+    cancel (threading.Event) est levé, le fichier partiel est supprimé et
+    la fonction retourne None. Sinon retourne le nombre d'enregistrements.
+    """
+    exporter = RecordExporter(destination, fmt)
+    transform = EXPORT_TRANSFORMS.get(resource)
+    try:
+        for records, total in api.iter_pages(EXPORT_PATHS[resource], page_size):
+            if cancel is not None and cancel.is_set():
+                exporter.abort()
+                return None
+            if transform:
+                records = [transform(record) for record in records]
+            exporter.write(records)
+            if progress:
+                progress(exporter.count, total)
+    except BaseException:
+        exporter.abort()
+        raise
+        
+    exporter.close()
+    return exporter.count
+
+
+class BulkImporter:
+    """Import en masse d'articles ou d'utilisateurs depuis un fichier CSV ou JSON Lines
+    
+    Le fichier est lu en flux et chaque ligne validée avant envoi ; les
+    créations passent par un pool de workers borné. Les numéros des lignes
+    importées sont ajoutés à <fichier>.checkpoint, qu'une relance saute, et
+    les lignes rejetées sont décrites dans <fichier>.errors.jsonl.
+    """
+    ARTICLE_STATUSES = ('draft', 'published', 'archived')
+    USER_ROLES = ('VISITOR', 'EDITOR', 'ADMIN')
+    
+    def __init__(self, api, resource, path, workers=8, defaults=None,
+                 progress=None, cancel=None):
+        if resource not in ('articles', 'users'):
+            raise ValueError(f"Import non supporté pour {resource}")
+        self.api = api
+        self.resource = resource
+        self.path = path
+        self.workers = max(1, workers)
+        self.defaults = defaults or {}
+        self.progress = progress
+        self.cancel = cancel
+        self.checkpoint_path = path + ".checkpoint"
+        self.errors_path = path + ".errors.jsonl"
+        self.categories = None
+        self.stats = {"imported": 0, "skipped": 0, "failed": 0}
+        
+    # --- Lecture et validation ---------------------------------------------
+    
+    def rows(self, on_error=None):
+        """Produit (numéro de ligne, dictionnaire) sans charger tout le fichier
+        
+        Une ligne JSON illisible ou qui n'est pas un objet est passée à
+        on_error(numéro, {"raw": ligne}, message) puis ignorée ; sans on_error,
+        elle lève ValueError.
+        """
+        with open(self.path, encoding="utf-8-sig", newline="") as stream:
+            if self.path.lower().endswith(".csv"):
+                for number, row in enumerate(csv.DictReader(stream), start=1):
+                    yield number, {key: value for key, value in row.items() if value not in (None, "")}
+            else:
+                for number, line in enumerate(stream, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                        if not isinstance(row, dict):
+                            raise ValueError(f"objet JSON attendu, {type(row).__name__} trouvé")
+                    except ValueError as e:
+                        if on_error is None:
+                            raise ValueError(f"ligne {number}: {e}") from e
+                        on_error(number, {"raw": line.rstrip("\r\n")}, f"JSON invalide: {e}")
+                        continue
+                    yield number, row
+                        
+    def category_lookup(self):
+        """Catégories indexées par nom (insensible à la casse), chargées une seule fois"""
+        if self.categories is None:
+            self.categories = {c['name'].casefold(): c for c in self.api.list_categories() or []}
+        return self.categories
+        
+    @staticmethod
+    def parse_bool(value):
+        if isinstance(value, bool):
+            return value
+        return str(value).strip().lower() in ("1", "true", "yes", "oui", "y")
+        
+    @staticmethod
+    def text(row, field, default=''):
+        """Champ texte d'une ligne ; lève ValueError si ce n'est pas une chaîne (JSON Lines)"""
+        value = row.get(field)
+        if value is None:
+            return default
+        if not isinstance(value, str):
+            raise ValueError(f"{field}: texte attendu, {type(value).__name__} trouvé")
+        return value
+        
+    def validate(self, row):
+        """Construit l'objet à créer ; lève ValueError si la ligne est invalide"""
+        row = {**self.defaults, **row}
+        text = self.text
+        
+        if self.resource == 'articles':
+            if not text(row, 'title'):
+                raise ValueError("titre manquant")
+            status = text(row, 'status', 'draft').lower()
+            if status not in self.ARTICLE_STATUSES:
+                raise ValueError(f"statut inconnu: {status}")
+                
+            article_obj = {
+                'title': row['title'],
+                'summary': text(row, 'summary'),
+                'content': text(row, 'content'),
+                'status': status,
+                'authorId': row.get('authorId') or (self.api.user or {}).get('id')
+            }
+            category_name = text(row, 'categoryName') or text(row, 'category')
+            if category_name:
+                category = self.category_lookup().get(category_name.casefold())
+                if category is None:
+                    raise ValueError(f"catégorie inconnue: {category_name}")
+                article_obj['categoryName'] = category['name']
+                article_obj['categoryId'] = category['id']
+            return article_obj
+            
+        for field in ('username', 'email', 'password'):
+            if not text(row, field):
+                raise ValueError(f"champ obligatoire manquant: {field}")
+        if '@' not in row['email']:
+            raise ValueError(f"email invalide: {row['email']}")
+        role = text(row, 'role', 'VISITOR').upper()
+        if role not in self.USER_ROLES:
+            raise ValueError(f"rôle inconnu: {role}")
+            
+        return {
+            'username': row['username'],
+            'email': row['email'],
+            'password': row['password'],
+            'firstName': text(row, 'firstName'),
+            'lastName': text(row, 'lastName'),
+            'role': role,
+            'active': self.parse_bool(row.get('active', True))
+        }
+        
+    def create(self, obj):
+        if self.resource == 'articles':
+            return self.api.save_article(obj)
+        return self.api.save_user(obj)
+        
+    # --- Exécution ---------------------------------------------------------
+    
+    def load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, encoding="utf-8") as stream:
+            return {int(line) for line in stream if line.strip()}
+            
+    def run(self):
+        """Importe le fichier ; retourne les compteurs imported/skipped/failed"""
+        done = self.load_checkpoint()
+        pending = {}
+        
+        with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+                open(self.errors_path, "w", encoding="utf-8") as errors, \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    
+            def report(number, row, error):
+                row = {key: value for key, value in row.items() if key != 'password'}
+                errors.write(json.dumps({"line": number, "error": error, "row": row},
+                                        ensure_ascii=False, default=str) + "\n")
+                self.stats["failed"] += 1
+                
+            def collect(futures):
+                for future in futures:
+                    number, row = pending.pop(future)
+                    try:
+                        if future.result():
+                            checkpoint.write(f"{number}\n")
+                            self.stats["imported"] += 1
+                        else:
+                            report(number, row, "refusé par le serveur")
+                    except Exception as e:
+                        report(number, row, str(e))
+                checkpoint.flush()
+                if self.progress:
+                    self.progress(dict(self.stats))
+                    
+            # Les créations déjà envoyées sont toujours reportées dans le
+            # checkpoint, même si la lecture échoue en cours de route
+            try:
+                for number, row in self.rows(on_error=report):
+                    if self.cancel is not None and self.cancel.is_set():
+                        break
+                    if number in done:
+                        self.stats["skipped"] += 1
+                        continue
+                    try:
+                        obj = self.validate(row)
+                    except (ValueError, TypeError) as e:
+                        report(number, row, str(e))
+                        continue
+                        
+                    # Au plus deux lots de requêtes en attente : lecture au rythme du serveur
+                    if len(pending) >= self.workers * 2:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(finished)
+                    pending[executor.submit(self.create, obj)] = (number, row)
+            finally:
+                collect(wait(pending)[0])
+            
+        # Pas d'erreur : rapport vide inutile
+        if not self.stats["failed"]:
+            os.remove(self.errors_path)
+        return self.stats
+
+
+class Theme:
+    """Registre des couleurs et polices partagées de l'interface
+    
+    Les polices sont des tkFont.Font nommées, créées une fois par combinaison
+    (taille, graisse, style) : les widgets reçoivent une référence au lieu
+    d'un tuple que Tk doit résoudre à chaque création.
+    """
+    FAMILY = "Segoe UI"
+    MONO = "Consolas"
+    
+    # Couleurs
+    BG = "#000000"
+    HEADER = "#0A0A0A"
+    SURFACE = "#1C1C1E"
+    FIELD = "#2C2C2E"
+    BORDER = "#3A3A3C"
+    TEXT = "#FFFFFF"
+    MUTED = "#8E8E93"
+    FAINT = "#5E5E60"
+    ACCENT = "#007AFF"
+    SUCCESS = "#34C759"
+    WARNING = "#FF9500"
+    DANGER = "#FF3B30"
+    
+    _fonts = {}
+    
+    @classmethod
+    def font(cls, size, weight="normal", slant="roman", family=None):
+        key = (family or cls.FAMILY, size, weight, slant)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = cls._fonts[key] = tkFont.Font(family=key[0], size=size, weight=weight, slant=slant)
+        return font
+        
+    @classmethod
+    def mono(cls, size, slant="roman"):
+        return cls.font(size, slant=slant, family=cls.MONO)
+
+
+class ModernButton(tk.Label):
+    """Bouton moderne avec effet de survol, rendu par un seul widget"""
+    # Registre de styles partagé par toutes les instances
+    STYLES = {
+        "primary": {"bg": "#007AFF", "hover": "#0051D5", "fg": "white"},
+        "success": {"bg": "#34C759", "hover": "#248A3D", "fg": "white"},
+        "danger": {"bg": "#FF3B30", "hover": "#C70F0F", "fg": "white"},
+        "secondary": {"bg": "#5E5CE6", "hover": "#4B4BC8", "fg": "white"},
+        "dark": {"bg": "#1C1C1E", "hover": "#2C2C2E", "fg": "white"},
+        "warning": {"bg": "#FF9500", "hover": "#E07F00", "fg": "white"},
+    }
+    
+    def __init__(self, parent, text="", command=None, style="primary", icon="", width=None, **kwargs):
+        self.colors = self.STYLES.get(style, self.STYLES["primary"])
+        self.command = command
+        
+        # Contenu (icône + texte) dans le même label
+        label = f"{icon}  {text}" if icon else text
+        if width is not None:
+            kwargs["width"] = width
+            
+        super().__init__(parent, text=label, bg=self.colors["bg"], fg=self.colors["fg"],
+                         font=Theme.font(10, "bold"), padx=16, pady=9,
+                         cursor="hand2", **kwargs)
+        
+        # Bindings (un seul widget : survol en temps constant)
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
+        self.bind("<Button-1>", self.on_click)
+        
+    def on_click(self, e):
+        if self.command:
+            self.command()
+            
     def on_enter(self, e):
         self.configure(bg=self.colors["hover"])
-        self.inner_frame.configure(bg=self.colors["hover"])
-        self.inner_frame.winfo_children()[0].configure(bg=self.colors["hover"])
-        for widget in self.inner_frame.winfo_children()[0].winfo_children():
-            widget.configure(bg=self.colors["hover"])
         
     def on_leave(self, e):
         self.configure(bg=self.colors["bg"])
-        self.inner_frame.configure(bg=self.colors["bg"])
-        self.inner_frame.winfo_children()[0].configure(bg=self.colors["bg"])
-        for widget in self.inner_frame.winfo_children()[0].winfo_children():
-            widget.configure(bg=self.colors["bg"])
 
 class ModernEntry(tk.Frame):
     """Champ de saisie moderne"""
     def __init__(self, parent, placeholder="", show="", **kwargs):
-        super().__init__(parent, bg="#2C2C2E", **kwargs)
+        super().__init__(parent, bg=Theme.FIELD, highlightbackground=Theme.BORDER,
+                         highlightthickness=1, **kwargs)
         
         self.placeholder = placeholder
-        self.placeholder_color = "#8E8E93"
-        self.normal_color = "#FFFFFF"
-        
-        # Bordure
-        self.configure(highlightbackground="#3A3A3C", highlightthickness=1)
+        self.placeholder_color = Theme.MUTED
+        self.normal_color = Theme.TEXT
         
         # Entry
-        self.entry = tk.Entry(self, bg="#1C1C1E", fg=self.placeholder_color, 
-                             border=0, font=("Segoe UI", 11), show=show)
+        self.entry = tk.Entry(self, bg=Theme.SURFACE, fg=self.placeholder_color, 
+                             border=0, font=Theme.font(11), show=show)
         self.entry.pack(fill="both", expand=True, padx=10, pady=8)
         
         # Placeholder
@@ -101,8 +1379,8 @@ class ModernEntry(tk.Frame):
             self.entry.configure(fg=self.normal_color)
         
         # Style au focus
-        self.entry.bind("<FocusIn>", lambda e: self.configure(highlightbackground="#007AFF"))
-        self.entry.bind("<FocusOut>", lambda e: self.configure(highlightbackground="#3A3A3C"))
+        self.entry.bind("<FocusIn>", lambda e: self.configure(highlightbackground=Theme.ACCENT))
+        self.entry.bind("<FocusOut>", lambda e: self.configure(highlightbackground=Theme.BORDER))
         
     def on_focus_in(self, e):
         if self.entry.get() == self.placeholder:
@@ -129,42 +1407,757 @@ class ModernEntry(tk.Frame):
             self.entry.configure(fg=self.placeholder_color)
             self.entry.insert(0, self.placeholder)
 
-class NewsAdminApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("News Platform Admin")
-        self.root.geometry("1400x800")
-        self.root.configure(bg="#000000")
-        
-        # Configuration des services
-        self.base_url = "http://localhost:8080"
-        self.soap_client = None
-        self.auth_token = None
-        self.jwt_token = None
-        self.current_user = None
-        
-        # Cache pour les données
-        self.all_users = []
-        self.all_articles = []
-        self.all_categories = []
-        
-        # Polices personnalisées
-        self.title_font = tkFont.Font(family="Segoe UI", size=32, weight="bold")
-        self.subtitle_font = tkFont.Font(family="Segoe UI", size=18, weight="bold")
-        self.normal_font = tkFont.Font(family="Segoe UI", size=11)
-        
-        # Style sombre pour ttk
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
+class RequestMetrics:
+    """Stocke les mesures des requêtes REST et calcule des percentiles glissants"""
+    PHASES = ["dns", "connect", "ttfb", "download", "parse", "highlight", "total"]
+
+    def __init__(self, window=200):
+        self.samples = deque(maxlen=window)
+
+    def record(self, sample):
+        """Enregistre une mesure (dictionnaire phase -> durée en ms)"""
+        sample["total"] = sum(sample.get(phase, 0) for phase in self.PHASES[:-1])
+        self.samples.append(sample)
+        return sample
+
+    def last(self):
+        return self.samples[-1] if self.samples else None
+
+    def percentile(self, phase, q):
+        """Percentile q (0-100) d'une phase sur la fenêtre glissante"""
+        values = sorted(s[phase] for s in self.samples if phase in s)
+        if not values:
+            return None
+        index = max(0, min(len(values) - 1, math.ceil(q / 100 * len(values)) - 1))
+        return values[index]
+
+    def summary(self, quantiles=(50, 90, 99)):
+        """Retourne {phase: [p50, p90, p99]} pour l'affichage"""
+        return {phase: [self.percentile(phase, q) for q in quantiles] for phase in self.PHASES}
+
+class ArticleDetailCache:
+    """Cache LRU des détails d'articles, validé par la version de la liste
+
+    Chaque entrée garde la version de la ligne de liste au moment du
+    chargement : une empreinte des champs éditables (le DTO serveur n'a ni
+    version ni date de modification). Une ligne modifiée depuis rend
+    l'entrée périmée. Les lectures retournent une copie.
+    """
+    VERSION_KEYS = ('title', 'summary', 'content', 'categoryId', 'categoryName',
+                    'authorName', 'status', 'published', 'publishedAt')
+
+    def __init__(self, maxsize=200):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()   # id -> (version, détail)
+        self.epoch = 0                 # incrémenté à chaque invalidation
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def version_of(cls, article):
+        """Signature de version d'un article (None si inconnu)"""
+        if not article:
+            return None
+        fields = json.dumps([article.get(key) for key in cls.VERSION_KEYS],
+                            ensure_ascii=False, default=str)
+        return hashlib.blake2b(fields.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, article_id, version):
+        """Détail en cache si sa version correspond, sinon None"""
+        entry = self.entries.get(article_id)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(article_id)
+        self.hits += 1
+        return dict(entry[1])
+
+    def put(self, article_id, version, detail):
+        self.entries[article_id] = (version, dict(detail))
+        self.entries.move_to_end(article_id)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, *article_ids):
+        self.epoch += 1
+        for article_id in article_ids:
+            self.entries.pop(article_id, None)
+
+    def clear(self):
+        self.epoch += 1
+        self.entries.clear()
+
+    def is_fresh(self, article_id, version):
+        """Vrai si l'entrée existe à cette version (sans compter d'accès)"""
+        entry = self.entries.get(article_id)
+        return entry is not None and entry[0] == version
+
+    def __len__(self):
+        return len(self.entries)
+
+class CategoryCatalog:
+    """Catalogue partagé des catégories (nom <-> id, comptes)
+
+    Chargé une fois puis rafraîchi en arrière-plan quand il a vieilli ; la
+    version n'augmente que si le contenu change, et les abonnés (listes
+    déroulantes, écran Catégories) sont alors notifiés.
+    """
+    COUNT_KEYS = ('articleCount', 'articlesCount')
+
+    def __init__(self, max_age=300):
+        self.max_age = max_age
+        self.categories = []
+        self.by_id = {}
+        self.by_name = {}
+        self.version = 0
+        self.loaded_at = None
+        self.refreshing = False
+        self.listeners = []
+
+    @property
+    def loaded(self):
+        return self.loaded_at is not None
+
+    def is_stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age
+
+    def update(self, categories):
+        """Remplace le contenu ; retourne True si la version a changé"""
+        self.loaded_at = time.monotonic()
+        if categories == self.categories:
+            return False
+        self.categories = categories
+        self.by_id = {c.get('id'): c for c in categories}
+        self.by_name = {c.get('name', ''): c for c in categories}
+        self.version += 1
+        for listener in list(self.listeners):
+            listener(self)
+        return True
+
+    def invalidate(self):
+        """Force le prochain rafraîchissement"""
+        self.loaded_at = None
+
+    def clear(self):
+        self.categories = []
+        self.by_id = {}
+        self.by_name = {}
+        self.version += 1
+        self.loaded_at = None
+
+    def names(self):
+        return [c.get('name', '') for c in self.categories]
+
+    def id_for(self, name):
+        category = self.by_name.get(name)
+        return category.get('id') if category else None
+
+    def name_for(self, category_id):
+        category = self.by_id.get(category_id)
+        return category.get('name', '') if category else None
+
+    def count(self, name):
+        """Nombre d'articles fourni par le serveur, None s'il n'y a pas d'agrégat"""
+        category = self.by_name.get(name) or {}
+        for key in self.COUNT_KEYS:
+            if category.get(key) is not None:
+                return category[key]
+        return None
+
+    def subscribe(self, listener, widget=None):
+        """Abonne listener(catalogue) ; désabonné à la destruction de widget"""
+        self.listeners.append(listener)
+        if widget is not None:
+            widget.bind('<Destroy>', lambda e: self.unsubscribe(listener) if e.widget is widget else None,
+                        add='+')
+        return listener
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def bind_combobox(self, combo, leading=()):
+        """Tient les valeurs d'une liste déroulante à jour (sélection conservée)"""
+        def fill(catalog, notify=True):
+            values = list(leading) + catalog.names()
+            combo['values'] = values
+            if combo.get() not in values and values:
+                combo.set(values[0])
+                if notify:
+                    combo.event_generate('<<ComboboxSelected>>')
+
+        fill(self, notify=False)
+        return self.subscribe(fill, combo)
+
+class TokenIndex:
+    """Index compact des jetons API pour l'écran de gestion
+
+    Seuls l'identifiant, un préfixe du secret, la description, les dates et
+    l'état sont conservés ; le secret complet n'est demandé qu'à la copie et
+    gardé secret_ttl secondes. Les révocations et créations modifient l'index
+    sur place, sans rechargement de la liste. L'expiration est calculée
+    localement depuis expiresAt (voir TokenExpirySweeper).
+    """
+    PREFIX_LENGTH = 8
+
+    def __init__(self, max_age=60, secret_ttl=60):
+        self.max_age = max_age
+        self.secret_ttl = secret_ttl
+        self.entries = {}
+        self.secrets = {}      # id -> (secret, instant de chargement)
+        self.loaded_at = None
+        self.loading = False
+
+    @classmethod
+    def compact(cls, token):
+        """Entrée d'index d'un jeton tel que renvoyé par l'API (sans le secret)"""
+        secret = token.get('token') or ''
+        return {
+            'id': token.get('id'),
+            'prefix': secret[:cls.PREFIX_LENGTH] + '…' if secret else '',
+            'description': token.get('description') or '',
+            'createdAt': format_iso_date(token.get('createdAt') or '', "%d/%m/%Y"),
+            'expiresAt': format_iso_date(token.get('expiresAt') or '', "%d/%m/%Y"),
+            # Le DTO serveur expose « active » ; « revoked » reste accepté
+            'revoked': bool(token.get('revoked')) or token.get('active') is False,
+            'expires': cls.timestamp(token.get('expiresAt')),
+            'search': f"{token.get('id')} {secret[:cls.PREFIX_LENGTH]} {token.get('description') or ''}".lower(),
+        }
+
+    @staticmethod
+    def timestamp(value):
+        """Horodatage d'une date ISO (heure locale si sans fuseau), None si absente"""
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def is_expired(entry, now=None):
+        return entry['expires'] is not None and entry['expires'] <= (now or time.time())
+
+    def is_stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age
+
+    def load(self, tokens):
+        """Remplace l'index ; les secrets de la liste ne sont pas conservés"""
+        self.entries = {}
+        for token in tokens:
+            self.add(token)
+        self.loaded_at = time.monotonic()
+
+    def add(self, token):
+        entry = self.compact(token)
+        self.entries[entry['id']] = entry
+        return entry
+
+    def get(self, token_id):
+        return self.entries.get(token_id)
+
+    def search(self, query=""):
+        """Entrées dont l'id, le préfixe ou la description contiennent query"""
+        query = query.strip().lower()
+        if not query:
+            return list(self.entries.values())
+        return [entry for entry in self.entries.values() if query in entry['search']]
+
+    def mark_revoked(self, token_id):
+        entry = self.entries.get(token_id)
+        if entry is not None:
+            entry['revoked'] = True
+        self.secrets.pop(token_id, None)
+        return entry
+
+    def secret(self, token_id):
+        """Secret complet encore en cache, sinon None"""
+        cached = self.secrets.get(token_id)
+        if cached is None:
+            return None
+        secret, loaded_at = cached
+        if time.monotonic() - loaded_at > self.secret_ttl:
+            del self.secrets[token_id]
+            return None
+        return secret
+
+    def remember_secret(self, token_id, secret):
+        self.secrets[token_id] = (secret, time.monotonic())
+
+    def clear(self):
+        self.entries = {}
+        self.secrets = {}
+        self.loaded_at = None
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class TokenExpirySweeper:
+    """Bascule les jetons au statut expiré à l'heure de leur expiresAt
+
+    Un tas (expiration, id) et un seul minuteur Tk, armé sur l'échéance la
+    plus proche : le statut reste juste sans recharger la liste.
+    """
+    MAX_DELAY_MS = 3600 * 1000  # réarmement au plus tard toutes les heures
+
+    def __init__(self, root, on_expired):
+        self.root = root
+        self.on_expired = on_expired
+        self.heap = []
+        self.job = None
+
+    def reset(self, entries):
+        """Reconstruit le tas à partir des entrées d'un TokenIndex"""
+        self.heap = [(entry['expires'], entry['id']) for entry in entries
+                     if entry['expires'] is not None and not entry['revoked']]
+        heapq.heapify(self.heap)
+        self.arm()
+
+    def push(self, entry):
+        if entry['expires'] is not None and not entry['revoked']:
+            heapq.heappush(self.heap, (entry['expires'], entry['id']))
+            self.arm()
+
+    def arm(self):
+        """(Re)programme le minuteur sur la prochaine échéance"""
+        self.cancel()
+        if self.heap:
+            delay = int((self.heap[0][0] - time.time()) * 1000) + 50
+            self.job = self.root.after(min(max(delay, 0), self.MAX_DELAY_MS), self.sweep)
+
+    def sweep(self):
+        self.job = None
+        now = time.time()
+        expired = []
+        while self.heap and self.heap[0][0] <= now:
+            expired.append(heapq.heappop(self.heap)[1])
+        if expired:
+            self.on_expired(expired)
+        self.arm()
+
+    def cancel(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def clear(self):
+        self.cancel()
+        self.heap = []
+
+
+class TreeviewSorter:
+    """Tri d'un Treeview par clic sur les en-têtes
+    
+    Les clés de tri typées sont calculées une fois par ligne et mises en cache ;
+    le tri réordonne les éléments existants au lieu de les réinsérer.
+    """
+    DATE_FORMATS = ["%d/%m/%Y %H:%M", "%d/%m/%Y"]
+    MAX_VALUE_KEYS = 10000   # dates analysées gardées en cache, vidé au-delà
+
+    def __init__(self, tree, column_types=None):
+        self.tree = tree
+        self.columns = list(tree["columns"])
+        self.column_types = column_types or {}
+        self.labels = {col: tree.heading(col, "text") for col in self.columns}
+        self.row_keys = {}     # élément -> clés typées de toutes les colonnes
+        self.value_keys = {}   # date brute -> clé typée (borné par MAX_VALUE_KEYS)
+        self.sort_column = None
+        self.descending = False
+
+        for col in self.columns:
+            tree.heading(col, command=lambda c=col: self.on_heading(c))
+
+    def on_heading(self, col):
+        """Clic sur un en-tête : tri croissant, puis inversion au clic suivant"""
+        if col == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = col
+            self.descending = False
+
+        for name, label in self.labels.items():
+            arrow = (" ▼" if self.descending else " ▲") if name == col else ""
+            self.tree.heading(name, text=label + arrow)
+
+        self.sort()
+
+    def typed_key(self, col, value):
+        """Clé de tri d'une cellule : entier, date ou chaîne insensible à la casse
+
+        Seules les dates (strptime, coûteux) passent par le cache de valeurs ;
+        les autres clés sont recalculées, leurs lignes étant déjà dans row_keys.
+        """
+        kind = self.column_types.get(col, "str")
+        text = str(value)
+        if kind == "int":
+            try:
+                return (0, int(text))
+            except ValueError:
+                return (1, text.casefold())
+        if kind != "date":
+            return (1, text.casefold())
+
+        key = self.value_keys.get(text)
+        if key is not None:
+            return key
+        key = (1, text.casefold())
+        for fmt in self.DATE_FORMATS:
+            try:
+                key = (0, datetime.strptime(text, fmt))
+                break
+            except ValueError:
+                continue
+
+        if len(self.value_keys) >= self.MAX_VALUE_KEYS:
+            self.value_keys.clear()
+        self.value_keys[text] = key
+        return key
+
+    def keys_for(self, item):
+        keys = self.row_keys.get(item)
+        if keys is None:
+            values = self.tree.item(item, "values")
+            keys = tuple(self.typed_key(col, value) for col, value in zip(self.columns, values))
+            self.row_keys[item] = keys
+        return keys
+
+    def invalidate(self, item=None):
+        """À appeler lorsque les valeurs d'une ligne sont modifiées sur place
+
+        Sans argument, oublie les clés de toutes les lignes : à faire avant de
+        repeupler un arbre qui réutilise les mêmes identifiants de ligne.
+        """
+        if item is None:
+            self.row_keys.clear()
+        else:
+            self.row_keys.pop(item, None)
+
+    def sort(self):
+        """(Re)trie les lignes courantes selon la colonne active"""
+        if self.sort_column is None:
+            return
+
+        items = self.tree.get_children("")
+        # Oublier les lignes supprimées depuis le dernier tri
+        self.row_keys = {item: self.row_keys[item] for item in items if item in self.row_keys}
+
+        index = self.columns.index(self.sort_column)
+        ordered = sorted(items, key=lambda item: self.keys_for(item)[index], reverse=self.descending)
+
+        if list(items) != ordered:
+            self.tree.set_children("", *ordered)
+
+class NotificationManager:
+    """Notifications temporaires : fenêtres réutilisées, file d'attente et regroupement"""
+    COLORS = {
+        "success": "#34C759",
+        "error": "#FF3B30",
+        "info": "#007AFF",
+        "warning": "#FF9500"
+    }
+
+    def __init__(self, root, max_visible=3, duration=3000, min_interval=200):
+        self.root = root
+        self.max_visible = max_visible
+        self.duration = duration
+        self.min_interval = min_interval
+        self.pool = []       # fenêtres créées, réutilisées d'une notification à l'autre
+        self.visible = []    # notifications affichées, de haut en bas
+        self.queue = deque()
+        self.last_shown = 0
+        self.pump_pending = False
+
+    def notify(self, message, type="info"):
+        """Met en file une notification, ou la regroupe avec une identique"""
+        key = (message, type)
+
+        for toast in self.visible:
+            if toast["key"] == key and self._alive(toast):
+                toast["count"] += 1
+                self._render(toast)
+                self._schedule_hide(toast)
+                return
+
+        for pending in self.queue:
+            if pending["key"] == key:
+                pending["count"] += 1
+                return
+
+        self.queue.append({"key": key, "count": 1})
+        self._pump()
+
+    def _alive(self, toast):
+        try:
+            return bool(toast["window"].winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _pump(self):
+        """Affiche les notifications en attente en limitant le rythme de création"""
+        self.visible = [toast for toast in self.visible if self._alive(toast)]
+        if not self.queue or len(self.visible) >= self.max_visible or self.pump_pending:
+            return
+
+        wait = self.min_interval - (time.monotonic() - self.last_shown) * 1000
+        if wait > 0:
+            self.pump_pending = True
+            self.root.after(int(wait), self._delayed_pump)
+            return
+
+        pending = self.queue.popleft()
+        toast = self._acquire()
+        toast["key"] = pending["key"]
+        toast["count"] = pending["count"]
+        self.visible.append(toast)
+        self.last_shown = time.monotonic()
+
+        self._render(toast)
+        toast["window"].deiconify()
+        toast["window"].lift()
+        self._restack()
+        self._schedule_hide(toast)
+        self._pump()
+
+    def _delayed_pump(self):
+        self.pump_pending = False
+        self._pump()
+
+    def _acquire(self):
+        """Retourne une fenêtre libre du pool ou en crée une"""
+        self.pool = [toast for toast in self.pool if self._alive(toast)]
+        for toast in self.pool:
+            if toast not in self.visible:
+                return toast
+
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.overrideredirect(True)
+        window.configure(bg="#2C2C2E")
+
+        frame = tk.Frame(window, bg="#2C2C2E", highlightthickness=2)
+        frame.pack(padx=2, pady=2)
+
+        label = tk.Label(frame, font=Theme.font(12), bg="#2C2C2E",
+                        fg="white", padx=20, pady=10)
+        label.pack()
+
+        toast = {"window": window, "frame": frame, "label": label, "timer": None}
+        self.pool.append(toast)
+        return toast
+
+    def _render(self, toast):
+        message, type = toast["key"]
+        if toast["count"] > 1:
+            message = f"{message} (×{toast['count']})"
+        toast["label"].configure(text=message)
+        toast["frame"].configure(highlightbackground=self.COLORS.get(type, self.COLORS["info"]))
+        self._restack()
+
+    def _restack(self):
+        """Empile les notifications visibles en haut à droite de la fenêtre"""
+        self.visible = [toast for toast in self.visible if self._alive(toast)]
+        y = self.root.winfo_y() + 50
+        for toast in self.visible:
+            window = toast["window"]
+            window.update_idletasks()
+            x = self.root.winfo_x() + self.root.winfo_width() - window.winfo_reqwidth() - 20
+            window.geometry(f"+{x}+{y}")
+            y += window.winfo_reqheight() + 10
+
+    def _schedule_hide(self, toast):
+        if toast["timer"]:
+            self.root.after_cancel(toast["timer"])
+        toast["timer"] = self.root.after(self.duration, lambda: self._hide(toast))
+
+    def _hide(self, toast):
+        """Masque la notification et rend sa fenêtre au pool"""
+        toast["timer"] = None
+        if toast in self.visible:
+            self.visible.remove(toast)
+        if self._alive(toast):
+            toast["window"].withdraw()
+        self._restack()
+        self._pump()
+
+class DialogPool:
+    """Dialogues de formulaire construits une fois, masqués à la fermeture
+
+    build(dialog, close) construit le contenu du Toplevel et retourne
+    reset(données), appelée avant chaque affichage pour remplir les champs.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.dialogs = {}   # nom -> {"window", "reset", "size"}
+
+    def open(self, name, build, size, data=None, title=None):
+        """Affiche le dialogue name (construit au premier appel) rempli avec data"""
+        dialog = self.dialogs.get(name)
+        if dialog is None or not self._alive(dialog):
+            window = tk.Toplevel(self.root)
+            window.withdraw()
+            window.configure(bg=Theme.SURFACE)
+            window.transient(self.root)
+            window.protocol("WM_DELETE_WINDOW", lambda: self.close(name))
+            dialog = {"window": window, "size": size, "reset": None}
+            self.dialogs[name] = dialog
+            dialog["reset"] = build(window, lambda: self.close(name))
+
+        window = dialog["window"]
+        if title:
+            window.title(title)
+        dialog["reset"](data)
+
+        # Centrage sans update_idletasks : la taille du dialogue est fixe
+        width, height = size
+        x = (window.winfo_screenwidth() // 2) - (width // 2)
+        y = (window.winfo_screenheight() // 2) - (height // 2)
+        window.geometry(f"{width}x{height}+{x}+{y}")
+
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+        return window
+
+    def close(self, name):
+        """Masque le dialogue (ses widgets sont conservés pour la prochaine ouverture)"""
+        dialog = self.dialogs.get(name)
+        if dialog is not None and self._alive(dialog):
+            dialog["window"].grab_release()
+            dialog["window"].withdraw()
+
+    def _alive(self, dialog):
+        try:
+            return bool(dialog["window"].winfo_exists())
+        except tk.TclError:
+            return False
+
+class TkAsyncLoop:
+    """Boucle asyncio pompée par la boucle Tk, sur le même thread
+    
+    Les rappels on_done/on_error s'exécutent dans la boucle Tk et peuvent donc
+    toucher aux widgets. La boucle n'est pompée que tant que des tâches existent.
+    """
+    def __init__(self, root, interval=10):
+        self.root = root
+        self.interval = interval
+        self.loop = None
+        self.tasks = set()
+        self.pumping = False
+        
+    def submit(self, coro, on_done=None, on_error=None):
+        """Planifie la coroutine et retourne la tâche asyncio"""
+        if self.loop is None:
+            self.loop = lazy_import("asyncio").new_event_loop()
+        task = self.loop.create_task(coro)
+        self.tasks.add(task)
+        
+        def finished(task):
+            self.tasks.discard(task)
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    log.error("Erreur asynchrone: %s", error)
+            elif on_done:
+                on_done(task.result())
+                
+        task.add_done_callback(finished)
+        if not self.pumping:
+            self.pumping = True
+            self.root.after(0, self._pump)
+        return task
+        
+    def _pump(self):
+        # Une itération non bloquante : stop() est traité après les rappels prêts
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if self.tasks:
+            self.root.after(self.interval, self._pump)
+        else:
+            self.pumping = False
+
+class NewsAdminApp:
+    def __init__(self, root, tracer=None):
+        self.root = root
+        self.root.title("News Platform Admin")
+        self.root.geometry("1400x800")
+        self.root.configure(bg="#000000")
         
-        # Configuration du thème sombre
-        self.configure_dark_theme()
+        # Configuration des services
+        self.api = NewsApiClient("http://localhost:8080", tracer=tracer)
+        self.current_user = None
+        
+        # Appels asynchrones (tableau de bord, actions groupées) sur le thread Tk
+        self.async_loop = TkAsyncLoop(self.root)
+        self.async_api = AsyncNewsApiClient(self.api, max_concurrency=8)
+        
+        # Cache pour les données
+        self.all_users = []
+        self.all_articles = []
+        
+        # Catalogue des catégories partagé par les filtres, dialogues et écrans
+        self.category_catalog = CategoryCatalog()
+        
+        # Index des articles (id -> article, catégorie -> ids), None tant que non chargé
+        self.articles_by_id = {}
+        self.category_article_ids = None
+        # Date affichée de chaque article, formatée une fois à l'indexation
+        self.article_dates = {}
+        self.article_index_loading = False
+        # Nombre d'articles par id de catégorie affiché à l'écran (None : pas encore connu)
+        self.category_counts = {}
+        
+        # Détails d'articles préchargés à la sélection (voir prefetch_articles)
+        self.article_details = ArticleDetailCache(maxsize=200)
+        self.article_prefetching = set()
+        self.article_prefetch_job = None
+        
+        # Index compact des jetons API (voir refresh_tokens)
+        self.token_index = TokenIndex()
+        self.token_filter_job = None
+        self.token_sweeper = TokenExpirySweeper(self.root, self.on_tokens_expired)
+        
+        # Écrans construits une seule fois (voir show_view)
+        self.views = {}
+        self.current_view = None
+        
+        # Mesures des requêtes REST (écran Services REST)
+        self.rest_metrics = RequestMetrics()
+        
+        # Notifications (fenêtres réutilisées)
+        self.notifications = NotificationManager(self.root)
+        
+        # Formulaires (utilisateur, article, catégorie, jeton) construits une seule fois
+        self.dialog_pool = DialogPool(self.root)
+        
+        # Diagnostics mémoire (voir MemoryMonitor), activés depuis main
+        self.memory_monitor = None
+        
+        # Connexion en cours et statistiques préchargées pendant la transition
+        self.login_pending = False
+        self.dashboard_prefetch = None
+        self.token_refresh_job = None
+        
+        # Polices personnalisées (partagées, voir Theme)
+        self.title_font = Theme.font(32, "bold")
+        self.subtitle_font = Theme.font(18, "bold")
+        self.normal_font = Theme.font(11)
+        
+        # Style sombre pour ttk, configuré à l'ouverture de l'interface principale
+        # (l'écran de connexion n'utilise pas ttk)
+        self.style = None
         
         # Centrer la fenêtre
         self.center_window()
         
-        # Initialisation de l'interface
-        self.setup_login_screen()
+        # Initialisation de l'interface (session conservée ou écran de connexion)
+        if not self.resume_session():
+            self.setup_login_screen()
         
     def center_window(self):
         """Centre la fenêtre sur l'écran"""
@@ -176,33 +2169,37 @@ class NewsAdminApp:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
         
     def configure_dark_theme(self):
-        """Configure le thème sombre pour ttk"""
-        # Couleurs
-        bg_color = "#1C1C1E"
-        fg_color = "#FFFFFF"
-        select_color = "#007AFF"
+        """Configure le thème sombre pour ttk (une seule fois)"""
+        if self.style is not None:
+            return
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
         
         # Configuration générale
-        self.style.configure(".", background=bg_color, foreground=fg_color, 
-                           fieldbackground=bg_color, borderwidth=0)
+        self.style.configure(".", background=Theme.SURFACE, foreground=Theme.TEXT,
+                           fieldbackground=Theme.SURFACE, borderwidth=0)
         
         # Treeview
-        self.style.configure("Treeview", background="#2C2C2E", foreground=fg_color,
-                           fieldbackground="#2C2C2E", borderwidth=0, rowheight=30)
-        self.style.configure("Treeview.Heading", background="#1C1C1E", foreground=fg_color,
-                           relief="flat", font=("Segoe UI", 11, "bold"))
-        self.style.map("Treeview.Heading", background=[('active', '#3A3A3C')])
-        self.style.map("Treeview", background=[('selected', '#007AFF')])
+        self.style.configure("Treeview", background=Theme.FIELD, foreground=Theme.TEXT,
+                           fieldbackground=Theme.FIELD, borderwidth=0, rowheight=30)
+        self.style.configure("Treeview.Heading", background=Theme.SURFACE, foreground=Theme.TEXT,
+                           relief="flat", font=Theme.font(11, "bold"))
+        self.style.map("Treeview.Heading", background=[('active', Theme.BORDER)])
+        self.style.map("Treeview", background=[('selected', Theme.ACCENT)])
         
         # Scrollbar
-        self.style.configure("Vertical.TScrollbar", background="#3A3A3C", 
-                           troughcolor="#1C1C1E", borderwidth=0, width=12)
-        self.style.configure("Horizontal.TScrollbar", background="#3A3A3C", 
-                           troughcolor="#1C1C1E", borderwidth=0, height=12)
+        self.style.configure("Vertical.TScrollbar", background=Theme.BORDER, 
+                           troughcolor=Theme.SURFACE, borderwidth=0, width=12)
+        self.style.configure("Horizontal.TScrollbar", background=Theme.BORDER, 
+                           troughcolor=Theme.SURFACE, borderwidth=0, height=12)
         
         # Combobox
-        self.style.configure("TCombobox", fieldbackground="#2C2C2E", background="#2C2C2E",
-                           foreground=fg_color, borderwidth=0, arrowcolor=fg_color)
+        self.style.configure("TCombobox", fieldbackground=Theme.FIELD, background=Theme.FIELD,
+                           foreground=Theme.TEXT, borderwidth=0, arrowcolor=Theme.TEXT)
+        
+        # Barre de progression (export / import)
+        self.style.configure("Horizontal.TProgressbar", background=Theme.ACCENT,
+                           troughcolor=Theme.FIELD, borderwidth=0)
         
     def setup_login_screen(self):
         """Configure l'écran de connexion moderne"""
@@ -219,7 +2216,7 @@ class NewsAdminApp:
         container.place(relx=0.5, rely=0.5, anchor="center", width=450, height=550)
         
         # Logo/Icon
-        logo_label = tk.Label(container, text="📰", font=("Segoe UI", 48), 
+        logo_label = tk.Label(container, text="📰", font=Theme.font(48), 
                             bg="#1C1C1E", fg="#007AFF")
         logo_label.pack(pady=(50, 20))
         
@@ -229,7 +2226,7 @@ class NewsAdminApp:
         title_label.pack()
         
         subtitle_label = tk.Label(container, text="Administration", 
-                                font=("Segoe UI", 14, "normal"),
+                                font=Theme.font(14),
                                 bg="#1C1C1E", fg="#8E8E93")
         subtitle_label.pack(pady=(5, 40))
         
@@ -243,7 +2240,17 @@ class NewsAdminApp:
         
         # Password
         self.password_entry = ModernEntry(form_frame, placeholder="Mot de passe", show="•")
-        self.password_entry.pack(fill="x", pady=(0, 30))
+        
+        # Session conservée dans le trousseau du système, si keyring est installé
+        self.remember_var = tk.BooleanVar(value=False)
+        if importlib.util.find_spec("keyring") is not None:
+            self.password_entry.pack(fill="x", pady=(0, 10))
+            tk.Checkbutton(form_frame, text="Rester connecté", variable=self.remember_var,
+                           font=Theme.font(10), bg="#1C1C1E", fg="#8E8E93",
+                           selectcolor="#1C1C1E", activebackground="#1C1C1E",
+                           activeforeground="white").pack(anchor="w", pady=(0, 16))
+        else:
+            self.password_entry.pack(fill="x", pady=(0, 30))
         
         # Bouton de connexion
         self.login_btn = ModernButton(form_frame, text="Se connecter", 
@@ -251,13 +2258,13 @@ class NewsAdminApp:
         self.login_btn.pack(fill="x", pady=(0, 20))
         
         # Message d'erreur (caché par défaut)
-        self.error_label = tk.Label(form_frame, text="", font=("Segoe UI", 10),
+        self.error_label = tk.Label(form_frame, text="", font=Theme.font(10),
                                   bg="#1C1C1E", fg="#FF3B30")
         self.error_label.pack()
         
         # Footer
         footer_label = tk.Label(container, text="© 2024 News Platform. Tous droits réservés.",
-                              font=("Segoe UI", 9), bg="#1C1C1E", fg="#8E8E93")
+                              font=Theme.font(9), bg="#1C1C1E", fg="#8E8E93")
         footer_label.pack(side="bottom", pady=20)
         
         # Bind Enter key
@@ -271,12 +2278,17 @@ class NewsAdminApp:
         canvas = tk.Canvas(self.root, highlightthickness=0)
         canvas.pack(fill="both", expand=True)
         
-        # Dégradé du noir vers le bleu foncé
+        # Dégradé du noir vers le bleu foncé : une bande par teinte distincte
+        # (31 rectangles au lieu d'une ligne par pixel)
         height = 800
-        for i in range(height):
-            color_value = int(20 + (i/height) * 30)
+        band_start = 0
+        for i in range(1, height + 1):
+            color_value = int(20 + (band_start/height) * 30)
+            if i < height and int(20 + (i/height) * 30) == color_value:
+                continue
             color = f"#{color_value:02x}{color_value:02x}{color_value+10:02x}"
-            canvas.create_line(0, i, 1400, i, fill=color, width=1)
+            canvas.create_rectangle(0, band_start, 1400, i, fill=color, width=0)
+            band_start = i
             
     def show_loading(self, message="Chargement..."):
         """Affiche un indicateur de chargement"""
@@ -288,8 +2300,8 @@ class NewsAdminApp:
                         highlightthickness=1)
         frame.pack(padx=2, pady=2)
         
-        tk.Label(frame, text="⏳", font=("Segoe UI", 24), bg="#1C1C1E", fg="#007AFF").pack(pady=10)
-        tk.Label(frame, text=message, font=("Segoe UI", 11), bg="#1C1C1E", fg="white").pack(padx=30, pady=(0, 15))
+        tk.Label(frame, text="⏳", font=Theme.font(24), bg="#1C1C1E", fg="#007AFF").pack(pady=10)
+        tk.Label(frame, text=message, font=Theme.font(11), bg="#1C1C1E", fg="white").pack(padx=30, pady=(0, 15))
         
         # Centrer la fenêtre de chargement
         self.loading_window.update_idletasks()
@@ -299,13 +2311,46 @@ class NewsAdminApp:
         
         self.loading_window.update()
         
+    def run_in_background(self, task, on_done, on_error=None):
+        """Exécute task() dans un thread et rappelle on_done(résultat) dans la boucle Tk"""
+        result = {}
+        
+        def worker():
+            try:
+                result["value"] = task()
+            except Exception as e:
+                result["error"] = e
+                
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        
+        def poll():
+            if thread.is_alive():
+                self.root.after(20, poll)
+            elif "error" in result:
+                if on_error:
+                    on_error(result["error"])
+                else:
+                    log.error("Erreur en arrière-plan: %s", result['error'])
+            else:
+                on_done(result["value"])
+                
+        self.root.after(20, poll)
+        
     def hide_loading(self):
         """Cache l'indicateur de chargement"""
         if hasattr(self, 'loading_window'):
             self.loading_window.destroy()
             
     def login(self):
-        """Gère la connexion de l'utilisateur via SOAP et REST"""
+        """Gère la connexion de l'utilisateur via SOAP et REST
+        
+        Seule l'authentification REST (JWT) est attendue, hors du thread Tk ;
+        SOAP et le tableau de bord se préparent pendant la transition.
+        """
+        if self.login_pending:
+            return
+            
         username = self.username_entry.get()
         password = self.password_entry.get()
         
@@ -315,55 +2360,109 @@ class NewsAdminApp:
             
         self.show_loading("Connexion en cours...")
         self.error_label.config(text="")
+        self.login_pending = True
+        self.api.auth.persist = self.remember_var.get()
         
-        try:
-            # 1. D'abord, authentification via REST pour obtenir le JWT
-            response = requests.post(f"{self.base_url}/api/auth/login", 
-                                   json={"username": username, "password": password})
-            
-            if response.status_code == 200:
-                data = response.json()
-                self.jwt_token = data['token']
-                self.current_user = {
-                    'username': data['username'],
-                    'role': data['role'],
-                    'id': data['userId']
-                }
+        def done(user):
+            self.login_pending = False
+            self.hide_loading()
+            
+            if user:
+                self.current_user = user
                 
-                # 2. Ensuite, initialiser le client SOAP avec le token
-                try:
-                    transport = Transport()
-                    transport.session.headers['Authorization'] = f'Bearer {self.jwt_token}'
-                    self.soap_client = Client(f'{self.base_url}/soap/users?wsdl', 
-                                            transport=transport)
-                    
-                    # 3. Tester l'authentification SOAP
-                    soap_auth = self.soap_client.service.authenticate(username, password)
-                    
-                    if soap_auth and self.current_user['role'] == 'ADMIN':
-                        self.hide_loading()
-                        self.animate_transition()
-                    else:
-                        self.hide_loading()
-                        self.error_label.config(text="❌ Accès réservé aux administrateurs")
-                        
-                except Exception as e:
-                    print(f"Erreur SOAP: {e}")
-                    # Continuer même si SOAP échoue
-                    if self.current_user['role'] == 'ADMIN':
-                        self.hide_loading()
-                        self.animate_transition()
-                    else:
-                        self.hide_loading()
-                        self.error_label.config(text="❌ Accès réservé aux administrateurs")
+                if self.current_user['role'] == 'ADMIN':
+                    self.warm_up_session()
+                    self.animate_transition()
+                else:
+                    self.api.logout()
+                    self.error_label.config(text="❌ Accès réservé aux administrateurs")
             else:
-                self.hide_loading()
                 self.error_label.config(text="❌ Identifiants incorrects")
                 
-        except Exception as e:
+        def failed(error):
+            self.login_pending = False
             self.hide_loading()
             self.error_label.config(text="❌ Erreur de connexion au serveur")
             
+        self.run_in_background(lambda: self.api.login(username, password), done, failed)
+        
+    def resume_session(self):
+        """Reprend la session conservée par « Rester connecté » si son JWT est valide
+        
+        Sans mot de passe, SOAP n'est pas disponible : les appels passent par REST.
+        """
+        user = self.api.auth.restore()
+        if not user or user.get('role') != 'ADMIN':
+            self.api.logout()
+            return False
+        self.current_user = user
+        self.warm_up_session()
+        self.animate_transition()
+        return True
+        
+    def warm_up_session(self):
+        """Lance en parallèle la connexion SOAP (WSDL + authentification) et les statistiques"""
+        self.run_in_background(self.api.soap, lambda soap_client: None)
+        self.prefetch_dashboard()
+        self.schedule_token_refresh()
+        
+    def schedule_token_refresh(self, backoff=None):
+        """Programme le renouvellement du JWT peu avant son expiration
+        
+        Sans identifiants en mémoire (session reprise ou reconnexion refusée),
+        l'utilisateur est prévenu puis déconnecté à l'expiration. Après une
+        erreur réseau, une nouvelle tentative a lieu backoff secondes plus
+        tard, tant que le jeton n'a pas expiré.
+        """
+        if self.token_refresh_job is not None:
+            self.root.after_cancel(self.token_refresh_job)
+            self.token_refresh_job = None
+        auth = self.api.auth
+        left = auth.seconds_left()
+        if left is None:
+            return
+            
+        if auth.can_refresh() and left > (backoff or 0):
+            delay = max(left - auth.refresh_margin, backoff or 1)
+            
+            def failed(error):
+                log.warning("Renouvellement du JWT impossible: %s", error)
+                self.schedule_token_refresh(backoff=30)
+                
+            def refresh():
+                self.token_refresh_job = None
+                # Reconnexion refusée : can_refresh() devient faux, déconnexion à l'expiration
+                self.run_in_background(auth.refresh, lambda ok: self.schedule_token_refresh(), failed)
+        else:
+            delay = max(left, 1)
+            
+            def refresh():
+                self.token_refresh_job = None
+                self.show_notification("Session expirée, veuillez vous reconnecter", "warning")
+                self.logout()
+                
+        self.token_refresh_job = self.root.after(int(delay * 1000), refresh)
+        
+    def prefetch_dashboard(self):
+        """Charge les statistiques avant la construction du tableau de bord
+        
+        load_dashboard_stats reprend ce chargement au lieu d'en lancer un autre.
+        """
+        prefetch = {"stats": None, "apply": False}
+        self.dashboard_prefetch = prefetch
+        
+        def done(stats):
+            prefetch["stats"] = stats
+            if prefetch["apply"]:
+                self.apply_dashboard_stats(stats)
+                
+        def failed(error):
+            log.error("Erreur lors du chargement des stats: %s", error)
+            if prefetch["apply"]:
+                self.load_dashboard_stats()
+                
+        self.async_loop.submit(self.fetch_dashboard_stats(), done, failed)
+        
     def animate_transition(self):
         """Animation de transition vers l'interface principale"""
         # Fondu sortant
@@ -375,14 +2474,17 @@ class NewsAdminApp:
         welcome_frame.pack(fill="both", expand=True)
         
         welcome_label = tk.Label(welcome_frame, text=f"Bienvenue, {self.current_user['username']}!",
-                               font=("Segoe UI", 36, "bold"), bg="#000000", fg="#007AFF")
+                               font=Theme.font(36, "bold"), bg="#000000", fg="#007AFF")
         welcome_label.place(relx=0.5, rely=0.5, anchor="center")
         
-        # Transition après 1 seconde
-        self.root.after(1000, self.setup_main_interface)
+        # Interface construite juste après l'affichage du message (rappel « idle »
+        # placé après le redessin), sans délai fixe
+        self.root.after_idle(self.setup_main_interface)
         
     def setup_main_interface(self):
         """Configure l'interface principale moderne"""
+        self.configure_dark_theme()
+        
         # Clear window
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -400,9 +2502,9 @@ class NewsAdminApp:
         logo_frame = tk.Frame(self.sidebar, bg="#1C1C1E")
         logo_frame.pack(fill="x", pady=20)
         
-        tk.Label(logo_frame, text="📰", font=("Segoe UI", 32), 
+        tk.Label(logo_frame, text="📰", font=Theme.font(32), 
                 bg="#1C1C1E", fg="#007AFF").pack()
-        tk.Label(logo_frame, text="News Admin", font=("Segoe UI", 16, "bold"),
+        tk.Label(logo_frame, text="News Admin", font=Theme.font(16, "bold"),
                 bg="#1C1C1E", fg="white").pack()
         
         # Menu items
@@ -433,13 +2535,14 @@ class NewsAdminApp:
         user_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         tk.Label(user_frame, text=self.current_user['username'], 
-                font=("Segoe UI", 12, "bold"), bg="#1C1C1E", fg="white").pack()
+                font=Theme.font(12, "bold"), bg="#1C1C1E", fg="white").pack()
         tk.Label(user_frame, text="Administrateur", 
-                font=("Segoe UI", 10), bg="#1C1C1E", fg="#8E8E93").pack()
+                font=Theme.font(10), bg="#1C1C1E", fg="#8E8E93").pack()
         
         # Zone de contenu principal
         self.content_area = tk.Frame(main_container, bg="#000000")
         self.content_area.pack(side="left", fill="both", expand=True)
+        self.reset_views()
         
         # Afficher le tableau de bord par défaut
         self.show_dashboard()
@@ -452,9 +2555,9 @@ class NewsAdminApp:
         content = tk.Frame(frame, bg="#1C1C1E")
         content.pack(fill="x", padx=15, pady=10)
         
-        tk.Label(content, text=icon, font=("Segoe UI", 16), 
+        tk.Label(content, text=icon, font=Theme.font(16), 
                 bg="#1C1C1E", fg="#007AFF").pack(side="left", padx=(0, 10))
-        tk.Label(content, text=text, font=("Segoe UI", 12), 
+        tk.Label(content, text=text, font=Theme.font(12), 
                 bg="#1C1C1E", fg="white").pack(side="left")
         
         # Hover effect
@@ -481,14 +2584,67 @@ class NewsAdminApp:
             
         return frame
         
+    def show_view(self, name, build, refresh=None):
+        """Affiche un écran, construit une seule fois puis masqué/réaffiché
+        
+        Seules les données sont rechargées (refresh) lors des visites suivantes.
+        """
+        view = self.views.get(name)
+        
+        if self.current_view is not None and self.current_view != name:
+            current = self.views.get(self.current_view)
+            if current is not None:
+                current.pack_forget()
+                
+        if view is None:
+            view = tk.Frame(self.content_area, bg="#000000")
+            self.views[name] = view
+            build(view)
+            
+        if self.current_view != name:
+            view.pack(fill="both", expand=True)
+            self.current_view = name
+            
+        if refresh:
+            refresh()
+            
+        # Relevé mémoire une fois l'écran affiché (mode --memory-report)
+        if self.memory_monitor is not None:
+            self.root.after_idle(lambda: self.memory_monitor.sample(f"écran {name}"))
+            
+    def cache_sizes(self):
+        """Taille des caches de l'application (entrées ; Ko pour le texte des articles)"""
+        sorters = [getattr(self, name, None) for name in
+                   ('user_sorter', 'article_sorter', 'category_sorter', 'token_sorter')]
+        return {
+            "utilisateurs": len(self.all_users),
+            "articles": len(self.all_articles),
+            "texte articles Ko": sum(len(a.get('content') or '') for a in self.all_articles) // 1024,
+            "détails articles": len(self.article_details),
+            "jetons": len(self.token_index),
+            "catégories": len(self.category_catalog.categories),
+            "écrans": len(self.views),
+            "dialogues": len(self.dialog_pool.dialogs),
+            "notifications": len(self.notifications.pool),
+            "polices": len(Theme._fonts),
+            "dates": _format_iso_date.cache_info().currsize + len(self.article_dates),
+            "clés de tri": sum(len(s.row_keys) + len(s.value_keys) for s in sorters if s is not None),
+            "traces": len(self.api.tracer.recent),
+        }
+        
+    def reset_views(self):
+        """Oublie les écrans construits (nouvelle zone de contenu)"""
+        self.views = {}
+        self.current_view = None
+        
     def show_dashboard(self):
         """Affiche le tableau de bord avec statistiques"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
+        self.show_view("dashboard", self.build_dashboard, self.load_dashboard_stats)
+        
+    def build_dashboard(self, parent):
+        """Construit l'écran du tableau de bord"""
         # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
         header.pack(fill="x")
         header.pack_propagate(False)
         
@@ -496,18 +2652,39 @@ class NewsAdminApp:
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
         tk.Label(header_content, text="Tableau de bord", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack()
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack()
         
         # Container principal
-        main_container = tk.Frame(self.content_area, bg="#000000")
+        main_container = tk.Frame(parent, bg="#000000")
         main_container.pack(fill="both", expand=True, padx=30, pady=20)
         
         # Statistiques générales
         stats_frame = tk.Frame(main_container, bg="#000000")
         stats_frame.pack(fill="x", pady=(0, 30))
         
-        # Chargement des statistiques
-        self.load_dashboard_stats(stats_frame)
+        self.dashboard_stats = {
+            "users": tk.StringVar(value="0"),
+            "active_users": tk.StringVar(value="0 actifs"),
+            "articles": tk.StringVar(value="0"),
+            "categories": tk.StringVar(value="0")
+        }
+        
+        # Cartes (valeurs mises à jour par load_dashboard_stats)
+        cards = [
+            {"label": "Utilisateurs", "value": self.dashboard_stats["users"], 
+             "icon": "👥", "color": "#007AFF", "subtext": self.dashboard_stats["active_users"]},
+            {"label": "Articles", "value": self.dashboard_stats["articles"], 
+             "icon": "📄", "color": "#34C759", "subtext": tk.StringVar(value="Publiés")},
+            {"label": "Catégories", "value": self.dashboard_stats["categories"], 
+             "icon": "🏷️", "color": "#FF9500", "subtext": tk.StringVar(value="Actives")},
+            {"label": "Visiteurs", "value": tk.StringVar(value="1.2k"), 
+             "icon": "👁️", "color": "#5856D6", "subtext": tk.StringVar(value="Cette semaine")},
+        ]
+        
+        for i, card in enumerate(cards):
+            stat_card = self.create_dashboard_card(stats_frame, card)
+            stat_card.grid(row=0, column=i, padx=10, sticky="nsew")
+            stats_frame.grid_columnconfigure(i, weight=1)
         
         # Activité récente
         activity_frame = tk.Frame(main_container, bg="#1C1C1E")
@@ -516,7 +2693,7 @@ class NewsAdminApp:
         activity_header = tk.Frame(activity_frame, bg="#2C2C2E")
         activity_header.pack(fill="x")
         
-        tk.Label(activity_header, text="📈 Activité récente", font=("Segoe UI", 16, "bold"),
+        tk.Label(activity_header, text="📈 Activité récente", font=Theme.font(16, "bold"),
                 bg="#2C2C2E", fg="white").pack(anchor="w", padx=20, pady=15)
         
         # Liste des activités
@@ -534,92 +2711,77 @@ class NewsAdminApp:
         for activity in activities:
             self.create_activity_item(activity_list, activity)
             
-    def load_dashboard_stats(self, parent):
-        """Charge les statistiques du tableau de bord"""
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            
-            # Récupérer les stats via API
-            stats_data = {
-                "users": 0,
-                "articles": 0,
-                "categories": 0,
-                "active_users": 0
-            }
-            
-            # Compter les utilisateurs
-            try:
-                response = requests.get(f"{self.base_url}/api/users", headers=headers)
-                if response.status_code == 200:
-                    users = response.json()
-                    stats_data["users"] = len(users)
-                    stats_data["active_users"] = len([u for u in users if u.get('active', False)])
-            except:
-                pass
-                
-            # Compter les articles
-            try:
-                response = requests.get(f"{self.base_url}/api/articles", headers=headers)
-                if response.status_code == 200:
-                    stats_data["articles"] = len(response.json())
-            except:
-                pass
-                
-            # Compter les catégories
-            try:
-                response = requests.get(f"{self.base_url}/api/categories", headers=headers)
-                if response.status_code == 200:
-                    stats_data["categories"] = len(response.json())
-            except:
-                pass
-                
-            # Afficher les cartes
-            cards = [
-                {"label": "Utilisateurs", "value": str(stats_data["users"]), 
-                 "icon": "👥", "color": "#007AFF", "subtext": f"{stats_data['active_users']} actifs"},
-                {"label": "Articles", "value": str(stats_data["articles"]), 
-                 "icon": "📄", "color": "#34C759", "subtext": "Publiés"},
-                {"label": "Catégories", "value": str(stats_data["categories"]), 
-                 "icon": "🏷️", "color": "#FF9500", "subtext": "Actives"},
-                {"label": "Visiteurs", "value": "1.2k", 
-                 "icon": "👁️", "color": "#5856D6", "subtext": "Cette semaine"},
-            ]
-            
-            for i, card in enumerate(cards):
-                stat_card = self.create_dashboard_card(parent, card)
-                stat_card.grid(row=0, column=i, padx=10, sticky="nsew")
-                
-            parent.grid_columnconfigure(0, weight=1)
-            parent.grid_columnconfigure(1, weight=1)
-            parent.grid_columnconfigure(2, weight=1)
-            parent.grid_columnconfigure(3, weight=1)
+    def load_dashboard_stats(self):
+        """Charge les statistiques du tableau de bord sans bloquer l'interface"""
+        # Statistiques lancées à la connexion : affichées dès qu'elles arrivent
+        prefetch, self.dashboard_prefetch = self.dashboard_prefetch, None
+        if prefetch is not None:
+            if prefetch["stats"] is not None:
+                self.apply_dashboard_stats(prefetch["stats"])
+            else:
+                prefetch["apply"] = True
+            return
             
-        except Exception as e:
-            print(f"Erreur lors du chargement des stats: {e}")
+        self.async_loop.submit(self.fetch_dashboard_stats(), self.apply_dashboard_stats,
+                               lambda e: log.error("Erreur lors du chargement des stats: %s", e))
+        
+    async def fetch_dashboard_stats(self):
+        """Récupère utilisateurs, articles et catégories en parallèle"""
+        stats_data = {
+            "users": 0,
+            "articles": 0,
+            "categories": 0,
+            "active_users": 0
+        }
+        
+        # Une requête en échec laisse simplement son compteur à 0
+        users, articles, categories = await self.async_api.gather(
+            self.async_api.get_json("/api/users"),
+            self.async_api.list_articles(),
+            self.async_api.list_categories())
+        
+        if isinstance(users, list):
+            stats_data["users"] = len(users)
+            stats_data["active_users"] = len([u for u in users if u.get('active', False)])
+        if isinstance(articles, list):
+            stats_data["articles"] = len(articles)
+        if isinstance(categories, list):
+            stats_data["categories"] = len(categories)
+            self.category_catalog.update(categories)
+        return stats_data
+        
+    def apply_dashboard_stats(self, stats_data):
+        """Met à jour les cartes du tableau de bord"""
+        self.dashboard_stats["users"].set(str(stats_data["users"]))
+        self.dashboard_stats["active_users"].set(f"{stats_data['active_users']} actifs")
+        self.dashboard_stats["articles"].set(str(stats_data["articles"]))
+        self.dashboard_stats["categories"].set(str(stats_data["categories"]))
             
     def create_dashboard_card(self, parent, data):
         """Crée une carte pour le tableau de bord"""
-        card = tk.Frame(parent, bg="#1C1C1E", height=150)
+        card = tk.Frame(parent, bg=Theme.SURFACE, height=150)
         card.pack_propagate(False)
         
         # Icône en haut à gauche
-        icon_label = tk.Label(card, text=data["icon"], font=("Segoe UI", 28),
-                            bg="#1C1C1E", fg=data["color"])
+        icon_label = tk.Label(card, text=data["icon"], font=Theme.font(28),
+                            bg=Theme.SURFACE, fg=data["color"])
         icon_label.pack(anchor="w", padx=20, pady=(20, 10))
         
         # Valeur
-        value_label = tk.Label(card, text=data["value"], font=("Segoe UI", 32, "bold"),
-                             bg="#1C1C1E", fg="white")
+        value_label = tk.Label(card, textvariable=data["value"], font=Theme.font(32, "bold"),
+                             bg=Theme.SURFACE, fg=Theme.TEXT)
         value_label.pack(anchor="w", padx=20)
         
         # Label et sous-texte
-        info_frame = tk.Frame(card, bg="#1C1C1E")
+        info_frame = tk.Frame(card, bg=Theme.SURFACE)
         info_frame.pack(anchor="w", padx=20, pady=(5, 0))
         
-        tk.Label(info_frame, text=data["label"], font=("Segoe UI", 12, "bold"),
-                bg="#1C1C1E", fg="#8E8E93").pack(side="left")
-        tk.Label(info_frame, text=f" • {data['subtext']}", font=("Segoe UI", 10),
-                bg="#1C1C1E", fg="#5E5E60").pack(side="left")
+        tk.Label(info_frame, text=data["label"], font=Theme.font(12, "bold"),
+                bg=Theme.SURFACE, fg=Theme.MUTED).pack(side="left")
+        tk.Label(info_frame, text=" • ", font=Theme.font(10),
+                bg=Theme.SURFACE, fg=Theme.FAINT).pack(side="left")
+        tk.Label(info_frame, textvariable=data["subtext"], font=Theme.font(10),
+                bg=Theme.SURFACE, fg=Theme.FAINT).pack(side="left")
         
         return card
         
@@ -632,25 +2794,25 @@ class NewsAdminApp:
         content.pack(fill="x", padx=15, pady=12)
         
         # Icône
-        tk.Label(content, text=activity["icon"], font=("Segoe UI", 14),
+        tk.Label(content, text=activity["icon"], font=Theme.font(14),
                 bg="#2C2C2E", fg="#007AFF").pack(side="left", padx=(0, 10))
         
         # Texte
-        tk.Label(content, text=activity["text"], font=("Segoe UI", 11),
+        tk.Label(content, text=activity["text"], font=Theme.font(11),
                 bg="#2C2C2E", fg="white").pack(side="left")
         
         # Temps
-        tk.Label(content, text=activity["time"], font=("Segoe UI", 10),
+        tk.Label(content, text=activity["time"], font=Theme.font(10),
                 bg="#2C2C2E", fg="#8E8E93").pack(side="right")
         
     def show_user_management(self):
         """Affiche l'interface de gestion des utilisateurs avec un design moderne"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
+        self.show_view("users", self.build_user_management, self.refresh_users)
+        
+    def build_user_management(self, parent):
+        """Construit l'écran de gestion des utilisateurs"""
         # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
         header.pack(fill="x")
         header.pack_propagate(False)
         
@@ -658,7 +2820,7 @@ class NewsAdminApp:
         header_content.pack(expand=True)
         
         tk.Label(header_content, text="Gestion des Utilisateurs", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
         
         # Boutons d'action
         action_frame = tk.Frame(header_content, bg="#0A0A0A")
@@ -668,9 +2830,13 @@ class NewsAdminApp:
                     icon="➕", style="primary").pack(side="left", padx=5)
         ModernButton(action_frame, text="Actualiser", command=self.refresh_users, 
                     icon="🔄", style="secondary").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Importer", command=lambda: self.import_resource("users"),
+                    icon="📥", style="dark").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Exporter", command=lambda: self.export_resource("users"),
+                    icon="📤", style="dark").pack(side="left", padx=5)
         
         # Statistiques
-        stats_frame = tk.Frame(self.content_area, bg="#000000")
+        stats_frame = tk.Frame(parent, bg="#000000")
         stats_frame.pack(fill="x", padx=30, pady=20)
         
         self.user_stats = {
@@ -691,7 +2857,7 @@ class NewsAdminApp:
             self.create_stat_card(stats_frame, stat["label"], stat["var"], stat["color"]).pack(side="left", padx=10)
         
         # Table des utilisateurs
-        table_frame = tk.Frame(self.content_area, bg="#1C1C1E")
+        table_frame = tk.Frame(parent, bg="#1C1C1E")
         table_frame.pack(fill="both", expand=True, padx=30, pady=(0, 30))
         
         # Barre de recherche
@@ -733,6 +2899,8 @@ class NewsAdminApp:
         for col, width in columns:
             self.user_tree.heading(col, text=col)
             self.user_tree.column(col, width=width)
+            
+        self.user_sorter = TreeviewSorter(self.user_tree, {'ID': 'int'})
         
         # Pack
         self.user_tree.grid(row=0, column=0, sticky="nsew")
@@ -758,17 +2926,14 @@ class NewsAdminApp:
         # Recherche en temps réel
         self.user_search_entry.entry.bind('<KeyRelease>', lambda e: self.filter_users(self.user_search_entry.get()))
         
-        # Charger les utilisateurs
-        self.refresh_users()
-        
     def create_stat_card(self, parent, label, var, color):
         """Crée une carte de statistique"""
         card = tk.Frame(parent, bg="#1C1C1E", width=150, height=80)
         card.pack_propagate(False)
         
-        tk.Label(card, textvariable=var, font=("Segoe UI", 24, "bold"),
+        tk.Label(card, textvariable=var, font=Theme.font(24, "bold"),
                 bg="#1C1C1E", fg=color).pack(pady=(10, 0))
-        tk.Label(card, text=label, font=("Segoe UI", 11),
+        tk.Label(card, text=label, font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack()
         
         return card
@@ -805,6 +2970,9 @@ class NewsAdminApp:
                 
                 self.insert_user_to_tree(user)
                 
+        # Conserver le tri choisi
+        self.user_sorter.sort()
+                
     def insert_user_to_tree(self, user):
         """Insère un utilisateur dans le treeview"""
         role = user.get('role', '')
@@ -854,25 +3022,8 @@ class NewsAdminApp:
             self.user_tree.delete(item)
             
         try:
-            users = []
-            
-            # Essayer d'abord avec SOAP
-            if self.soap_client:
-                try:
-                    # Utiliser le service SOAP pour lister les utilisateurs
-                    soap_users = self.soap_client.service.listUsers(self.auth_token)
-                    if soap_users:
-                        users = soap_users
-                except Exception as e:
-                    print(f"Erreur SOAP, basculement vers REST: {e}")
-                    
-            # Si SOAP échoue, utiliser REST
-            if not users:
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                response = requests.get(f"{self.base_url}/api/users", headers=headers)
-                
-                if response.status_code == 200:
-                    users = response.json()
+            # SOAP d'abord, REST en secours
+            users = self.api.list_users()
                     
             # Sauvegarder pour le filtrage
             self.all_users = users
@@ -892,7 +3043,8 @@ class NewsAdminApp:
                 elif role == 'VISITOR':
                     stats["visitors"] += 1
                     
-                self.insert_user_to_tree(user)
+            # L'écran est conservé entre deux visites : réappliquer la recherche en cours
+            self.filter_users(self.user_search_entry.get())
                 
             # Mettre à jour les statistiques
             for key, value in stats.items():
@@ -931,19 +3083,11 @@ class NewsAdminApp:
         
     def open_user_dialog(self, user_data=None):
         """Ouvre la boîte de dialogue moderne pour créer/modifier un utilisateur"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Nouvel utilisateur" if user_data is None else "Modifier utilisateur")
-        dialog.geometry("500x650")
-        dialog.configure(bg="#1C1C1E")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Centrer la fenêtre
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (650 // 2)
-        dialog.geometry(f"500x650+{x}+{y}")
+        self.dialog_pool.open("user", self.build_user_dialog, (500, 650), user_data,
+                              "Nouvel utilisateur" if user_data is None else "Modifier utilisateur")
         
+    def build_user_dialog(self, dialog, close):
+        """Construit le formulaire utilisateur ; retourne sa fonction de remplissage"""
         # Header
         header = tk.Frame(dialog, bg="#0A0A0A", height=80)
         header.pack(fill="x")
@@ -952,10 +3096,10 @@ class NewsAdminApp:
         header_content = tk.Frame(header, bg="#0A0A0A")
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
-        tk.Label(header_content, text="👤", font=("Segoe UI", 32),
+        tk.Label(header_content, text="👤", font=Theme.font(32),
                 bg="#0A0A0A", fg="#007AFF").pack()
-        tk.Label(header_content, text="Nouvel utilisateur" if not user_data else "Modifier utilisateur",
-                font=("Segoe UI", 16, "bold"), bg="#0A0A0A", fg="white").pack()
+        heading = tk.Label(header_content, font=Theme.font(16, "bold"), bg="#0A0A0A", fg="white")
+        heading.pack()
         
         # Form container
         form_container = tk.Frame(dialog, bg="#1C1C1E")
@@ -963,68 +3107,58 @@ class NewsAdminApp:
         
         # Variables
         vars = {}
+        current = {"user": None}
         
         # Champs du formulaire
         fields = [
-            {"name": "username", "label": "Nom d'utilisateur", "type": "entry", 
-             "value": user_data.get('username', '') if user_data else ''},
-            {"name": "email", "label": "Email", "type": "entry",
-             "value": user_data.get('email', '') if user_data else ''},
+            {"name": "username", "label": "Nom d'utilisateur", "type": "entry"},
+            {"name": "email", "label": "Email", "type": "entry"},
             {"name": "password", "label": "Mot de passe", "type": "password"},
-            {"name": "firstName", "label": "Prénom", "type": "entry",
-             "value": user_data.get('firstName', '') if user_data else ''},
-            {"name": "lastName", "label": "Nom", "type": "entry",
-             "value": user_data.get('lastName', '') if user_data else ''},
+            {"name": "firstName", "label": "Prénom", "type": "entry"},
+            {"name": "lastName", "label": "Nom", "type": "entry"},
             {"name": "role", "label": "Rôle", "type": "combo",
-             "values": ['VISITOR', 'EDITOR', 'ADMIN'],
-             "value": user_data.get('role', 'VISITOR') if user_data else 'VISITOR'},
+             "values": ['VISITOR', 'EDITOR', 'ADMIN']},
         ]
         
         for field in fields:
             # Label
             label_frame = tk.Frame(form_container, bg="#1C1C1E")
             label_frame.pack(fill="x", pady=(0, 5))
-            
-            tk.Label(label_frame, text=field["label"], font=("Segoe UI", 11),
+        
+            tk.Label(label_frame, text=field["label"], font=Theme.font(11),
                     bg="#1C1C1E", fg="#8E8E93").pack(anchor="w")
-            
+        
             # Input
             if field["type"] == "combo":
-                vars[field["name"]] = tk.StringVar(value=field["value"])
+                vars[field["name"]] = tk.StringVar()
                 combo = ttk.Combobox(form_container, textvariable=vars[field["name"]],
                                    values=field["values"], state="readonly",
-                                   font=("Segoe UI", 11))
+                                   font=Theme.font(11))
                 combo.pack(fill="x", pady=(0, 15))
-                
+        
             elif field["type"] == "password":
                 entry = ModernEntry(form_container, placeholder="••••••••", show="•")
                 entry.pack(fill="x", pady=(0, 15))
                 vars[field["name"]] = entry
-                
-                if user_data:
-                    hint = tk.Label(form_container, text="Laisser vide pour conserver le mot de passe actuel",
-                                  font=("Segoe UI", 9, "italic"), bg="#1C1C1E", fg="#8E8E93")
-                    hint.pack(anchor="w", pady=(0, 15))
-                    
+        
+                # Affiché seulement en modification (voir reset)
+                hint = tk.Label(form_container, text="Laisser vide pour conserver le mot de passe actuel",
+                              font=Theme.font(9, slant="italic"), bg="#1C1C1E", fg="#8E8E93")
+        
             else:
                 entry = ModernEntry(form_container)
                 entry.pack(fill="x", pady=(0, 15))
-                entry.set(field.get("value", ""))
                 vars[field["name"]] = entry
-                
-                # Désactiver le username en modification
-                if field["name"] == "username" and user_data:
-                    entry.entry.configure(state="disabled", fg="#8E8E93")
-                    
+        
         # Checkbox actif
-        active_var = tk.BooleanVar(value=user_data.get('active', True) if user_data else True)
+        active_var = tk.BooleanVar(value=True)
         vars['active'] = active_var
         
         check_frame = tk.Frame(form_container, bg="#1C1C1E")
         check_frame.pack(fill="x", pady=20)
         
         check = tk.Checkbutton(check_frame, text="Compte actif", variable=active_var,
-                             font=("Segoe UI", 11), bg="#1C1C1E", fg="white",
+                             font=Theme.font(11), bg="#1C1C1E", fg="white",
                              selectcolor="#1C1C1E", activebackground="#1C1C1E",
                              activeforeground="white")
         check.pack(anchor="w")
@@ -1033,20 +3167,42 @@ class NewsAdminApp:
         button_frame = tk.Frame(dialog, bg="#1C1C1E")
         button_frame.pack(fill="x", padx=40, pady=(0, 30))
         
+        def reset(user_data):
+            current["user"] = user_data
+            user_data = user_data or {}
+            heading.configure(text="Modifier utilisateur" if current["user"] else "Nouvel utilisateur")
+        
+            username = vars['username']
+            username.entry.configure(state="normal", fg=username.normal_color)
+            for name in ('username', 'email', 'firstName', 'lastName'):
+                vars[name].set(user_data.get(name, ''))
+            vars['password'].set('')
+            vars['role'].set(user_data.get('role', 'VISITOR'))
+            active_var.set(user_data.get('active', True))
+        
+            # Désactiver le username en modification
+            if current["user"]:
+                username.entry.configure(state="disabled", fg="#8E8E93")
+                hint.pack(anchor="w", pady=(0, 15), after=vars['password'])
+            else:
+                hint.pack_forget()
+        
         def save_user():
+            user_data = current["user"]
+        
             # Validation
             username = vars['username'].get() if hasattr(vars['username'], 'get') else vars['username'].entry.get()
             email = vars['email'].get()
-            
+        
             if not username or not email:
                 messagebox.showerror("Erreur", "Le nom d'utilisateur et l'email sont obligatoires")
                 return
-                
+        
             password = vars['password'].get()
             if not user_data and not password:
                 messagebox.showerror("Erreur", "Le mot de passe est obligatoire pour un nouvel utilisateur")
                 return
-                
+        
             try:
                 user_obj = {
                     'username': username,
@@ -1056,56 +3212,31 @@ class NewsAdminApp:
                     'role': vars['role'].get(),
                     'active': vars['active'].get()
                 }
-                
+        
                 if password:
                     user_obj['password'] = password
-                    
-                # Essayer d'abord avec SOAP
-                success = False
-                if self.soap_client:
-                    try:
-                        if user_data:
-                            # Modification via SOAP
-                            success = self.soap_client.service.updateUser(
-                                self.auth_token, user_data['id'], user_obj
-                            )
-                        else:
-                            # Création via SOAP
-                            result = self.soap_client.service.addUser(
-                                self.auth_token, user_obj
-                            )
-                            success = result is not None
-                    except Exception as e:
-                        print(f"Erreur SOAP: {e}")
-                        
-                # Si SOAP échoue, utiliser REST
-                if not success:
-                    headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                    
-                    if user_data:
-                        response = requests.put(f"{self.base_url}/api/users/{user_data['id']}", 
-                                              json=user_obj, headers=headers)
-                    else:
-                        response = requests.post(f"{self.base_url}/api/users", 
-                                               json=user_obj, headers=headers)
-                        
-                    success = response.status_code in [200, 201]
-                    
+        
+                # SOAP d'abord, REST en secours (création si pas d'identifiant)
+                user_id = user_data.get('id') if user_data else None
+                success = self.api.save_user(user_obj, user_id)
+        
                 if success:
-                    dialog.destroy()
+                    close()
                     self.refresh_users()
                     self.show_notification("✅ Utilisateur enregistré avec succès", "success")
                 else:
                     messagebox.showerror("Erreur", "Erreur lors de l'enregistrement")
-                    
+        
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur: {str(e)}")
-                
+        
         ModernButton(button_frame, text="Enregistrer", command=save_user,
                     style="primary", icon="💾").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+        ModernButton(button_frame, text="Annuler", command=close,
                     style="secondary").pack(side="left", padx=5)
         
+        return reset
+        
     def delete_user(self):
         """Supprime l'utilisateur sélectionné avec confirmation moderne"""
         selection = self.user_tree.selection()
@@ -1134,398 +3265,125 @@ class NewsAdminApp:
         content = tk.Frame(confirm_dialog, bg="#1C1C1E")
         content.pack(expand=True)
         
-        tk.Label(content, text="⚠️", font=("Segoe UI", 48),
+        tk.Label(content, text="⚠️", font=Theme.font(48),
                 bg="#1C1C1E", fg="#FF3B30").pack()
         tk.Label(content, text=f"Supprimer l'utilisateur '{username}' ?",
-                font=("Segoe UI", 14), bg="#1C1C1E", fg="white").pack(pady=10)
+                font=Theme.font(14), bg="#1C1C1E", fg="white").pack(pady=10)
         tk.Label(content, text="Cette action est irréversible",
-                font=("Segoe UI", 10), bg="#1C1C1E", fg="#8E8E93").pack()
+                font=Theme.font(10), bg="#1C1C1E", fg="#8E8E93").pack()
         
         # Boutons
         button_frame = tk.Frame(content, bg="#1C1C1E")
         button_frame.pack(pady=20)
+
         
-        def load():
-            category = category_entry.get()
-            if category:
-                self.show_loading("Chargement...")
-                try:
-                    headers = {'Accept': f'application/{self.format_var.get().lower()}'}
-                    response = requests.get(f"{self.base_url}/api/rest/articles/category/{category}", 
-                                          headers=headers)
-                    
-                    self.hide_loading()
+        def confirm_delete():
+            try:
+                # SOAP d'abord, REST en secours
+                success = self.api.delete_user(user_id)
                     
-                    if response.status_code == 200:
-                        self.display_rest_response(response.text, self.format_var.get())
-                        dialog.destroy()
-                        self.show_notification(f"✅ Articles de '{category}' chargés", "success")
-                    else:
-                        self.show_notification("❌ Catégorie non trouvée", "error")
-                        
-                except Exception as e:
-                    self.hide_loading()
-                    self.show_notification("❌ Erreur de connexion", "error")
+                if success:
+                    confirm_dialog.destroy()
+                    self.refresh_users()
+                    self.show_notification("✅ Utilisateur supprimé", "success")
+                else:
+                    messagebox.showerror("Erreur", "Erreur lors de la suppression")
                     
-        ModernButton(button_frame, text="Charger", command=load,
-                    style="primary").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Erreur: {str(e)}")
+                
+        ModernButton(button_frame, text="Supprimer", command=confirm_delete,
+                    style="danger").pack(side="left", padx=5)
+        ModernButton(button_frame, text="Annuler", command=confirm_dialog.destroy,
                     style="secondary").pack(side="left", padx=5)
+                    
+    def show_notification(self, message, type="info"):
+        """Affiche une notification temporaire (regroupée si déjà affichée)"""
+        self.notifications.notify(message, type)
         
-        category_entry.entry.bind('<Return>', lambda e: load())
+    def show_article_management(self):
+        """Affiche la gestion complète des articles"""
+        self.show_view("articles", self.build_article_management, self.refresh_articles)
         
-    def load_grouped_articles(self):
-        """Charge les articles groupés par catégorie via REST"""
-        self.show_loading("Chargement des articles groupés...")
+    def build_article_management(self, parent):
+        """Construit l'écran de gestion des articles"""
+        # Header
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
+        header.pack(fill="x")
+        header.pack_propagate(False)
         
-        try:
-            headers = {'Accept': f'application/{self.format_var.get().lower()}'}
-            response = requests.get(f"{self.base_url}/api/rest/articles/grouped", headers=headers)
-            
-            self.hide_loading()
-            
-            if response.status_code == 200:
-                self.display_rest_response(response.text, self.format_var.get())
-                self.show_notification("✅ Articles groupés chargés", "success")
-            else:
-                self.show_notification("❌ Erreur lors du chargement", "error")
-                
-        except Exception as e:
-            self.hide_loading()
-            self.show_notification("❌ Erreur de connexion", "error")
-            
-    def display_rest_response(self, content, format_type):
-        """Affiche la réponse REST avec coloration syntaxique"""
-        self.rest_text.config(state="normal")
-        self.rest_text.delete(1.0, tk.END)
+        header_content = tk.Frame(header, bg="#0A0A0A")
+        header_content.pack(expand=True)
         
-        if format_type == "JSON":
-            try:
-                # Pretty print JSON avec coloration
-                data = json.loads(content)
-                formatted = json.dumps(data, indent=2, ensure_ascii=False)
-                
-                # Insérer le texte
-                self.rest_text.insert(1.0, formatted)
-                
-                # Appliquer la coloration syntaxique
-                self.apply_json_syntax_highlighting()
-                
-            except Exception as e:
-                self.rest_text.insert(1.0, content)
-        else:
-            # Pretty print XML
-            try:
-                root = ET.fromstring(content)
-                formatted = self.prettify_xml(root)
-                self.rest_text.insert(1.0, formatted)
-                
-                # Appliquer la coloration syntaxique XML
-                self.apply_xml_syntax_highlighting()
-                
-            except Exception as e:
-                self.rest_text.insert(1.0, content)
-                
-        self.rest_text.config(state="disabled")
+        tk.Label(header_content, text="Gestion des Articles", 
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
         
-    def apply_json_syntax_highlighting(self):
-        """Applique la coloration syntaxique JSON"""
-        # Tags de coloration
-        self.rest_text.tag_configure("key", foreground="#FF9500")
-        self.rest_text.tag_configure("string", foreground="#34C759")
-        self.rest_text.tag_configure("number", foreground="#007AFF")
-        self.rest_text.tag_configure("boolean", foreground="#FF3B30")
-        self.rest_text.tag_configure("null", foreground="#8E8E93")
+        # Boutons d'action
+        action_frame = tk.Frame(header_content, bg="#0A0A0A")
+        action_frame.pack(side="right", padx=30)
         
-        # Patterns
-        import re
+        ModernButton(action_frame, text="Nouvel article", command=self.new_article, 
+                    icon="➕", style="primary").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Actualiser", command=self.refresh_articles, 
+                    icon="🔄", style="secondary").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Importer", command=lambda: self.import_resource("articles"),
+                    icon="📥", style="dark").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Exporter", command=lambda: self.export_resource("articles"),
+                    icon="📤", style="dark").pack(side="left", padx=5)
         
-        content = self.rest_text.get(1.0, tk.END)
+        # Table des articles
+        table_frame = tk.Frame(parent, bg="#1C1C1E")
+        table_frame.pack(fill="both", expand=True, padx=30, pady=20)
         
-        # Clés JSON (entre guillemets suivis de :)
-        for match in re.finditer(r'"([^"]+)"\s*:', content):
-            start_idx = f"1.0+{match.start()}c"
-            end_idx = f"1.0+{match.end()-1}c"
-            self.rest_text.tag_add("key", start_idx, end_idx)
+        # Filtres
+        filter_frame = tk.Frame(table_frame, bg="#1C1C1E")
+        filter_frame.pack(fill="x", padx=20, pady=20)
         
-        # Chaînes (entre guillemets, mais pas les clés)
-        for match in re.finditer(r':\s*"([^"]*)"', content):
-            start_idx = f"1.0+{match.start() + match.group().index('"')}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("string", start_idx, end_idx)
+        # Recherche
+        self.article_search_entry = ModernEntry(filter_frame, placeholder="🔍 Rechercher un article...")
+        self.article_search_entry.pack(side="left", fill="x", expand=True, padx=(0, 20))
         
-        # Nombres
-        for match in re.finditer(r':\s*(-?\d+\.?\d*)', content):
-            start_idx = f"1.0+{match.start() + match.group().index(match.group(1))}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("number", start_idx, end_idx)
+        # Filtre par catégorie
+        tk.Label(filter_frame, text="Catégorie:", font=Theme.font(11),
+                bg="#1C1C1E", fg="white").pack(side="left", padx=(0, 10))
         
-        # Booléens
-        for match in re.finditer(r':\s*(true|false)', content):
-            start_idx = f"1.0+{match.start() + match.group().index(match.group(1))}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("boolean", start_idx, end_idx)
+        self.category_filter = ttk.Combobox(filter_frame, state="readonly", width=20)
+        self.category_filter.pack(side="left")
+        self.category_filter.bind("<<ComboboxSelected>>", lambda e: self.filter_articles())
+        self.category_catalog.bind_combobox(self.category_filter, leading=['Toutes'])
         
-        # Null
-        for match in re.finditer(r':\s*(null)', content):
-            start_idx = f"1.0+{match.start() + match.group().index('null')}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("null", start_idx, end_idx)
-            
-    def apply_xml_syntax_highlighting(self):
-        """Applique la coloration syntaxique XML"""
-        # Tags de coloration
-        self.rest_text.tag_configure("tag", foreground="#007AFF")
-        self.rest_text.tag_configure("attribute", foreground="#FF9500")
-        self.rest_text.tag_configure("value", foreground="#34C759")
-        self.rest_text.tag_configure("comment", foreground="#8E8E93", font=("Consolas", 11, "italic"))
+        # Treeview pour les articles
+        tree_container = tk.Frame(table_frame, bg="#1C1C1E")
+        tree_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        import re
+        vsb = ttk.Scrollbar(tree_container, orient="vertical")
+        hsb = ttk.Scrollbar(tree_container, orient="horizontal")
         
-        content = self.rest_text.get(1.0, tk.END)
+        self.article_tree = ttk.Treeview(tree_container,
+                                       columns=('ID', 'Titre', 'Catégorie', 'Auteur', 'Date', 'Statut'),
+                                       show='headings',
+                                       yscrollcommand=vsb.set,
+                                       xscrollcommand=hsb.set,
+                                       height=15)
         
-        # Tags XML
-        for match in re.finditer(r'</?[^>]+>', content):
-            start_idx = f"1.0+{match.start()}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("tag", start_idx, end_idx)
+        vsb.config(command=self.article_tree.yview)
+        hsb.config(command=self.article_tree.xview)
         
-        # Attributs et valeurs
-        for match in re.finditer(r'(\w+)="([^"]*)"', content):
-            # Attribut
-            attr_start = f"1.0+{match.start(1)}c"
-            attr_end = f"1.0+{match.end(1)}c"
-            self.rest_text.tag_add("attribute", attr_start, attr_end)
-            
-            # Valeur
-            val_start = f"1.0+{match.start(2)-1}c"
-            val_end = f"1.0+{match.end(2)+1}c"
-            self.rest_text.tag_add("value", val_start, val_end)
+        # Configure columns
+        columns = [
+            ('ID', 60),
+            ('Titre', 300),
+            ('Catégorie', 150),
+            ('Auteur', 150),
+            ('Date', 150),
+            ('Statut', 100)
+        ]
         
-        # Commentaires
-        for match in re.finditer(r'<!--.*?-->', content, re.DOTALL):
-            start_idx = f"1.0+{match.start()}c"
-            end_idx = f"1.0+{match.end()}c"
-            self.rest_text.tag_add("comment", start_idx, end_idx)
+        for col, width in columns:
+            self.article_tree.heading(col, text=col)
+            self.article_tree.column(col, width=width)
             
-    def prettify_xml(self, elem, level=0):
-        """Formate le XML pour l'affichage"""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self.prettify_xml(child, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
-        return ET.tostring(elem, encoding='unicode')
-        
-    def logout(self):
-        """Déconnecte l'utilisateur avec animation"""
-        # Animation de déconnexion
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
-        # Message de déconnexion
-        logout_frame = tk.Frame(self.content_area, bg="#000000")
-        logout_frame.pack(fill="both", expand=True)
-        
-        logout_label = tk.Label(logout_frame, text="À bientôt! 👋",
-                              font=("Segoe UI", 36, "bold"), bg="#000000", fg="#007AFF")
-        logout_label.place(relx=0.5, rely=0.5, anchor="center")
-        
-        # Reset des variables
-        self.jwt_token = None
-        self.auth_token = None
-        self.current_user = None
-        self.soap_client = None
-        self.all_users = []
-        self.all_articles = []
-        self.all_categories = []
-        
-        # Retour à l'écran de connexion après animation
-        self.root.after(1500, self.setup_login_screen)
-        
-
-def main():
-    """Point d'entrée principal de l'application"""
-    # Création de la fenêtre principale
-    root = tk.Tk()
-    
-    # Configuration de la fenêtre principale
-    root.title("News Platform Admin")
-    root.configure(bg="#000000")
-    
-    # Icône de l'application (si disponible)
-    try:
-        root.iconbitmap("icon.ico")
-    except:
-        pass
-    
-    # Configuration du redimensionnement
-    root.resizable(True, True)
-    root.minsize(1200, 700)
-    
-    # Créer l'application
-    app = NewsAdminApp(root)
-    
-    # Gestionnaire de fermeture
-    def on_closing():
-        if messagebox.askokcancel("Quitter", "Voulez-vous vraiment quitter l'application ?"):
-            root.destroy()
-    
-    root.protocol("WM_DELETE_WINDOW", on_closing)
-    
-    # Lancer la boucle principale
-    root.mainloop()
-    
-
-if __name__ == "__main__":
-
-        
-        def confirm_delete():
-            try:
-                # Essayer d'abord avec SOAP
-                success = False
-                if self.soap_client:
-                    try:
-                        success = self.soap_client.service.deleteUser(self.auth_token, user_id)
-                    except Exception as e:
-                        print(f"Erreur SOAP: {e}")
-                        
-                # Si SOAP échoue, utiliser REST
-                if not success:
-                    headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                    response = requests.delete(f"{self.base_url}/api/users/{user_id}", headers=headers)
-                    success = response.status_code == 204
-                    
-                if success:
-                    confirm_dialog.destroy()
-                    self.refresh_users()
-                    self.show_notification("✅ Utilisateur supprimé", "success")
-                else:
-                    messagebox.showerror("Erreur", "Erreur lors de la suppression")
-                    
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur: {str(e)}")
-                
-        ModernButton(button_frame, text="Supprimer", command=confirm_delete,
-                    style="danger").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=confirm_dialog.destroy,
-                    style="secondary").pack(side="left", padx=5)
-                    
-    def show_notification(self, message, type="info"):
-        """Affiche une notification temporaire"""
-        notif = tk.Toplevel(self.root)
-        notif.overrideredirect(True)
-        notif.configure(bg="#2C2C2E")
-        
-        # Style selon le type
-        colors = {
-            "success": "#34C759",
-            "error": "#FF3B30",
-            "info": "#007AFF",
-            "warning": "#FF9500"
-        }
-        
-        color = colors.get(type, colors["info"])
-        
-        frame = tk.Frame(notif, bg="#2C2C2E", highlightbackground=color, highlightthickness=2)
-        frame.pack(padx=2, pady=2)
-        
-        tk.Label(frame, text=message, font=("Segoe UI", 12), bg="#2C2C2E", 
-                fg="white", padx=20, pady=10).pack()
-        
-        # Position en haut à droite
-        notif.update_idletasks()
-        x = self.root.winfo_x() + self.root.winfo_width() - notif.winfo_width() - 20
-        y = self.root.winfo_y() + 50
-        notif.geometry(f"+{x}+{y}")
-        
-        # Animation de disparition
-        notif.after(3000, notif.destroy)
-        
-    def show_article_management(self):
-        """Affiche la gestion complète des articles"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
-        # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
-        header.pack(fill="x")
-        header.pack_propagate(False)
-        
-        header_content = tk.Frame(header, bg="#0A0A0A")
-        header_content.pack(expand=True)
-        
-        tk.Label(header_content, text="Gestion des Articles", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
-        
-        # Boutons d'action
-        action_frame = tk.Frame(header_content, bg="#0A0A0A")
-        action_frame.pack(side="right", padx=30)
-        
-        ModernButton(action_frame, text="Nouvel article", command=self.new_article, 
-                    icon="➕", style="primary").pack(side="left", padx=5)
-        ModernButton(action_frame, text="Actualiser", command=self.refresh_articles, 
-                    icon="🔄", style="secondary").pack(side="left", padx=5)
-        
-        # Table des articles
-        table_frame = tk.Frame(self.content_area, bg="#1C1C1E")
-        table_frame.pack(fill="both", expand=True, padx=30, pady=20)
-        
-        # Filtres
-        filter_frame = tk.Frame(table_frame, bg="#1C1C1E")
-        filter_frame.pack(fill="x", padx=20, pady=20)
-        
-        # Recherche
-        self.article_search_entry = ModernEntry(filter_frame, placeholder="🔍 Rechercher un article...")
-        self.article_search_entry.pack(side="left", fill="x", expand=True, padx=(0, 20))
-        
-        # Filtre par catégorie
-        tk.Label(filter_frame, text="Catégorie:", font=("Segoe UI", 11),
-                bg="#1C1C1E", fg="white").pack(side="left", padx=(0, 10))
-        
-        self.category_filter = ttk.Combobox(filter_frame, state="readonly", width=20)
-        self.category_filter.pack(side="left")
-        self.category_filter.bind("<<ComboboxSelected>>", lambda e: self.filter_articles())
-        
-        # Treeview pour les articles
-        tree_container = tk.Frame(table_frame, bg="#1C1C1E")
-        tree_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        vsb = ttk.Scrollbar(tree_container, orient="vertical")
-        hsb = ttk.Scrollbar(tree_container, orient="horizontal")
-        
-        self.article_tree = ttk.Treeview(tree_container,
-                                       columns=('ID', 'Titre', 'Catégorie', 'Auteur', 'Date', 'Statut'),
-                                       show='headings',
-                                       yscrollcommand=vsb.set,
-                                       xscrollcommand=hsb.set,
-                                       height=15)
-        
-        vsb.config(command=self.article_tree.yview)
-        hsb.config(command=self.article_tree.xview)
-        
-        # Configure columns
-        columns = [
-            ('ID', 60),
-            ('Titre', 300),
-            ('Catégorie', 150),
-            ('Auteur', 150),
-            ('Date', 150),
-            ('Statut', 100)
-        ]
-        
-        for col, width in columns:
-            self.article_tree.heading(col, text=col)
-            self.article_tree.column(col, width=width)
+        self.article_sorter = TreeviewSorter(self.article_tree, {'ID': 'int', 'Date': 'date'})
         
         # Pack
         self.article_tree.grid(row=0, column=0, sticky="nsew")
@@ -1546,13 +3404,11 @@ if __name__ == "__main__":
         # Bindings
         self.article_tree.bind('<Double-Button-1>', lambda e: self.edit_article())
         self.article_tree.bind('<Button-3>', self.show_article_context_menu)
+        self.article_tree.bind('<<TreeviewSelect>>', lambda e: self.schedule_article_prefetch())
         
         # Recherche en temps réel
         self.article_search_entry.entry.bind('<KeyRelease>', lambda e: self.filter_articles())
         
-        # Charger les articles
-        self.refresh_articles()
-        
     def create_article_context_menu(self):
         """Menu contextuel pour les articles"""
         self.article_context_menu = tk.Menu(self.root, tearoff=0, bg="#2C2C2E", fg="white",
@@ -1580,36 +3436,34 @@ if __name__ == "__main__":
             self.article_tree.delete(item)
             
         try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/articles", headers=headers)
+            articles = self.api.list_articles()
             
-            if response.status_code == 200:
-                articles = response.json()
-                self.all_articles = articles
+            if articles is not None:
+                self.set_articles(articles)
                 
-                # Charger aussi les catégories pour le filtre
-                self.load_categories_for_filter()
+                # Catégories du filtre : rafraîchies en arrière-plan si le catalogue a vieilli
+                self.refresh_category_catalog()
                 
-                # Afficher les articles
-                for article in articles:
-                    self.insert_article_to_tree(article)
+                # Afficher les articles (en conservant la recherche en cours)
+                self.filter_articles()
                     
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors du chargement des articles: {str(e)}")
             
+    @staticmethod
+    def article_date(article):
+        """Date d'un article au format d'affichage"""
+        return format_iso_date(article.get('publishedDate', article.get('createdDate', '')))
+        
     def insert_article_to_tree(self, article):
         """Insère un article dans le treeview"""
         status = article.get('status', 'draft')
         tag = status.lower()
         
-        # Format de la date
-        date_str = article.get('publishedDate', article.get('createdDate', ''))
-        if date_str:
-            try:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                date_str = date_obj.strftime("%d/%m/%Y %H:%M")
-            except:
-                pass
+        # Date formatée à l'indexation (voir index_article)
+        date_str = self.article_dates.get(article.get('id'))
+        if date_str is None:
+            date_str = self.article_date(article)
                 
         # Statut avec emoji
         status_display = {
@@ -1627,20 +3481,92 @@ if __name__ == "__main__":
             status_display
         ), tags=(tag,))
         
-    def load_categories_for_filter(self):
-        """Charge les catégories pour le filtre"""
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/categories", headers=headers)
-            
-            if response.status_code == 200:
-                categories = response.json()
-                category_names = ['Toutes'] + [cat.get('name', '') for cat in categories]
-                self.category_filter['values'] = category_names
-                self.category_filter.set('Toutes')
-        except:
-            pass
+    def refresh_category_catalog(self, force=False, on_error=None):
+        """Recharge le catalogue des catégories en arrière-plan s'il a vieilli"""
+        catalog = self.category_catalog
+        if catalog.refreshing or not (force or catalog.is_stale()):
+            return
+        catalog.refreshing = True
+        
+        def done(categories):
+            catalog.refreshing = False
+            if categories is not None:
+                catalog.update(categories)
+                
+        def failed(error):
+            catalog.refreshing = False
+            if on_error:
+                on_error(error)
+                
+        self.async_loop.submit(self.async_api.list_categories(), done, failed)
+        
+    def ensure_category_catalog(self):
+        """Charge le catalogue immédiatement s'il n'a jamais été chargé"""
+        if not self.category_catalog.loaded:
+            categories = self.api.list_categories()
+            if categories is not None:
+                self.category_catalog.update(categories)
+        return self.category_catalog
+        
+    def set_articles(self, articles):
+        """Remplace le cache d'articles et reconstruit les index"""
+        self.all_articles = articles
+        self.articles_by_id = {}
+        self.category_article_ids = {}
+        self.article_dates = {}
+        
+        for article in articles:
+            self.index_article(article)
+            
+    def index_article(self, article):
+        """Ajoute (ou remplace) un article dans les index"""
+        article_id = article.get('id')
+        previous = self.articles_by_id.get(article_id)
+        if previous is not None:
+            self.unindex_article(previous)
+            
+        self.articles_by_id[article_id] = article
+        # Les filtres suivants réutilisent la date formatée au lieu de la recalculer
+        self.article_dates[article_id] = self.article_date(article)
+        self.category_article_ids.setdefault(article.get('categoryName', ''), []).append(article_id)
+        
+    def unindex_article(self, article):
+        """Retire un article des index"""
+        article_id = article.get('id')
+        self.articles_by_id.pop(article_id, None)
+        self.article_dates.pop(article_id, None)
+        ids = self.category_article_ids.get(article.get('categoryName', ''))
+        if ids and article_id in ids:
+            ids.remove(article_id)
+            
+    def load_article_index(self, on_done):
+        """Construit l'index des articles en arrière-plan puis rappelle on_done()"""
+        if self.category_article_ids is not None or self.article_index_loading:
+            return
+        self.article_index_loading = True
+        
+        def done(articles):
+            self.article_index_loading = False
+            if self.current_user is None:
+                return
+            # Une liste chargée entre-temps (écran Articles) fait foi
+            if articles is not None and self.category_article_ids is None:
+                self.set_articles(articles)
+            on_done()
             
+        def failed(error):
+            self.article_index_loading = False
+            messagebox.showerror("Erreur", f"Erreur lors du chargement des articles: {str(error)}")
+            
+        self.async_loop.submit(self.async_api.list_articles(), done, failed)
+            
+    def category_article_count(self, category):
+        """Nombre d'articles d'une catégorie (agrégat serveur si disponible)"""
+        count = self.category_catalog.count(category.get('name', ''))
+        if count is not None:
+            return count
+        return len((self.category_article_ids or {}).get(category.get('name', ''), []))
+        
     def filter_articles(self):
         """Filtre les articles selon la recherche et la catégorie"""
         # Clear tree
@@ -1650,7 +3576,14 @@ if __name__ == "__main__":
         query = self.article_search_entry.get().lower()
         category = self.category_filter.get()
         
-        for article in self.all_articles:
+        # Le filtre par catégorie passe par l'index plutôt que par un parcours complet
+        if category and category != 'Toutes' and self.category_article_ids is not None:
+            ids = self.category_article_ids.get(category, [])
+            candidates = [self.articles_by_id[article_id] for article_id in ids]
+        else:
+            candidates = self.all_articles
+        
+        for article in candidates:
             # Filtre par recherche
             if query and not any(query in str(val).lower() for val in [
                 article.get('title', ''),
@@ -1665,10 +3598,73 @@ if __name__ == "__main__":
                 
             self.insert_article_to_tree(article)
             
+        # Conserver le tri choisi
+        self.article_sorter.sort()
+            
     def new_article(self):
         """Crée un nouvel article"""
         self.open_article_dialog()
         
+    def article_version(self, article_id):
+        """Version de l'article d'après la liste chargée"""
+        return ArticleDetailCache.version_of(self.articles_by_id.get(article_id))
+        
+    def get_article_details(self, article_id):
+        """Détails complets d'un article, depuis le cache si la version est à jour"""
+        version = self.article_version(article_id)
+        article = self.article_details.get(article_id, version)
+        if article is None:
+            article = self.api.get_article(article_id)
+            if article is not None:
+                self.article_details.put(article_id, version, article)
+        return article
+        
+    def schedule_article_prefetch(self, delay=120):
+        """Précharge la sélection après une courte pause (navigation au clavier)"""
+        if self.article_prefetch_job is not None:
+            self.root.after_cancel(self.article_prefetch_job)
+        self.article_prefetch_job = self.root.after(delay, self.prefetch_selected_articles)
+        
+    def prefetch_selected_articles(self):
+        """Précharge l'article sélectionné et ses voisins immédiats"""
+        self.article_prefetch_job = None
+        try:
+            selection = self.article_tree.selection()
+            if not selection:
+                return
+            focus = selection[0]
+            items = [focus, self.article_tree.next(focus), self.article_tree.prev(focus)]
+            ids = [self.article_tree.item(item)['values'][0] for item in items if item]
+        except tk.TclError:
+            return   # écran détruit entre-temps
+        
+        self.prefetch_articles(ids)
+        
+    def prefetch_articles(self, article_ids):
+        """Charge en arrière-plan les détails absents ou périmés du cache"""
+        pending = [(article_id, self.article_version(article_id)) for article_id in article_ids
+                   if article_id not in self.article_prefetching]
+        pending = [(article_id, version) for article_id, version in pending
+                   if not self.article_details.is_fresh(article_id, version)]
+        if not pending:
+            return
+        self.article_prefetching.update(article_id for article_id, _ in pending)
+        epoch = self.article_details.epoch
+        
+        def done(results):
+            # Résultats ignorés si une modification a invalidé le cache entre-temps
+            for (article_id, version), article in zip(pending, results):
+                self.article_prefetching.discard(article_id)
+                if isinstance(article, dict) and self.article_details.epoch == epoch:
+                    self.article_details.put(article_id, version, article)
+        
+        def failed(error):
+            self.article_prefetching.difference_update(article_id for article_id, _ in pending)
+        
+        self.async_loop.submit(
+            self.async_api.map(self.async_api.get_article, [article_id for article_id, _ in pending]),
+            done, failed)
+        
     def edit_article(self):
         """Modifie l'article sélectionné"""
         selection = self.article_tree.selection()
@@ -1680,30 +3676,25 @@ if __name__ == "__main__":
         
         # Récupérer les détails complets de l'article
         try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/articles/{article_id}", headers=headers)
+            article = self.get_article_details(article_id)
             
-            if response.status_code == 200:
-                article = response.json()
+            if article is not None:
                 self.open_article_dialog(article)
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors du chargement de l'article: {str(e)}")
             
     def open_article_dialog(self, article_data=None):
         """Dialogue pour créer/modifier un article"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Nouvel article" if article_data is None else "Modifier article")
-        dialog.geometry("800x700")
-        dialog.configure(bg="#1C1C1E")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Centrer
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 400
-        y = (dialog.winfo_screenheight() // 2) - 350
-        dialog.geometry(f"800x700+{x}+{y}")
+        # Catégories : catalogue partagé, lié une fois à la liste déroulante du dialogue
+        try:
+            self.ensure_category_catalog()
+        except:
+            pass
+        self.dialog_pool.open("article", self.build_article_dialog, (800, 700), article_data,
+                              "Nouvel article" if article_data is None else "Modifier article")
         
+    def build_article_dialog(self, dialog, close):
+        """Construit le formulaire d'article ; retourne sa fonction de remplissage"""
         # Header
         header = tk.Frame(dialog, bg="#0A0A0A", height=80)
         header.pack(fill="x")
@@ -1712,10 +3703,10 @@ if __name__ == "__main__":
         header_content = tk.Frame(header, bg="#0A0A0A")
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
-        tk.Label(header_content, text="📄", font=("Segoe UI", 32),
+        tk.Label(header_content, text="📄", font=Theme.font(32),
                 bg="#0A0A0A", fg="#007AFF").pack()
-        tk.Label(header_content, text="Nouvel article" if not article_data else "Modifier article",
-                font=("Segoe UI", 16, "bold"), bg="#0A0A0A", fg="white").pack()
+        heading = tk.Label(header_content, font=Theme.font(16, "bold"), bg="#0A0A0A", fg="white")
+        heading.pack()
         
         # Form avec scrollbar
         form_frame = tk.Frame(dialog, bg="#1C1C1E")
@@ -1742,73 +3733,53 @@ if __name__ == "__main__":
         
         # Variables
         vars = {}
+        current = {"article": None}
         
         # Titre
-        tk.Label(form_container, text="Titre", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Titre", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         title_entry = ModernEntry(form_container)
         title_entry.pack(fill="x", pady=(0, 20))
-        if article_data:
-            title_entry.set(article_data.get('title', ''))
         vars['title'] = title_entry
         
         # Catégorie
-        tk.Label(form_container, text="Catégorie", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Catégorie", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         category_var = tk.StringVar()
         category_combo = ttk.Combobox(form_container, textvariable=category_var,
-                                    state="readonly", font=("Segoe UI", 11))
+                                    state="readonly", font=Theme.font(11))
         category_combo.pack(fill="x", pady=(0, 20))
         vars['category'] = category_var
+        self.category_catalog.bind_combobox(category_combo)
         
-        # Charger les catégories
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/categories", headers=headers)
-            if response.status_code == 200:
-                categories = response.json()
-                category_names = [cat.get('name', '') for cat in categories]
-                category_combo['values'] = category_names
-                if article_data and article_data.get('categoryName'):
-                    category_var.set(article_data['categoryName'])
-                elif category_names:
-                    category_var.set(category_names[0])
-        except:
-            pass
-            
         # Description courte
-        tk.Label(form_container, text="Description courte", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Description courte", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         desc_entry = ModernEntry(form_container)
         desc_entry.pack(fill="x", pady=(0, 20))
-        if article_data:
-            desc_entry.set(article_data.get('summary', ''))
         vars['summary'] = desc_entry
         
         # Contenu
-        tk.Label(form_container, text="Contenu", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Contenu", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
-        content_frame = tk.Frame(form_container, bg="#2C2C2E", highlightbackground="#3A3A3C", 
+        content_frame = tk.Frame(form_container, bg="#2C2C2E", highlightbackground="#3A3A3C",
                                highlightthickness=1)
         content_frame.pack(fill="both", expand=True, pady=(0, 20))
         
-        content_text = tk.Text(content_frame, bg="#1C1C1E", fg="white", font=("Segoe UI", 11),
+        content_text = tk.Text(content_frame, bg="#1C1C1E", fg="white", font=Theme.font(11),
                              border=0, padx=10, pady=8, wrap=tk.WORD, height=10)
         content_text.pack(fill="both", expand=True)
-        
-        if article_data:
-            content_text.insert("1.0", article_data.get('content', ''))
         vars['content'] = content_text
         
         # Statut
-        tk.Label(form_container, text="Statut", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Statut", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
-        status_var = tk.StringVar(value=article_data.get('status', 'draft') if article_data else 'draft')
+        status_var = tk.StringVar(value='draft')
         status_frame = tk.Frame(form_container, bg="#1C1C1E")
         status_frame.pack(fill="x", pady=(0, 20))
         
@@ -1820,7 +3791,7 @@ if __name__ == "__main__":
         
         for text, value in statuses:
             rb = tk.Radiobutton(status_frame, text=text, variable=status_var,
-                              value=value, font=("Segoe UI", 11), bg="#1C1C1E",
+                              value=value, font=Theme.font(11), bg="#1C1C1E",
                               fg="white", selectcolor="#1C1C1E")
             rb.pack(side="left", padx=10)
         vars['status'] = status_var
@@ -1829,12 +3800,32 @@ if __name__ == "__main__":
         button_frame = tk.Frame(dialog, bg="#1C1C1E")
         button_frame.pack(fill="x", padx=40, pady=20)
         
+        def reset(article_data):
+            current["article"] = article_data
+            article_data = article_data or {}
+            heading.configure(text="Modifier article" if current["article"] else "Nouvel article")
+        
+            title_entry.set(article_data.get('title', ''))
+            desc_entry.set(article_data.get('summary', ''))
+            content_text.delete("1.0", "end")
+            content_text.insert("1.0", article_data.get('content', ''))
+            status_var.set(article_data.get('status', 'draft'))
+        
+            names = self.category_catalog.names()
+            if article_data.get('categoryName'):
+                category_var.set(article_data['categoryName'])
+            else:
+                category_var.set(names[0] if names else '')
+            canvas.yview_moveto(0)
+        
         def save_article():
+            article_data = current["article"]
+        
             # Validation
             if not vars['title'].get():
                 messagebox.showerror("Erreur", "Le titre est obligatoire")
                 return
-                
+        
             try:
                 article_obj = {
                     'title': vars['title'].get(),
@@ -1844,31 +3835,31 @@ if __name__ == "__main__":
                     'status': vars['status'].get(),
                     'authorId': self.current_user['id']
                 }
-                
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                
-                if article_data:
-                    response = requests.put(f"{self.base_url}/api/articles/{article_data['id']}", 
-                                          json=article_obj, headers=headers)
-                else:
-                    response = requests.post(f"{self.base_url}/api/articles", 
-                                           json=article_obj, headers=headers)
-                    
-                if response.status_code in [200, 201]:
-                    dialog.destroy()
+                category_id = self.category_catalog.id_for(article_obj['categoryName'])
+                if category_id is not None:
+                    article_obj['categoryId'] = category_id
+        
+                # Création si pas d'identifiant (nouvel article ou copie)
+                article_id = article_data.get('id') if article_data else None
+        
+                if self.api.save_article(article_obj, article_id):
+                    self.article_details.invalidate(article_id)
+                    close()
                     self.refresh_articles()
                     self.show_notification("✅ Article enregistré", "success")
                 else:
                     messagebox.showerror("Erreur", "Erreur lors de l'enregistrement")
-                    
+        
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur: {str(e)}")
-                
+        
         ModernButton(button_frame, text="Enregistrer", command=save_article,
                     style="primary", icon="💾").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+        ModernButton(button_frame, text="Annuler", command=close,
                     style="secondary").pack(side="left", padx=5)
         
+        return reset
+        
     def preview_article(self):
         """Prévisualise l'article sélectionné"""
         selection = self.article_tree.selection()
@@ -1879,11 +3870,9 @@ if __name__ == "__main__":
         article_id = item['values'][0]
         
         try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/articles/{article_id}", headers=headers)
+            article = self.get_article_details(article_id)
             
-            if response.status_code == 200:
-                article = response.json()
+            if article is not None:
                 self.show_article_preview(article)
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur: {str(e)}")
@@ -1908,7 +3897,7 @@ if __name__ == "__main__":
         
         # Titre
         tk.Label(content_frame, text=article.get('title', ''), 
-                font=("Segoe UI", 24, "bold"), bg="#1C1C1E", fg="white",
+                font=Theme.font(24, "bold"), bg="#1C1C1E", fg="white",
                 wraplength=640).pack(anchor="w", pady=(0, 10))
         
         # Méta
@@ -1916,23 +3905,23 @@ if __name__ == "__main__":
         meta_frame.pack(fill="x", pady=(0, 20))
         
         tk.Label(meta_frame, text=f"📁 {article.get('categoryName', '')}",
-                font=("Segoe UI", 10), bg="#1C1C1E", fg="#007AFF").pack(side="left", padx=(0, 20))
+                font=Theme.font(10), bg="#1C1C1E", fg="#007AFF").pack(side="left", padx=(0, 20))
         tk.Label(meta_frame, text=f"✍️ {article.get('authorName', '')}",
-                font=("Segoe UI", 10), bg="#1C1C1E", fg="#8E8E93").pack(side="left", padx=(0, 20))
+                font=Theme.font(10), bg="#1C1C1E", fg="#8E8E93").pack(side="left", padx=(0, 20))
         tk.Label(meta_frame, text=f"📅 {article.get('publishedDate', '')[:10]}",
-                font=("Segoe UI", 10), bg="#1C1C1E", fg="#8E8E93").pack(side="left")
+                font=Theme.font(10), bg="#1C1C1E", fg="#8E8E93").pack(side="left")
         
         # Description
         if article.get('summary'):
             tk.Label(content_frame, text=article['summary'],
-                    font=("Segoe UI", 12, "italic"), bg="#1C1C1E", fg="#8E8E93",
+                    font=Theme.font(12, slant="italic"), bg="#1C1C1E", fg="#8E8E93",
                     wraplength=640, justify="left").pack(anchor="w", pady=(0, 20))
         
         # Contenu avec scrollbar
         text_frame = tk.Frame(content_frame, bg="#2C2C2E")
         text_frame.pack(fill="both", expand=True)
         
-        text_widget = tk.Text(text_frame, bg="#2C2C2E", fg="white", font=("Segoe UI", 11),
+        text_widget = tk.Text(text_frame, bg="#2C2C2E", fg="white", font=Theme.font(11),
                             wrap=tk.WORD, padx=20, pady=20, relief="flat")
         text_scrollbar = ttk.Scrollbar(text_frame, command=text_widget.yview)
         
@@ -1957,11 +3946,9 @@ if __name__ == "__main__":
         article_id = item['values'][0]
         
         try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/articles/{article_id}", headers=headers)
+            article = self.get_article_details(article_id)
             
-            if response.status_code == 200:
-                article = response.json()
+            if article is not None:
                 article['title'] = article['title'] + " (Copie)"
                 article['status'] = 'draft'
                 del article['id']
@@ -1977,62 +3964,210 @@ if __name__ == "__main__":
         """Archive l'article sélectionné"""
         self.update_article_status('archived')
         
+    def run_bulk(self, action, ids, on_done):
+        """Applique action (coroutine) à chaque identifiant en parallèle
+        
+        on_done(réussis, échecs) est rappelé dans la boucle Tk.
+        """
+        async def run_all():
+            results = await self.async_api.map(action, ids)
+            return sum(1 for result in results if result is True)
+            
+        self.async_loop.submit(run_all(), lambda ok: on_done(ok, len(ids) - ok),
+                               lambda e: messagebox.showerror("Erreur", f"Erreur: {str(e)}"))
+        
     def update_article_status(self, status):
-        """Met à jour le statut d'un article"""
+        """Met à jour le statut des articles sélectionnés"""
         selection = self.article_tree.selection()
         if not selection:
             return
             
-        item = self.article_tree.item(selection[0])
-        article_id = item['values'][0]
+        article_ids = [self.article_tree.item(item)['values'][0] for item in selection]
         
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.patch(f"{self.base_url}/api/articles/{article_id}/status", 
-                                    json={'status': status}, headers=headers)
-            
-            if response.status_code == 200:
-                self.refresh_articles()
-                status_text = {'published': 'publié', 'archived': 'archivé'}.get(status, status)
-                self.show_notification(f"✅ Article {status_text}", "success")
+        def done(ok, failed):
+            self.article_details.invalidate(*article_ids)
+            self.refresh_articles()
+            if failed:
+                messagebox.showerror("Erreur", f"Erreur lors de la mise à jour de {failed} article(s)")
             else:
-                messagebox.showerror("Erreur", "Erreur lors de la mise à jour")
+                status_text = {'published': 'publié', 'archived': 'archivé'}.get(status, status)
+                suffix = f" ({ok})" if ok > 1 else ""
+                self.show_notification(f"✅ Article {status_text}{suffix}", "success")
                 
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur: {str(e)}")
+        self.run_bulk(lambda article_id: self.async_api.update_article_status(article_id, status),
+                      article_ids, done)
             
     def delete_article(self):
-        """Supprime l'article sélectionné"""
+        """Supprime les articles sélectionnés"""
         selection = self.article_tree.selection()
         if not selection:
             return
             
-        item = self.article_tree.item(selection[0])
-        article_id = item['values'][0]
-        title = item['values'][1]
+        items = [self.article_tree.item(item) for item in selection]
+        article_ids = [item['values'][0] for item in items]
+        if len(items) == 1:
+            question = f"Supprimer l'article '{items[0]['values'][1]}' ?"
+        else:
+            question = f"Supprimer les {len(items)} articles sélectionnés ?"
         
-        if messagebox.askyesno("Confirmation", f"Supprimer l'article '{title}' ?"):
-            try:
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                response = requests.delete(f"{self.base_url}/api/articles/{article_id}", headers=headers)
+        def done(ok, failed):
+            self.article_details.invalidate(*article_ids)
+            self.refresh_articles()
+            if failed:
+                messagebox.showerror("Erreur", f"Erreur lors de la suppression de {failed} article(s)")
+            else:
+                self.show_notification("✅ Article supprimé" if ok == 1 else f"✅ {ok} articles supprimés",
+                                       "success")
                 
-                if response.status_code == 204:
-                    self.refresh_articles()
-                    self.show_notification("✅ Article supprimé", "success")
-                else:
-                    messagebox.showerror("Erreur", "Erreur lors de la suppression")
-                    
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur: {str(e)}")
+        if messagebox.askyesno("Confirmation", question):
+            self.run_bulk(self.async_api.delete_article, article_ids, done)
         
-    def show_categories(self):
-        """Affiche la gestion complète des catégories"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+    def run_with_progress(self, title, task, describe, on_done, on_error):
+        """Exécute task(progress, cancel) en arrière-plan avec une fenêtre de progression
+        
+        Le thread signale son avancement par progress(état) ; describe(état)
+        retourne (texte, valeur, maximum), maximum None pour une barre
+        indéterminée. on_done/on_error sont rappelés dans la boucle Tk.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("420x200")
+        dialog.configure(bg=Theme.SURFACE)
+        dialog.transient(self.root)
+        
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() // 2) - 210
+        y = (dialog.winfo_screenheight() // 2) - 100
+        dialog.geometry(f"420x200+{x}+{y}")
+        
+        content = tk.Frame(dialog, bg=Theme.SURFACE)
+        content.pack(fill="both", expand=True, padx=30, pady=25)
+        
+        tk.Label(content, text=title, font=Theme.font(13, "bold"),
+                bg=Theme.SURFACE, fg=Theme.TEXT).pack(anchor="w")
+        
+        status_var = tk.StringVar(value="Préparation...")
+        tk.Label(content, textvariable=status_var, font=Theme.font(11),
+                bg=Theme.SURFACE, fg=Theme.MUTED).pack(anchor="w", pady=(5, 10))
+        
+        progress_bar = ttk.Progressbar(content, mode="indeterminate", length=360)
+        progress_bar.pack(fill="x", pady=(0, 15))
+        progress_bar.start(15)
+        
+        # Partagé avec le thread de travail (simple affectation)
+        cancel = threading.Event()
+        state = {}
+        
+        def progress(value):
+            state["value"] = value
+            
+        def cancel_task():
+            cancel.set()
+            status_var.set("Annulation...")
+            
+        ModernButton(content, text="Annuler", command=cancel_task,
+                    style="danger").pack()
+        dialog.protocol("WM_DELETE_WINDOW", cancel_task)
+        
+        def update_progress():
+            if not dialog.winfo_exists():
+                return
+            if "value" in state and not cancel.is_set():
+                text, value, maximum = describe(state["value"])
+                status_var.set(text)
+                if maximum:
+                    progress_bar.stop()
+                    progress_bar.configure(mode="determinate", maximum=maximum, value=value)
+            dialog.after(100, update_progress)
             
+        def done(result):
+            dialog.destroy()
+            on_done(result)
+            
+        def failed(error):
+            dialog.destroy()
+            on_error(error)
+            
+        self.run_in_background(lambda: task(progress, cancel), done, failed)
+        update_progress()
+        
+    def export_resource(self, resource):
+        """Exporte une collection vers CSV, JSON Lines ou Parquet, page par page"""
+        filetypes = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl")]
+        # Simple recherche du paquet : pyarrow n'est importé qu'à l'export
+        if importlib.util.find_spec("pyarrow") is not None:
+            filetypes.append(("Parquet", "*.parquet"))
+        destination = filedialog.asksaveasfilename(parent=self.root, title="Exporter",
+                                                   initialfile=f"{resource}.csv",
+                                                   defaultextension=".csv", filetypes=filetypes)
+        if not destination:
+            return
+            
+        def task(progress, cancel):
+            return export_collection(self.api, resource, destination, cancel=cancel,
+                                     progress=lambda count, total: progress((count, total)))
+            
+        def describe(value):
+            count, total = value
+            if total:
+                return f"{count} / {total} enregistrements", count, total
+            return f"{count} enregistrements exportés", count, None
+            
+        def done(count):
+            if count is None:
+                self.show_notification("Export annulé", "info")
+            else:
+                self.show_notification(f"✅ {count} enregistrements exportés", "success")
+                
+        self.run_with_progress(
+            f"📤 {os.path.basename(destination)}", task, describe, done,
+            lambda e: messagebox.showerror("Erreur", f"Erreur lors de l'export: {str(e)}"))
+        
+    def import_resource(self, resource):
+        """Importe des articles ou des utilisateurs depuis un fichier CSV / JSON Lines"""
+        source = filedialog.askopenfilename(parent=self.root, title="Importer",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not source:
+            return
+            
+        # Auteur par défaut des articles importés : l'utilisateur connecté
+        defaults = {'authorId': self.current_user['id']} if resource == 'articles' else {}
+        
+        def task(progress, cancel):
+            importer = BulkImporter(self.api, resource, source, defaults=defaults,
+                                    progress=progress, cancel=cancel)
+            return importer, importer.run()
+            
+        def describe(stats):
+            return (f"{stats['imported']} importés, {stats['failed']} en erreur, "
+                    f"{stats['skipped']} déjà faits"), 0, None
+            
+        def done(result):
+            importer, stats = result
+            if resource == 'articles':
+                self.refresh_articles()
+            else:
+                self.refresh_users()
+            if stats["failed"]:
+                messagebox.showwarning("Import terminé",
+                                       f"{stats['imported']} importés, {stats['failed']} en erreur.\n"
+                                       f"Détail: {importer.errors_path}\n"
+                                       "Relancer l'import reprend après les lignes déjà importées.")
+            else:
+                self.show_notification(f"✅ {stats['imported']} enregistrements importés", "success")
+                
+        self.run_with_progress(
+            f"📥 {os.path.basename(source)}", task, describe, done,
+            lambda e: messagebox.showerror("Erreur", f"Erreur lors de l'import: {str(e)}"))
+        
+    def show_categories(self):
+        """Affiche la gestion complète des catégories"""
+        self.show_view("categories", self.build_categories, self.refresh_categories)
+        
+    def build_categories(self, parent):
+        """Construit l'écran de gestion des catégories"""
         # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
         header.pack(fill="x")
         header.pack_propagate(False)
         
@@ -2040,7 +4175,7 @@ if __name__ == "__main__":
         header_content.pack(expand=True)
         
         tk.Label(header_content, text="Gestion des Catégories", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
         
         # Boutons d'action
         action_frame = tk.Frame(header_content, bg="#0A0A0A")
@@ -2050,9 +4185,11 @@ if __name__ == "__main__":
                     icon="➕", style="primary").pack(side="left", padx=5)
         ModernButton(action_frame, text="Actualiser", command=self.refresh_categories, 
                     icon="🔄", style="secondary").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Exporter", command=lambda: self.export_resource("categories"),
+                    icon="📤", style="dark").pack(side="left", padx=5)
         
         # Table des catégories
-        table_frame = tk.Frame(self.content_area, bg="#1C1C1E")
+        table_frame = tk.Frame(parent, bg="#1C1C1E")
         table_frame.pack(fill="both", expand=True, padx=30, pady=20)
         
         # Treeview pour les catégories
@@ -2080,6 +4217,8 @@ if __name__ == "__main__":
         for col, width in columns:
             self.category_tree.heading(col, text=col)
             self.category_tree.column(col, width=width)
+            
+        self.category_sorter = TreeviewSorter(self.category_tree, {'ID': 'int', 'Articles': 'int'})
         
         self.category_tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -2094,8 +4233,8 @@ if __name__ == "__main__":
         self.category_tree.bind('<Double-Button-1>', lambda e: self.edit_category())
         self.category_tree.bind('<Button-3>', self.show_category_context_menu)
         
-        # Charger les catégories
-        self.refresh_categories()
+        # Réaffichage à chaque nouvelle version du catalogue
+        self.category_catalog.subscribe(lambda catalog: self.render_categories(), self.category_tree)
         
     def create_category_context_menu(self):
         """Crée un menu contextuel pour les catégories"""
@@ -2114,31 +4253,44 @@ if __name__ == "__main__":
             self.category_context_menu.post(event.x_root, event.y_root)
             
     def refresh_categories(self):
-        """Actualise la liste des catégories"""
+        """Actualise la liste des catégories
+        
+        Le catalogue déjà chargé s'affiche tout de suite ; le rechargement se fait
+        en arrière-plan et ne réaffiche la liste que si elle a changé.
+        """
+        self.render_categories()
+        self.refresh_category_catalog(
+            force=True,
+            on_error=lambda e: messagebox.showerror("Erreur", f"Erreur lors du chargement des catégories: {str(e)}"))
+        
+    def render_categories(self):
+        """Affiche les catégories du catalogue"""
         for item in self.category_tree.get_children():
             self.category_tree.delete(item)
         
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/categories", headers=headers)
+        categories = self.category_catalog.categories
+        # Sans agrégat serveur, les comptes viennent de l'index des articles :
+        # chargé hors du thread Tk, les comptes sont redessinés à son arrivée
+        pending = (self.category_article_ids is None and categories
+                   and not any(key in c for c in categories for key in CategoryCatalog.COUNT_KEYS))
+        if pending:
+            self.load_article_index(lambda: self.views.get("categories") and self.render_categories())
             
-            if response.status_code == 200:
-                categories = response.json()
-                self.all_categories = categories
-                
-                for category in categories:
-                    # Compter les articles de la catégorie
-                    article_count = len([a for a in self.all_articles 
-                                       if a.get('categoryName') == category.get('name')])
-                    
-                    self.category_tree.insert('', 'end', values=(
-                        category.get('id', ''),
-                        category.get('name', ''),
-                        category.get('description', ''),
-                        article_count
-                    ))
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement des catégories: {str(e)}")
+        self.category_counts = {}
+        for category in categories:
+            article_count = self.category_article_count(category)
+            if pending and self.category_catalog.count(category.get('name', '')) is None:
+                article_count = None
+            self.category_counts[category.get('id')] = article_count
+            
+            self.category_tree.insert('', 'end', values=(
+                category.get('id', ''),
+                category.get('name', ''),
+                category.get('description', ''),
+                "…" if article_count is None else article_count
+            ))
+            
+        self.category_sorter.sort()
             
     def new_category(self):
         """Ouvre la fenêtre de création de catégorie"""
@@ -2163,19 +4315,11 @@ if __name__ == "__main__":
         
     def open_category_dialog(self, category_data=None):
         """Dialogue pour créer/modifier une catégorie"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Nouvelle catégorie" if category_data is None else "Modifier catégorie")
-        dialog.geometry("500x400")
-        dialog.configure(bg="#1C1C1E")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Centrer
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 250
-        y = (dialog.winfo_screenheight() // 2) - 200
-        dialog.geometry(f"500x400+{x}+{y}")
+        self.dialog_pool.open("category", self.build_category_dialog, (500, 400), category_data,
+                              "Nouvelle catégorie" if category_data is None else "Modifier catégorie")
         
+    def build_category_dialog(self, dialog, close):
+        """Construit le formulaire de catégorie ; retourne sa fonction de remplissage"""
         # Header
         header = tk.Frame(dialog, bg="#0A0A0A", height=80)
         header.pack(fill="x")
@@ -2184,81 +4328,83 @@ if __name__ == "__main__":
         header_content = tk.Frame(header, bg="#0A0A0A")
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
-        tk.Label(header_content, text="🏷️", font=("Segoe UI", 32),
+        tk.Label(header_content, text="🏷️", font=Theme.font(32),
                 bg="#0A0A0A", fg="#007AFF").pack()
-        tk.Label(header_content, text="Nouvelle catégorie" if not category_data else "Modifier catégorie",
-                font=("Segoe UI", 16, "bold"), bg="#0A0A0A", fg="white").pack()
+        heading = tk.Label(header_content, font=Theme.font(16, "bold"), bg="#0A0A0A", fg="white")
+        heading.pack()
         
         # Form
         form_container = tk.Frame(dialog, bg="#1C1C1E")
         form_container.pack(fill="both", expand=True, padx=40, pady=30)
         
+        current = {"category": None}
+        
         # Nom
-        tk.Label(form_container, text="Nom", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Nom", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         name_entry = ModernEntry(form_container)
         name_entry.pack(fill="x", pady=(0, 20))
-        if category_data:
-            name_entry.set(category_data.get('name', ''))
         
         # Description
-        tk.Label(form_container, text="Description", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Description", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
-        desc_frame = tk.Frame(form_container, bg="#2C2C2E", highlightbackground="#3A3A3C", 
+        desc_frame = tk.Frame(form_container, bg="#2C2C2E", highlightbackground="#3A3A3C",
                              highlightthickness=1)
         desc_frame.pack(fill="both", expand=True, pady=(0, 20))
         
-        desc_text = tk.Text(desc_frame, bg="#1C1C1E", fg="white", font=("Segoe UI", 11),
+        desc_text = tk.Text(desc_frame, bg="#1C1C1E", fg="white", font=Theme.font(11),
                            border=0, padx=10, pady=8, wrap=tk.WORD)
         desc_text.pack(fill="both", expand=True)
         
-        if category_data:
-            desc_text.insert("1.0", category_data.get('description', ''))
-        
         # Boutons
         button_frame = tk.Frame(dialog, bg="#1C1C1E")
         button_frame.pack(fill="x", padx=40, pady=(0, 30))
         
+        def reset(category_data):
+            current["category"] = category_data
+            category_data = category_data or {}
+            heading.configure(text="Modifier catégorie" if current["category"] else "Nouvelle catégorie")
+        
+            name_entry.set(category_data.get('name', ''))
+            desc_text.delete("1.0", "end")
+            desc_text.insert("1.0", category_data.get('description', ''))
+        
         def save_category():
+            category_data = current["category"]
             name = name_entry.get()
             description = desc_text.get("1.0", "end-1c")
-            
+        
             if not name:
                 messagebox.showerror("Erreur", "Le nom est obligatoire")
                 return
-            
+        
             try:
                 category_obj = {
                     'name': name,
                     'description': description
                 }
-                
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                
-                if category_data:
-                    response = requests.put(f"{self.base_url}/api/categories/{category_data['id']}", 
-                                          json=category_obj, headers=headers)
-                else:
-                    response = requests.post(f"{self.base_url}/api/categories", 
-                                           json=category_obj, headers=headers)
-                
-                if response.status_code in [200, 201]:
-                    dialog.destroy()
+        
+                category_id = category_data['id'] if category_data else None
+        
+                if self.api.save_category(category_obj, category_id):
+                    close()
                     self.refresh_categories()
                     self.show_notification("✅ Catégorie enregistrée", "success")
                 else:
                     messagebox.showerror("Erreur", "Erreur lors de l'enregistrement")
-                    
+        
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur: {str(e)}")
         
         ModernButton(button_frame, text="Enregistrer", command=save_category,
                     style="primary", icon="💾").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+        ModernButton(button_frame, text="Annuler", command=close,
                     style="secondary").pack(side="left", padx=5)
         
+        return reset
+        
     def delete_category(self):
         """Supprime une catégorie"""
         selection = self.category_tree.selection()
@@ -2268,20 +4414,23 @@ if __name__ == "__main__":
         item = self.category_tree.item(selection[0])
         category_id = item['values'][0]
         category_name = item['values'][1]
-        article_count = item['values'][3]
+        article_count = self.category_counts.get(category_id)
         
-        if article_count > 0:
+        if article_count:
             messagebox.showwarning("Attention", 
                                  f"Cette catégorie contient {article_count} article(s). "
                                  "Veuillez d'abord déplacer ou supprimer ces articles.")
             return
+            
+        question = f"Supprimer la catégorie '{category_name}' ?"
+        if article_count is None:
+            # Comptes en cours de chargement (ou chargement échoué)
+            question = ("Le nombre d'articles de cette catégorie n'est pas encore connu : "
+                        "elle contient peut-être des articles.\n\n" + question)
         
-        if messagebox.askyesno("Confirmation", f"Supprimer la catégorie '{category_name}' ?"):
+        if messagebox.askyesno("Confirmation", question, icon="warning" if article_count is None else "question"):
             try:
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                response = requests.delete(f"{self.base_url}/api/categories/{category_id}", headers=headers)
-                
-                if response.status_code == 204:
+                if self.api.delete_category(category_id):
                     self.refresh_categories()
                     self.show_notification("✅ Catégorie supprimée", "success")
                 else:
@@ -2310,12 +4459,12 @@ if __name__ == "__main__":
             messagebox.showerror("Accès refusé", "Cette fonctionnalité est réservée aux administrateurs")
             return
         
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+        self.show_view("tokens", self.build_token_management, self.refresh_tokens)
         
+    def build_token_management(self, parent):
+        """Construit l'écran de gestion des jetons"""
         # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
         header.pack(fill="x")
         header.pack_propagate(False)
         
@@ -2323,7 +4472,7 @@ if __name__ == "__main__":
         header_content.pack(expand=True)
         
         tk.Label(header_content, text="Gestion des Jetons API", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack(side="left", padx=30)
         
         # Boutons d'action
         action_frame = tk.Frame(header_content, bg="#0A0A0A")
@@ -2331,23 +4480,36 @@ if __name__ == "__main__":
         
         ModernButton(action_frame, text="Nouveau jeton", command=self.generate_token, 
                     icon="🔑", style="primary").pack(side="left", padx=5)
-        ModernButton(action_frame, text="Actualiser", command=self.refresh_tokens, 
+        ModernButton(action_frame, text="Actualiser", command=lambda: self.refresh_tokens(force=True),
                     icon="🔄", style="secondary").pack(side="left", padx=5)
+        ModernButton(action_frame, text="Exporter", command=lambda: self.export_resource("tokens"),
+                    icon="📤", style="dark").pack(side="left", padx=5)
         
         # Instructions
-        info_frame = tk.Frame(self.content_area, bg="#1C1C1E")
+        info_frame = tk.Frame(parent, bg="#1C1C1E")
         info_frame.pack(fill="x", padx=30, pady=20)
         
         info_text = """Les jetons d'authentification permettent d'accéder aux services web SOAP. 
 Chaque jeton a une durée de validité limitée et peut être révoqué à tout moment."""
         
-        tk.Label(info_frame, text="ℹ️ " + info_text, font=("Segoe UI", 11),
+        tk.Label(info_frame, text="ℹ️ " + info_text, font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93", wraplength=1000, justify="left").pack(padx=20, pady=15)
         
         # Table des jetons
-        table_frame = tk.Frame(self.content_area, bg="#1C1C1E")
+        table_frame = tk.Frame(parent, bg="#1C1C1E")
         table_frame.pack(fill="both", expand=True, padx=30, pady=(0, 30))
         
+        # Recherche
+        search_frame = tk.Frame(table_frame, bg="#1C1C1E")
+        search_frame.pack(fill="x", padx=20, pady=(20, 0))
+        
+        self.token_search_entry = ModernEntry(search_frame, placeholder="🔍 Rechercher un jeton (id, préfixe, description)...")
+        self.token_search_entry.pack(side="left", fill="x", expand=True)
+        
+        self.token_count_var = tk.StringVar(value="")
+        tk.Label(search_frame, textvariable=self.token_count_var, font=Theme.font(10),
+                bg="#1C1C1E", fg="#8E8E93").pack(side="right", padx=(20, 0))
+        
         # Treeview pour les jetons
         tree_container = tk.Frame(table_frame, bg="#1C1C1E")
         tree_container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -2365,7 +4527,7 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         # Configure columns
         columns = [
             ('ID', 60),
-            ('Jeton', 300),
+            ('Jeton', 120),
             ('Description', 200),
             ('Créé le', 150),
             ('Expire le', 150),
@@ -2375,6 +4537,9 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         for col, width in columns:
             self.token_tree.heading(col, text=col)
             self.token_tree.column(col, width=width)
+            
+        self.token_sorter = TreeviewSorter(self.token_tree,
+                                           {'ID': 'int', 'Créé le': 'date', 'Expire le': 'date'})
         
         self.token_tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -2392,9 +4557,7 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         
         # Bindings
         self.token_tree.bind('<Button-3>', self.show_token_context_menu)
-        
-        # Charger les jetons
-        self.refresh_tokens()
+        self.token_search_entry.entry.bind('<KeyRelease>', lambda e: self.schedule_token_filter())
         
     def create_token_context_menu(self):
         """Menu contextuel pour les jetons"""
@@ -2413,19 +4576,10 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
             
     def generate_token(self):
         """Génère un nouveau jeton"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Nouveau jeton API")
-        dialog.geometry("500x350")
-        dialog.configure(bg="#1C1C1E")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Centrer
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 250
-        y = (dialog.winfo_screenheight() // 2) - 175
-        dialog.geometry(f"500x350+{x}+{y}")
+        self.dialog_pool.open("token", self.build_token_dialog, (500, 350), title="Nouveau jeton API")
         
+    def build_token_dialog(self, dialog, close):
+        """Construit le formulaire de jeton ; retourne sa fonction de remplissage"""
         # Header
         header = tk.Frame(dialog, bg="#0A0A0A", height=80)
         header.pack(fill="x")
@@ -2434,22 +4588,22 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         header_content = tk.Frame(header, bg="#0A0A0A")
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
-        tk.Label(header_content, text="🔑", font=("Segoe UI", 32),
+        tk.Label(header_content, text="🔑", font=Theme.font(32),
                 bg="#0A0A0A", fg="#007AFF").pack()
         tk.Label(header_content, text="Nouveau jeton API",
-                font=("Segoe UI", 16, "bold"), bg="#0A0A0A", fg="white").pack()
+                font=Theme.font(16, "bold"), bg="#0A0A0A", fg="white").pack()
         
         # Form
         form_container = tk.Frame(dialog, bg="#1C1C1E")
         form_container.pack(fill="both", expand=True, padx=40, pady=30)
         
-        tk.Label(form_container, text="Description du jeton", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Description du jeton", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         desc_entry = ModernEntry(form_container, placeholder="Ex: Service SOAP Production")
         desc_entry.pack(fill="x", pady=(0, 20))
         
-        tk.Label(form_container, text="Durée de validité", font=("Segoe UI", 11),
+        tk.Label(form_container, text="Durée de validité", font=Theme.font(11),
                 bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
         
         duration_var = tk.StringVar(value="30")
@@ -2459,7 +4613,7 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         durations = [("7 jours", "7"), ("30 jours", "30"), ("90 jours", "90"), ("1 an", "365")]
         for text, value in durations:
             rb = tk.Radiobutton(duration_frame, text=text, variable=duration_var,
-                              value=value, font=("Segoe UI", 11), bg="#1C1C1E",
+                              value=value, font=Theme.font(11), bg="#1C1C1E",
                               fg="white", selectcolor="#1C1C1E")
             rb.pack(side="left", padx=10)
         
@@ -2467,39 +4621,41 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         button_frame = tk.Frame(dialog, bg="#1C1C1E")
         button_frame.pack(fill="x", padx=40, pady=(0, 30))
         
+        def reset(data):
+            desc_entry.set('')
+            duration_var.set("30")
+        
         def create_token():
             description = desc_entry.get()
             if not description:
                 messagebox.showerror("Erreur", "La description est obligatoire")
                 return
-            
+        
             try:
-                token_data = {
-                    'description': description,
-                    'validityDays': int(duration_var.get())
-                }
-                
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                response = requests.post(f"{self.base_url}/api/tokens", json=token_data, headers=headers)
-                
-                if response.status_code == 201:
-                    result = response.json()
-                    dialog.destroy()
-                    self.refresh_tokens()
-                    
+                result = self.api.create_token(description, int(duration_var.get()))
+        
+                if result is not None:
+                    close()
+                    # Ajout sur place : la liste n'est pas rechargée
+                    self.token_sweeper.push(self.token_index.add(result))
+                    self.token_index.remember_secret(result['id'], result['token'])
+                    self.filter_tokens()
+        
                     # Afficher le jeton généré
                     self.show_generated_token(result['token'])
                 else:
                     messagebox.showerror("Erreur", "Erreur lors de la génération du jeton")
-                    
+        
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur: {str(e)}")
         
         ModernButton(button_frame, text="Générer", command=create_token,
                     style="primary", icon="🔑").pack(side="left", padx=5)
-        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+        ModernButton(button_frame, text="Annuler", command=close,
                     style="secondary").pack(side="left", padx=5)
         
+        return reset
+        
     def show_generated_token(self, token):
         """Affiche le jeton généré"""
         dialog = tk.Toplevel(self.root)
@@ -2519,18 +4675,18 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         content = tk.Frame(dialog, bg="#1C1C1E")
         content.pack(fill="both", expand=True, padx=40, pady=30)
         
-        tk.Label(content, text="✅ Jeton généré avec succès", font=("Segoe UI", 16, "bold"),
+        tk.Label(content, text="✅ Jeton généré avec succès", font=Theme.font(16, "bold"),
                 bg="#1C1C1E", fg="#34C759").pack(pady=(0, 20))
         
         tk.Label(content, text="⚠️ IMPORTANT: Copiez ce jeton maintenant, il ne sera plus affiché!",
-                font=("Segoe UI", 11, "bold"), bg="#1C1C1E", fg="#FF9500").pack(pady=(0, 20))
+                font=Theme.font(11, "bold"), bg="#1C1C1E", fg="#FF9500").pack(pady=(0, 20))
         
         # Zone de texte pour le jeton
         token_frame = tk.Frame(content, bg="#2C2C2E", highlightbackground="#3A3A3C", 
                               highlightthickness=1)
         token_frame.pack(fill="x", pady=(0, 20))
         
-        token_text = tk.Text(token_frame, bg="#1C1C1E", fg="#34C759", font=("Consolas", 11),
+        token_text = tk.Text(token_frame, bg="#1C1C1E", fg="#34C759", font=Theme.mono(11),
                             height=4, wrap=tk.WORD, padx=10, pady=10, relief="flat")
         token_text.pack(fill="both")
         token_text.insert("1.0", token)
@@ -2550,96 +4706,130 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         ModernButton(button_frame, text="Fermer", command=dialog.destroy,
                     style="secondary").pack(side="left", padx=5)
         
-    def refresh_tokens(self):
-        """Actualise la liste des jetons"""
-        for item in self.token_tree.get_children():
-            self.token_tree.delete(item)
-        
-        try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/tokens", headers=headers)
-            
-            if response.status_code == 200:
-                tokens = response.json()
+    def refresh_tokens(self, force=False):
+        """Affiche les jetons depuis l'index, rechargé en arrière-plan s'il a vieilli"""
+        index = self.token_index
+        if index.loaded_at is not None:
+            self.filter_tokens()
+        if index.loading or not (force or index.is_stale()):
+            return
+        index.loading = True
+        
+        def done(tokens):
+            index.loading = False
+            if tokens is not None:
+                index.load(tokens)
+                self.token_sweeper.reset(index.entries.values())
+                self.filter_tokens()
                 
-                for token in tokens:
-                    # Déterminer le statut
-                    if token.get('revoked', False):
-                        status = '🔴 Révoqué'
-                        tag = 'revoked'
-                    elif token.get('expired', False):
-                        status = '⏰ Expiré'
-                        tag = 'expired'
-                    else:
-                        status = '🟢 Actif'
-                        tag = 'active'
-                    
-                    # Formater les dates
-                    created_date = token.get('createdAt', '')
-                    expires_date = token.get('expiresAt', '')
-                    
-                    if created_date:
-                        try:
-                            date_obj = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                            created_date = date_obj.strftime("%d/%m/%Y")
-                        except:
-                            pass
-                            
-                    if expires_date:
-                        try:
-                            date_obj = datetime.fromisoformat(expires_date.replace('Z', '+00:00'))
-                            expires_date = date_obj.strftime("%d/%m/%Y")
-                        except:
-                            pass
-                    
-                    self.token_tree.insert('', 'end', values=(
-                        token.get('id', ''),
-                        token.get('token', '')[:50] + '...',
-                        token.get('description', ''),
-                        created_date,
-                        expires_date,
-                        status
-                    ), tags=(tag,))
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement des jetons: {str(e)}")
+        def failed(error):
+            index.loading = False
+            messagebox.showerror("Erreur", f"Erreur lors du chargement des jetons: {str(error)}")
             
-    def copy_token(self):
-        """Copie le jeton sélectionné"""
+        self.async_loop.submit(self.async_api.list_tokens(), done, failed)
+        
+    def schedule_token_filter(self, delay=150):
+        """Filtre après une courte pause de frappe (listes de plusieurs milliers de jetons)"""
+        if self.token_filter_job is not None:
+            self.root.after_cancel(self.token_filter_job)
+        self.token_filter_job = self.root.after(delay, self.filter_tokens)
+        
+    def filter_tokens(self):
+        """Réaffiche les jetons de l'index correspondant à la recherche"""
+        self.token_filter_job = None
+        if not self.views.get("tokens"):
+            return
+        self.token_tree.delete(*self.token_tree.get_children())
+        # Lignes réinsérées sous le même iid : leurs anciennes clés de tri ne valent plus
+        self.token_sorter.invalidate()
+        
+        entries = self.token_index.search(self.token_search_entry.get())
+        for entry in entries:
+            self.token_tree.insert('', 'end', iid=str(entry['id']), values=self.token_row(entry),
+                                   tags=(self.token_status(entry)[1],))
+            
+        total = len(self.token_index)
+        self.token_count_var.set(f"{len(entries)} / {total} jetons" if len(entries) != total else f"{total} jetons")
+        
+        # Conserver le tri choisi
+        self.token_sorter.sort()
+        
+    @staticmethod
+    def token_status(entry):
+        """Libellé et tag du statut d'un jeton (expiration calculée depuis expiresAt)"""
+        if entry['revoked']:
+            return '🔴 Révoqué', 'revoked'
+        if TokenIndex.is_expired(entry):
+            return '⏰ Expiré', 'expired'
+        return '🟢 Actif', 'active'
+        
+    def on_tokens_expired(self, token_ids):
+        """Appelé par le TokenExpirySweeper : lignes basculées sur place"""
+        if not self.views.get("tokens"):
+            return
+        for token_id in token_ids:
+            entry = self.token_index.get(token_id)
+            if entry is not None:
+                self.update_token_row(entry)
+        
+    def token_row(self, entry):
+        """Valeurs d'une ligne du tableau des jetons"""
+        return (
+            entry['id'],
+            entry['prefix'],
+            entry['description'],
+            entry['createdAt'],
+            entry['expiresAt'],
+            self.token_status(entry)[0],
+        )
+        
+    def update_token_row(self, entry):
+        """Met à jour une ligne sur place (statut, tag et clés de tri)"""
+        item = str(entry['id'])
+        if not self.token_tree.exists(item):
+            return
+        self.token_tree.item(item, values=self.token_row(entry), tags=(self.token_status(entry)[1],))
+        self.token_sorter.invalidate(item)
+        
+    def selected_token_id(self):
         selection = self.token_tree.selection()
         if not selection:
+            return None
+        return self.token_tree.item(selection[0])['values'][0]
+        
+    def copy_token(self):
+        """Copie le jeton sélectionné (secret demandé au serveur seulement à ce moment)"""
+        token_id = self.selected_token_id()
+        if token_id is None:
             return
             
-        item = self.token_tree.item(selection[0])
-        token_id = item['values'][0]
-        
         try:
-            headers = {'Authorization': f'Bearer {self.jwt_token}'}
-            response = requests.get(f"{self.base_url}/api/tokens/{token_id}", headers=headers)
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.root.clipboard_clear()
-                self.root.clipboard_append(token_data['token'])
-                self.show_notification("✅ Jeton copié dans le presse-papier", "success")
+            secret = self.token_index.secret(token_id)
+            if secret is None:
+                token_data = self.api.get_token(token_id)
+                if token_data is None:
+                    return
+                secret = token_data['token']
+                self.token_index.remember_secret(token_id, secret)
+                
+            self.root.clipboard_clear()
+            self.root.clipboard_append(secret)
+            self.show_notification("✅ Jeton copié dans le presse-papier", "success")
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur: {str(e)}")
             
     def revoke_token(self):
-        """Révoque le jeton sélectionné"""
-        selection = self.token_tree.selection()
-        if not selection:
+        """Révoque le jeton sélectionné et met sa ligne à jour sur place"""
+        token_id = self.selected_token_id()
+        if token_id is None:
             return
-            
-        item = self.token_tree.item(selection[0])
-        token_id = item['values'][0]
         
         if messagebox.askyesno("Confirmation", "Révoquer ce jeton ? Cette action est irréversible."):
             try:
-                headers = {'Authorization': f'Bearer {self.jwt_token}'}
-                response = requests.delete(f"{self.base_url}/api/tokens/{token_id}", headers=headers)
-                
-                if response.status_code == 204:
-                    self.refresh_tokens()
+                if self.api.revoke_token(token_id):
+                    entry = self.token_index.mark_revoked(token_id)
+                    if entry is not None:
+                        self.update_token_row(entry)
                     self.show_notification("✅ Jeton révoqué", "success")
                 else:
                     messagebox.showerror("Erreur", "Erreur lors de la révocation")
@@ -2649,12 +4839,12 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         
     def show_rest_services(self):
         """Affiche la section des services REST"""
-        # Clear content area
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
+        self.show_view("rest", self.build_rest_services)
+        
+    def build_rest_services(self, parent):
+        """Construit l'écran des services REST"""
         # Header
-        header = tk.Frame(self.content_area, bg="#0A0A0A", height=80)
+        header = tk.Frame(parent, bg="#0A0A0A", height=80)
         header.pack(fill="x")
         header.pack_propagate(False)
         
@@ -2662,10 +4852,10 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         header_content.place(relx=0.5, rely=0.5, anchor="center")
         
         tk.Label(header_content, text="Services REST - Tests API", 
-                font=("Segoe UI", 24, "bold"), bg="#0A0A0A", fg="white").pack()
+                font=Theme.font(24, "bold"), bg="#0A0A0A", fg="white").pack()
         
         # Container principal
-        main_container = tk.Frame(self.content_area, bg="#000000")
+        main_container = tk.Frame(parent, bg="#000000")
         main_container.pack(fill="both", expand=True, padx=30, pady=20)
         
         # Contrôles
@@ -2676,13 +4866,13 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         control_content.pack(padx=20, pady=20)
         
         # Format selection
-        tk.Label(control_content, text="Format de sortie:", font=("Segoe UI", 12),
+        tk.Label(control_content, text="Format de sortie:", font=Theme.font(12),
                 bg="#1C1C1E", fg="white").pack(side="left", padx=(0, 10))
         
         self.format_var = tk.StringVar(value="JSON")
         for format_type in ["JSON", "XML"]:
             rb = tk.Radiobutton(control_content, text=format_type, variable=self.format_var,
-                              value=format_type, font=("Segoe UI", 11), bg="#1C1C1E",
+                              value=format_type, font=Theme.font(11), bg="#1C1C1E",
                               fg="white", selectcolor="#1C1C1E", activebackground="#1C1C1E",
                               activeforeground="white")
             rb.pack(side="left", padx=10)
@@ -2697,6 +4887,34 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
                     icon="🏷️", style="secondary").pack(side="left", padx=5)
         ModernButton(button_frame, text="Articles groupés", command=self.load_grouped_articles,
                     icon="📊", style="warning").pack(side="left", padx=5)
+        ModernButton(button_frame, text="Comparer JSON/XML", command=self.compare_formats,
+                    icon="⚖️", style="dark").pack(side="left", padx=5)
+        
+        # Métriques des requêtes
+        metrics_frame = tk.Frame(main_container, bg="#1C1C1E")
+        metrics_frame.pack(fill="x", pady=(0, 20))
+        
+        metrics_header = tk.Frame(metrics_frame, bg="#2C2C2E")
+        metrics_header.pack(fill="x")
+        
+        tk.Label(metrics_header, text="⏱️ Métriques", font=Theme.font(14, "bold"),
+                bg="#2C2C2E", fg="white").pack(side="left", padx=20, pady=10)
+        
+        self.rest_last_request_var = tk.StringVar(value="Aucune requête")
+        tk.Label(metrics_header, textvariable=self.rest_last_request_var, font=Theme.font(10),
+                bg="#2C2C2E", fg="#8E8E93").pack(side="right", padx=20)
+        
+        self.rest_metrics_tree = ttk.Treeview(metrics_frame,
+                                             columns=('Phase', 'Dernière', 'p50', 'p90', 'p99'),
+                                             show='headings',
+                                             height=len(RequestMetrics.PHASES))
+        
+        for col, width in [('Phase', 200), ('Dernière', 120), ('p50', 120), ('p90', 120), ('p99', 120)]:
+            self.rest_metrics_tree.heading(col, text=col)
+            self.rest_metrics_tree.column(col, width=width, anchor="w" if col == 'Phase' else "e")
+        
+        self.rest_metrics_tree.pack(fill="x", padx=20, pady=(10, 20))
+        self.update_rest_metrics_panel()
         
         # Zone de résultats
         result_frame = tk.Frame(main_container, bg="#1C1C1E")
@@ -2706,7 +4924,7 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         result_header = tk.Frame(result_frame, bg="#2C2C2E")
         result_header.pack(fill="x")
         
-        tk.Label(result_header, text="📋 Résultats API", font=("Segoe UI", 14, "bold"),
+        tk.Label(result_header, text="📋 Résultats API", font=Theme.font(14, "bold"),
                 bg="#2C2C2E", fg="white").pack(side="left", padx=20, pady=10)
         
         # Zone de texte avec style moderne
@@ -2714,7 +4932,7 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         text_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         self.rest_text = tk.Text(text_frame, wrap=tk.WORD, bg="#0A0A0A", fg="white",
-                               font=("Consolas", 11), insertbackground="white",
+                               font=Theme.mono(11), insertbackground="white",
                                selectbackground="#007AFF", selectforeground="white",
                                padx=20, pady=20, relief="flat")
         self.rest_text.pack(side="left", fill="both", expand=True)
@@ -2728,23 +4946,65 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         self.rest_text.insert("1.0", "Cliquez sur un bouton ci-dessus pour tester les services REST...")
         self.rest_text.config(state="disabled")
         
+    def fetch_rest(self, path):
+        """GET instrumenté sur un service REST dans le format sélectionné"""
+        return self.api.fetch_rest(path, self.format_var.get())
+        
+    def record_rest_metrics(self, metrics):
+        """Enregistre les mesures d'une requête et rafraîchit le panneau"""
+        self.rest_metrics.record(metrics)
+        self.update_rest_metrics_panel()
+        
+    def update_rest_metrics_panel(self):
+        """Affiche la dernière requête et les percentiles glissants"""
+        for item in self.rest_metrics_tree.get_children():
+            self.rest_metrics_tree.delete(item)
+            
+        labels = {
+            "dns": "Résolution DNS",
+            "connect": "Connexion",
+            "ttfb": "Premier octet (TTFB)",
+            "download": "Téléchargement",
+            "parse": "Parsing",
+            "highlight": "Rendu / coloration",
+            "total": "Total"
+        }
+        
+        def fmt(value):
+            return "—" if value is None else f"{value:.1f} ms"
+            
+        last = self.rest_metrics.last() or {}
+        summary = self.rest_metrics.summary()
+        
+        for phase in RequestMetrics.PHASES:
+            self.rest_metrics_tree.insert('', 'end', values=(
+                labels[phase], fmt(last.get(phase)), *[fmt(v) for v in summary[phase]]
+            ))
+            
+        if last:
+            self.rest_last_request_var.set(
+                f"{last['format']} {last['endpoint']} • HTTP {last['status']} • "
+                f"{last['bytes'] / 1024:.1f} Ko (réseau {last['wire_bytes'] / 1024:.1f} Ko, "
+                f"ratio {last['compression']:.2f}) • {len(self.rest_metrics.samples)} requêtes"
+            )
+        
     def load_all_articles(self):
         """Charge tous les articles via REST"""
         self.show_loading("Chargement des articles...")
         
         try:
-            headers = {'Accept': f'application/{self.format_var.get().lower()}'}
-            response = requests.get(f"{self.base_url}/api/rest/articles", headers=headers)
+            status, content, metrics = self.fetch_rest("/api/rest/articles")
             
             self.hide_loading()
             
-            if response.status_code == 200:
-                self.display_rest_response(response.text, self.format_var.get())
+            if status == 200:
+                metrics.update(self.display_rest_response(content, self.format_var.get()))
                 self.show_notification("✅ Articles chargés avec succès", "success")
             else:
                 self.show_notification("❌ Erreur lors du chargement", "error")
+            self.record_rest_metrics(metrics)
                 
-        except Exception as e:
+        except Exception:
             self.hide_loading()
             self.show_notification("❌ Erreur de connexion", "error")
             
@@ -2767,9 +5027,9 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         content = tk.Frame(dialog, bg="#1C1C1E")
         content.pack(expand=True)
         
-        tk.Label(content, text="🏷️", font=("Segoe UI", 32),
+        tk.Label(content, text="🏷️", font=Theme.font(32),
                 bg="#1C1C1E", fg="#007AFF").pack()
-        tk.Label(content, text="Nom de la catégorie", font=("Segoe UI", 14),
+        tk.Label(content, text="Nom de la catégorie", font=Theme.font(14),
                 bg="#1C1C1E", fg="white").pack(pady=10)
         
         category_entry = ModernEntry(content, placeholder="Ex: Technologie")
@@ -2778,4 +5038,1003 @@ Chaque jeton a une durée de validité limitée et peut être révoqué à tout
         
         # Boutons
         button_frame = tk.Frame(content, bg="#1C1C1E")
-        button_frame.pack(pady=
\ No newline at end of file
+        button_frame.pack(pady=20)
+        
+        def load():
+            category = category_entry.get()
+            if category:
+                self.show_loading("Chargement...")
+                try:
+                    status, content, metrics = self.fetch_rest(f"/api/rest/articles/category/{quote(category, safe='')}")
+                    
+                    self.hide_loading()
+                    
+                    if status == 200:
+                        metrics.update(self.display_rest_response(content, self.format_var.get()))
+                        dialog.destroy()
+                        self.show_notification(f"✅ Articles de '{category}' chargés", "success")
+                    else:
+                        self.show_notification("❌ Catégorie non trouvée", "error")
+                    self.record_rest_metrics(metrics)
+                        
+                except Exception:
+                    self.hide_loading()
+                    self.show_notification("❌ Erreur de connexion", "error")
+                    
+        ModernButton(button_frame, text="Charger", command=load,
+                    style="primary").pack(side="left", padx=5)
+        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+                    style="secondary").pack(side="left", padx=5)
+        
+        category_entry.entry.bind('<Return>', lambda e: load())
+        
+    def load_grouped_articles(self):
+        """Charge les articles groupés par catégorie via REST"""
+        self.show_loading("Chargement des articles groupés...")
+        
+        try:
+            status, content, metrics = self.fetch_rest("/api/rest/articles/grouped")
+            
+            self.hide_loading()
+            
+            if status == 200:
+                metrics.update(self.display_rest_response(content, self.format_var.get()))
+                self.show_notification("✅ Articles groupés chargés", "success")
+            else:
+                self.show_notification("❌ Erreur lors du chargement", "error")
+            self.record_rest_metrics(metrics)
+                
+        except Exception:
+            self.hide_loading()
+            self.show_notification("❌ Erreur de connexion", "error")
+            
+    def compare_formats(self):
+        """Ouvre le mode comparaison JSON / XML"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Comparer JSON et XML")
+        dialog.geometry("450x380")
+        dialog.configure(bg="#1C1C1E")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # Centrer
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() // 2) - 225
+        y = (dialog.winfo_screenheight() // 2) - 190
+        dialog.geometry(f"450x380+{x}+{y}")
+        
+        # Contenu
+        content = tk.Frame(dialog, bg="#1C1C1E")
+        content.pack(fill="both", expand=True, padx=40, pady=30)
+        
+        tk.Label(content, text="⚖️ Comparaison JSON / XML", font=Theme.font(16, "bold"),
+                bg="#1C1C1E", fg="white").pack(anchor="w", pady=(0, 20))
+        
+        # Endpoint
+        tk.Label(content, text="Service", font=Theme.font(11),
+                bg="#1C1C1E", fg="#8E8E93").pack(anchor="w", pady=(0, 5))
+        
+        endpoints = {
+            "Tous les articles": "/api/rest/articles",
+            "Articles groupés": "/api/rest/articles/grouped",
+            "Par catégorie": "/api/rest/articles/category/{}"
+        }
+        endpoint_var = tk.StringVar(value="Tous les articles")
+        ttk.Combobox(content, textvariable=endpoint_var, values=list(endpoints),
+                    state="readonly", font=Theme.font(11)).pack(fill="x", pady=(0, 15))
+        
+        category_entry = ModernEntry(content, placeholder="Catégorie (si « Par catégorie »)")
+        category_entry.pack(fill="x", pady=(0, 15))
+        
+        # Répétitions
+        rep_frame = tk.Frame(content, bg="#1C1C1E")
+        rep_frame.pack(fill="x", pady=(0, 20))
+        
+        tk.Label(rep_frame, text="Répétitions", font=Theme.font(11),
+                bg="#1C1C1E", fg="#8E8E93").pack(side="left")
+        
+        repetitions_var = tk.IntVar(value=10)
+        tk.Spinbox(rep_frame, from_=1, to=500, textvariable=repetitions_var, width=6,
+                  font=Theme.font(11), bg="#2C2C2E", fg="white", buttonbackground="#2C2C2E",
+                  relief="flat").pack(side="right")
+        
+        # Boutons
+        button_frame = tk.Frame(content, bg="#1C1C1E")
+        button_frame.pack()
+        
+        def start():
+            path = endpoints[endpoint_var.get()]
+            if "{}" in path:
+                category = category_entry.get()
+                if not category:
+                    messagebox.showerror("Erreur", "Veuillez indiquer une catégorie")
+                    return
+                path = path.format(quote(category, safe=''))
+            try:
+                repetitions = max(1, int(repetitions_var.get()))
+            except (tk.TclError, ValueError):
+                messagebox.showerror("Erreur", "Nombre de répétitions invalide")
+                return
+            dialog.destroy()
+            self.run_format_benchmark(path, repetitions)
+            
+        ModernButton(button_frame, text="Lancer", command=start,
+                    style="primary", icon="▶️").pack(side="left", padx=5)
+        ModernButton(button_frame, text="Annuler", command=dialog.destroy,
+                    style="secondary").pack(side="left", padx=5)
+        
+    def run_format_benchmark(self, path, repetitions):
+        """Récupère JSON et XML en parallèle, N fois, et mesure chaque étape
+        
+        Seuls les téléchargements sont simultanés : les deux réponses sont
+        ensuite parsées l'une après l'autre sur un même thread, pour que le
+        temps de parsing ne soit pas faussé par la contention du GIL.
+        """
+        formats = ["JSON", "XML"]
+        results = {format_type: [] for format_type in formats}
+        executor = ThreadPoolExecutor(max_workers=len(formats))
+        
+        def fetch(format_type):
+            # Réseau seul, hors de la boucle Tk
+            status, content, metrics = self.api.fetch_rest(path, format_type)
+            if status != 200:
+                raise RuntimeError(f"{format_type}: HTTP {status}")
+            return content, metrics
+            
+        def parse(format_type, content, metrics):
+            start = time.perf_counter()
+            formatted, valid = self.format_rest_content(content, format_type)
+            metrics["parse"] = (time.perf_counter() - start) * 1000
+            return metrics, formatted, valid
+            
+        def fetch_both():
+            futures = {format_type: executor.submit(fetch, format_type) for format_type in formats}
+            downloads = {format_type: future.result() for format_type, future in futures.items()}
+            # Parsing séquentiel, une fois les deux téléchargements terminés
+            return {format_type: parse(format_type, *downloads[format_type]) for format_type in formats}
+            
+        def run_repetition(index):
+            self.rest_last_request_var.set(f"⚖️ Comparaison en cours... {index + 1}/{repetitions}")
+            self.run_in_background(fetch_both, lambda res: on_repetition(index, res), on_error)
+            
+        def on_repetition(index, res):
+            # Le rendu doit se faire dans la boucle Tk
+            for format_type in formats:
+                metrics, formatted, valid = res[format_type]
+                metrics["highlight"] = self.render_rest_content(formatted, format_type, highlight=valid)
+                self.rest_metrics.record(metrics)
+                results[format_type].append(metrics)
+                
+            if index + 1 < repetitions:
+                run_repetition(index + 1)
+            else:
+                executor.shutdown(wait=False)
+                self.update_rest_metrics_panel()
+                self.show_format_comparison(path, results)
+                self.show_notification("✅ Comparaison terminée", "success")
+                
+        def on_error(error):
+            executor.shutdown(wait=False)
+            self.update_rest_metrics_panel()
+            self.show_notification(f"❌ Comparaison interrompue: {error}", "error")
+            
+        run_repetition(0)
+        
+    def show_format_comparison(self, path, results):
+        """Affiche le tableau comparatif JSON / XML dans la zone de résultats"""
+        rows = [
+            ("Taille (Ko)", lambda m: m["bytes"] / 1024),
+            ("Taille réseau (Ko)", lambda m: m["wire_bytes"] / 1024),
+            ("Serveur / TTFB (ms)", lambda m: m["ttfb"]),
+            ("Téléchargement (ms)", lambda m: m["download"]),
+            ("Parsing client (ms)", lambda m: m["parse"]),
+            ("Rendu (ms)", lambda m: m["highlight"]),
+            ("Total (ms)", lambda m: m["total"]),
+        ]
+        
+        lines = [
+            f"Comparaison JSON / XML — {path}",
+            f"{len(results['JSON'])} répétitions, requêtes JSON et XML lancées en parallèle, parsing séquentiel",
+            "",
+            f"{'Mesure':<24}{'JSON moy.':>12}{'JSON méd.':>12}{'XML moy.':>12}{'XML méd.':>12}{'XML/JSON':>10}",
+            "-" * 82
+        ]
+        
+        for label, getter in rows:
+            json_values = [getter(m) for m in results["JSON"]]
+            xml_values = [getter(m) for m in results["XML"]]
+            json_mean = statistics.mean(json_values)
+            xml_mean = statistics.mean(xml_values)
+            ratio = f"{xml_mean / json_mean:.2f}×" if json_mean else "—"
+            lines.append(
+                f"{label:<24}{json_mean:>12.2f}{statistics.median(json_values):>12.2f}"
+                f"{xml_mean:>12.2f}{statistics.median(xml_values):>12.2f}{ratio:>10}"
+            )
+            
+        self.render_rest_content("\n".join(lines), "TEXT", highlight=False)
+        
+    def format_rest_content(self, content, format_type):
+        """Parse et met en forme une réponse REST
+        
+        Retourne (texte formaté, True si le contenu était valide).
+        """
+        if format_type == "JSON":
+            try:
+                data = json.loads(content)
+                return json.dumps(data, indent=2, ensure_ascii=False), True
+            except Exception:
+                return content, False
+        else:
+            try:
+                root = ET.fromstring(content)
+                return self.prettify_xml(root), True
+            except Exception:
+                return content, False
+                
+    def render_rest_content(self, formatted, format_type, highlight=True):
+        """Insère le texte formaté avec coloration ; retourne la durée en ms"""
+        start = time.perf_counter()
+        
+        self.rest_text.config(state="normal")
+        self.rest_text.delete(1.0, tk.END)
+        self.rest_text.insert(1.0, formatted)
+        
+        if highlight:
+            if format_type == "JSON":
+                self.apply_json_syntax_highlighting()
+            else:
+                self.apply_xml_syntax_highlighting()
+                
+        self.rest_text.config(state="disabled")
+        self.rest_text.update_idletasks()
+        
+        return (time.perf_counter() - start) * 1000
+        
+    def display_rest_response(self, content, format_type):
+        """Affiche la réponse REST avec coloration syntaxique
+        
+        Retourne les durées de parsing et de rendu en millisecondes.
+        """
+        start = time.perf_counter()
+        formatted, valid = self.format_rest_content(content, format_type)
+        parse_time = (time.perf_counter() - start) * 1000
+        
+        highlight_time = self.render_rest_content(formatted, format_type, highlight=valid)
+        
+        return {"parse": parse_time, "highlight": highlight_time}
+        
+    def apply_json_syntax_highlighting(self):
+        """Applique la coloration syntaxique JSON"""
+        # Tags de coloration
+        self.rest_text.tag_configure("key", foreground="#FF9500")
+        self.rest_text.tag_configure("string", foreground="#34C759")
+        self.rest_text.tag_configure("number", foreground="#007AFF")
+        self.rest_text.tag_configure("boolean", foreground="#FF3B30")
+        self.rest_text.tag_configure("null", foreground="#8E8E93")
+        
+        # Patterns
+        import re
+        
+        content = self.rest_text.get(1.0, tk.END)
+        
+        # Clés JSON (entre guillemets suivis de :)
+        for match in re.finditer(r'"([^"]+)"\s*:', content):
+            start_idx = f"1.0+{match.start()}c"
+            end_idx = f"1.0+{match.end()-1}c"
+            self.rest_text.tag_add("key", start_idx, end_idx)
+        
+        # Chaînes (entre guillemets, mais pas les clés)
+        for match in re.finditer(r':\s*"([^"]*)"', content):
+            quote_offset = match.group().index('"')
+            start_idx = f"1.0+{match.start() + quote_offset}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("string", start_idx, end_idx)
+        
+        # Nombres
+        for match in re.finditer(r':\s*(-?\d+\.?\d*)', content):
+            start_idx = f"1.0+{match.start() + match.group().index(match.group(1))}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("number", start_idx, end_idx)
+        
+        # Booléens
+        for match in re.finditer(r':\s*(true|false)', content):
+            start_idx = f"1.0+{match.start() + match.group().index(match.group(1))}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("boolean", start_idx, end_idx)
+        
+        # Null
+        for match in re.finditer(r':\s*(null)', content):
+            start_idx = f"1.0+{match.start() + match.group().index('null')}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("null", start_idx, end_idx)
+            
+    def apply_xml_syntax_highlighting(self):
+        """Applique la coloration syntaxique XML"""
+        # Tags de coloration
+        self.rest_text.tag_configure("tag", foreground="#007AFF")
+        self.rest_text.tag_configure("attribute", foreground="#FF9500")
+        self.rest_text.tag_configure("value", foreground="#34C759")
+        self.rest_text.tag_configure("comment", foreground="#8E8E93", font=Theme.mono(11, "italic"))
+        
+        import re
+        
+        content = self.rest_text.get(1.0, tk.END)
+        
+        # Tags XML
+        for match in re.finditer(r'</?[^>]+>', content):
+            start_idx = f"1.0+{match.start()}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("tag", start_idx, end_idx)
+        
+        # Attributs et valeurs
+        for match in re.finditer(r'(\w+)="([^"]*)"', content):
+            # Attribut
+            attr_start = f"1.0+{match.start(1)}c"
+            attr_end = f"1.0+{match.end(1)}c"
+            self.rest_text.tag_add("attribute", attr_start, attr_end)
+            
+            # Valeur
+            val_start = f"1.0+{match.start(2)-1}c"
+            val_end = f"1.0+{match.end(2)+1}c"
+            self.rest_text.tag_add("value", val_start, val_end)
+        
+        # Commentaires
+        for match in re.finditer(r'<!--.*?-->', content, re.DOTALL):
+            start_idx = f"1.0+{match.start()}c"
+            end_idx = f"1.0+{match.end()}c"
+            self.rest_text.tag_add("comment", start_idx, end_idx)
+            
+    def prettify_xml(self, elem, level=0):
+        """Formate le XML pour l'affichage"""
+        i = "\n" + level * "  "
+        if len(elem):
+            if not elem.text or not elem.text.strip():
+                elem.text = i + "  "
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = i
+            for child in elem:
+                self.prettify_xml(child, level + 1)
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = i
+        else:
+            if level and (not elem.tail or not elem.tail.strip()):
+                elem.tail = i
+        return ET.tostring(elem, encoding='unicode')
+        
+    def logout(self):
+        """Déconnecte l'utilisateur avec animation"""
+        # Animation de déconnexion
+        for widget in self.content_area.winfo_children():
+            widget.destroy()
+        self.reset_views()
+            
+        # Message de déconnexion
+        logout_frame = tk.Frame(self.content_area, bg="#000000")
+        logout_frame.pack(fill="both", expand=True)
+        
+        logout_label = tk.Label(logout_frame, text="À bientôt! 👋",
+                              font=Theme.font(36, "bold"), bg="#000000", fg="#007AFF")
+        logout_label.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Reset des variables
+        if self.token_refresh_job is not None:
+            self.root.after_cancel(self.token_refresh_job)
+            self.token_refresh_job = None
+        self.api.logout()
+        self.current_user = None
+        self.dashboard_prefetch = None
+        self.all_users = []
+        self.all_articles = []
+        self.category_catalog.clear()
+        self.articles_by_id = {}
+        self.category_article_ids = None
+        self.article_dates = {}
+        self.article_details.clear()
+        self.article_prefetching.clear()
+        self.token_index.clear()
+        self.token_sweeper.clear()
+        
+        # Retour à l'écran de connexion après animation
+        self.root.after(1500, self.setup_login_screen)
+        
+
+# Opérations disponibles par ressource pour le mode ligne de commande
+CLI_RESOURCES = {
+    'users': {'list': 'list_users', 'get': 'get_user', 'save': 'save_user', 'delete': 'delete_user'},
+    'articles': {'list': 'list_articles', 'get': 'get_article', 'save': 'save_article',
+                 'delete': 'delete_article'},
+    'categories': {'list': 'list_categories', 'get': 'get_category', 'save': 'save_category',
+                   'delete': 'delete_category'},
+    'tokens': {'list': 'list_tokens', 'get': 'get_token', 'delete': 'revoke_token'},
+}
+
+
+def parse_cli_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="complete-news-admin-app.py",
+        description="Administration de la plateforme sans interface graphique (sortie JSON Lines)")
+    parser.add_argument("resource", choices=sorted(CLI_RESOURCES))
+    parser.add_argument("action", choices=["list", "export", "import", "get", "create", "update", "delete"])
+    parser.add_argument("ids", nargs="*", help="identifiants ciblés (get/update/delete)")
+    parser.add_argument("--ids-file", help="fichier d'identifiants, un par ligne ('-' pour stdin)")
+    parser.add_argument("--set", dest="fields", action="append", default=[], metavar="CLE=VALEUR",
+                        help="champ à écrire (create/update), valeur interprétée en JSON si possible")
+    parser.add_argument("--url", default=os.environ.get("NEWS_ADMIN_URL", "http://localhost:8080"))
+    parser.add_argument("--user", default=os.environ.get("NEWS_ADMIN_USER"))
+    parser.add_argument("--password", default=os.environ.get("NEWS_ADMIN_PASSWORD"))
+    parser.add_argument("--token", default=os.environ.get("NEWS_ADMIN_TOKEN"),
+                        help="JWT déjà obtenu (remplace --user/--password)")
+    parser.add_argument("--workers", type=int, default=4, help="requêtes simultanées (défaut: 4)")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", "-o", help="fichier de sortie (défaut: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv", "parquet"],
+                        help="format d'export (défaut: d'après l'extension de --output)")
+    parser.add_argument("--page-size", type=int, default=500, help="taille des pages d'export")
+    parser.add_argument("--input", "-i", help="fichier CSV ou JSON Lines à importer")
+    parser.add_argument("--show-secrets", action="store_true",
+                        help="tokens list : écrit les secrets complets au lieu de leur préfixe")
+    return parser.parse_args(argv)
+
+
+def parse_cli_fields(pairs):
+    """Convertit les --set CLE=VALEUR en dictionnaire"""
+    fields = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"--set attend CLE=VALEUR: {pair}")
+        try:
+            fields[key] = json.loads(value)
+        except ValueError:
+            fields[key] = value
+    return fields
+
+
+def read_cli_ids(args):
+    ids = list(args.ids)
+    if args.ids_file:
+        stream = sys.stdin if args.ids_file == "-" else open(args.ids_file, encoding="utf-8")
+        with stream:
+            ids.extend(line.strip() for line in stream if line.strip())
+    return ids
+
+
+def configure_tracing(tracer):
+    """Journalisation et export des traces d'appels, réglés par l'environnement
+    
+    NEWS_ADMIN_LOG_LEVEL      niveau des messages sur stderr (WARNING)
+    NEWS_ADMIN_TRACE_LOG      fichier JSON Lines recevant chaque appel REST/SOAP
+    NEWS_ADMIN_METRICS_FILE   fichier texte Prometheus, réécrit toutes les 15 s et à la sortie
+    NEWS_ADMIN_METRICS_PORT   port local servant GET /metrics
+    """
+    logging.basicConfig(level=os.environ.get("NEWS_ADMIN_LOG_LEVEL", "WARNING").upper(),
+                        format="%(levelname)s %(name)s: %(message)s")
+    
+    trace_log = os.environ.get("NEWS_ADMIN_TRACE_LOG")
+    if trace_log:
+        handler = logging.FileHandler(trace_log, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        tracer.logger.addHandler(handler)
+        tracer.logger.setLevel(logging.DEBUG)
+        tracer.logger.propagate = False
+        
+    metrics_file = os.environ.get("NEWS_ADMIN_METRICS_FILE")
+    if metrics_file:
+        tracer.metrics_path = metrics_file
+        tracer.start_flushing()
+        atexit.register(tracer.stop_flushing)
+        
+    metrics_port = os.environ.get("NEWS_ADMIN_METRICS_PORT")
+    if metrics_port:
+        tracer.serve_metrics(int(metrics_port))
+
+
+def run_cli(argv):
+    """Mode batch : exécute une opération et écrit une ligne JSON par résultat
+    
+    Retourne le code de sortie (0 si tout a réussi, 1 sinon).
+    """
+    args = parse_cli_args(argv)
+    operations = CLI_RESOURCES[args.resource]
+    api = NewsApiClient(args.url, timeout=args.timeout)
+    configure_tracing(api.tracer)
+    
+    if args.token:
+        api.jwt_token = args.token
+    elif args.user and args.password:
+        if api.login(args.user, args.password) is None:
+            print("Échec de l'authentification", file=sys.stderr)
+            return 1
+    else:
+        print("Identifiants requis: --token ou --user/--password", file=sys.stderr)
+        return 1
+        
+    try:
+        fields = parse_cli_fields(args.fields)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+        
+    if args.action == "import":
+        # Les --set servent de valeurs par défaut pour chaque ligne
+        if not args.input:
+            print("--input requis pour l'import", file=sys.stderr)
+            return 1
+        try:
+            stats = BulkImporter(api, args.resource, args.input, workers=args.workers,
+                                 defaults=fields).run()
+        except Exception as e:
+            print(f"Échec de l'import: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(stats))
+        return 1 if stats["failed"] else 0
+        
+    if args.action == "export":
+        # En flux, page par page : fichier au format choisi, sinon JSON Lines sur stdout
+        try:
+            if args.output:
+                count = export_collection(api, args.resource, args.output, args.format,
+                                          args.page_size)
+            else:
+                transform = EXPORT_TRANSFORMS.get(args.resource)
+                count = 0
+                for records, _ in api.iter_pages(EXPORT_PATHS[args.resource], args.page_size):
+                    for record in records:
+                        record = transform(record) if transform else record
+                        sys.stdout.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                    count += len(records)
+        except Exception as e:
+            print(f"Échec de l'export: {e}", file=sys.stderr)
+            return 1
+        print(f"{count} enregistrements exportés", file=sys.stderr)
+        return 0
+        
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failures = 0
+    
+    def emit(record):
+        output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        
+    def run_one(item_id):
+        """Traite un identifiant ; retourne la ligne de résultat"""
+        try:
+            if args.action == "get":
+                data = getattr(api, operations['get'])(item_id)
+                return {"id": item_id, "ok": data is not None, "data": data}
+            if args.action == "delete":
+                return {"id": item_id, "ok": bool(getattr(api, operations['delete'])(item_id))}
+            # update : relecture puis fusion des champs modifiés
+            record = getattr(api, operations['get'])(item_id)
+            if record is None:
+                return {"id": item_id, "ok": False, "error": "introuvable"}
+            record.update(fields)
+            record.pop('id', None)
+            return {"id": item_id, "ok": bool(getattr(api, operations['save'])(record, item_id))}
+        except Exception as e:
+            return {"id": item_id, "ok": False, "error": str(e)}
+            
+    try:
+        if args.action == "list":
+            records = getattr(api, operations['list'])()
+            if records is None:
+                print("Lecture refusée par le serveur", file=sys.stderr)
+                return 1
+            # Secrets masqués comme à l'export, sauf demande explicite
+            transform = None if args.show_secrets else EXPORT_TRANSFORMS.get(args.resource)
+            for record in records:
+                emit(transform(record) if transform else record)
+                
+        elif args.action == "create":
+            if args.resource == "tokens":
+                result = api.create_token(fields.get('description', ''),
+                                          int(fields.get('validityDays', 30)))
+                ok = result is not None
+            else:
+                result = None
+                ok = bool(getattr(api, operations['save'])(fields))
+            emit({"ok": ok, "data": result})
+            failures += not ok
+            
+        else:
+            if args.action == "update" and 'save' not in operations:
+                print(f"{args.resource}: mise à jour non supportée", file=sys.stderr)
+                return 1
+            ids = read_cli_ids(args)
+            if not ids:
+                print("Aucun identifiant fourni", file=sys.stderr)
+                return 1
+                
+            # Requêtes parallèles bornées, résultats écrits dans l'ordre des identifiants
+            with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+                for result in executor.map(run_one, ids):
+                    emit(result)
+                    failures += not result["ok"]
+    finally:
+        if output is not sys.stdout:
+            output.close()
+            
+    return 1 if failures else 0
+
+
+# Durée d'exécution du module (imports non différés compris)
+MODULE_IMPORT_MS = (time.perf_counter() - _MODULE_START) * 1000
+
+
+class StartupTimer:
+    """Jalons du démarrage de l'interface, affichés avec --startup-report"""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+        
+    def mark(self, label):
+        self.marks.append((label, (time.perf_counter() - self.start) * 1000))
+        
+    def print_lazy_imports(self, title):
+        print(title, file=sys.stderr)
+        for name, elapsed in sorted(LAZY_IMPORT_TIMES.items(), key=lambda item: -item[1]):
+            print(f"  {name:<34}{elapsed:8.1f}", file=sys.stderr)
+            
+    def report(self):
+        print("Démarrage (ms)", file=sys.stderr)
+        print(f"  {'imports du module':<34}{MODULE_IMPORT_MS:8.1f}", file=sys.stderr)
+        previous = 0
+        for label, elapsed in self.marks:
+            print(f"  {label:<34}{elapsed:8.1f}  (+{elapsed - previous:.1f})", file=sys.stderr)
+            previous = elapsed
+        if LAZY_IMPORT_TIMES:
+            self.print_lazy_imports("Imports différés déjà effectués (ms)")
+        print("Détail module par module : python -X importtime complete-news-admin-app.py",
+              file=sys.stderr)
+
+
+class UiLagMonitor:
+    """Retard de la boucle Tk et durée des gestionnaires, activé avec --ui-profile
+
+    Un battement after() mesure le retard de la boucle. Tous les rappels Tk
+    (commandes, liaisons, after) passent par tkinter.CallWrapper, remplacé
+    pour chronométrer chaque appel. Avec un dossier de profils, les appels plus
+    lents que le seuil sont enregistrés au format cProfile (.prof).
+    """
+    def __init__(self, threshold_ms=100, interval_ms=100, profile_dir=None, max_profiles=50):
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.profile_dir = profile_dir
+        self.max_profiles = max_profiles
+        self.lags = deque(maxlen=3000)
+        self.handlers = {}   # nom -> [appels, total ms, max ms, appels lents]
+        self.names = {}      # objet code -> nom (borné par le nombre de fonctions)
+        self.stack = []      # appels en cours (boucles imbriquées des dialogues modaux)
+        self.profiles = 0
+        self.root = None
+        self.expected = None
+
+    def install(self):
+        """Remplace CallWrapper ; à appeler avant la création des widgets"""
+        monitor = self
+        base = tk.CallWrapper
+
+        class TimedCallWrapper(base):
+            def __call__(self, *args):
+                return monitor.run(self.func, lambda: base.__call__(self, *args))
+
+        tk.CallWrapper = TimedCallWrapper
+
+    def start(self, root):
+        self.root = root
+        self.expected = time.perf_counter() + self.interval_ms / 1000
+        root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        now = time.perf_counter()
+        self.lags.append(max(0.0, (now - self.expected) * 1000))
+        # Battement exécuté pendant un appel : celui-ci attend un dialogue modal, l'interface répond
+        for frame in self.stack:
+            frame["nested"] = True
+        self.expected = now + self.interval_ms / 1000
+        self.root.after(self.interval_ms, self._beat)
+
+    def describe(self, func):
+        """Nom lisible d'un rappel (méthode, lambda avec sa ligne, cible d'un after)
+        
+        Chaque after() crée une nouvelle fermeture : le cache est indexé par
+        l'objet code de la cible, pas par le rappel, pour ne retenir aucun
+        rappel ni ses arguments.
+        """
+        target = func
+        qualname = getattr(func, "__qualname__", "")
+        if qualname.endswith("after.<locals>.callit"):
+            for cell in func.__closure__ or ():
+                try:
+                    if callable(cell.cell_contents):
+                        target = cell.cell_contents
+                        break
+                except ValueError:
+                    continue
+        code = getattr(getattr(target, "__func__", target), "__code__", None)
+        name = self.names.get(code) if code is not None else None
+        if name is not None:
+            return name
+        name = getattr(target, "__qualname__", type(target).__name__)
+        if code is not None:
+            if "<lambda>" in name:
+                name = f"{name}:{code.co_firstlineno}"
+            self.names[code] = name
+        return name
+
+    def run(self, func, call):
+        """Exécute un rappel Tk en mesurant sa durée"""
+        name = self.describe(func)
+        if name.startswith("UiLagMonitor."):
+            return call()
+
+        frame = {"nested": False}
+        profiler = None
+        if self.profile_dir and not self.stack and self.profiles < self.max_profiles:
+            profiler = lazy_import("cProfile").Profile()
+
+        self.stack.append(frame)
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                return profiler.runcall(call)
+            return call()
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.stack.pop()
+            self.record(name, elapsed, frame["nested"], profiler)
+
+    def record(self, name, elapsed, nested, profiler):
+        stats = self.handlers.setdefault(name, [0, 0.0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        if nested or elapsed < self.threshold_ms:
+            return
+        stats[3] += 1
+        message = f"Interface bloquée {elapsed:.0f} ms par {name}"
+        if profiler is not None:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            safe = "".join(c if c.isalnum() or c in "._-" else "_" for c in name)
+            path = os.path.join(self.profile_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.profiles:03d}-{safe}-{elapsed:.0f}ms.prof")
+            profiler.dump_stats(path)
+            self.profiles += 1
+            message += f" (profil : {path})"
+        print(message, file=sys.stderr)
+
+    def lag_percentile(self, q):
+        values = sorted(self.lags)
+        if not values:
+            return None
+        return values[max(0, min(len(values) - 1, math.ceil(q / 100 * len(values)) - 1))]
+
+    def report(self, limit=15):
+        print("Boucle Tk : retard du battement (ms)", file=sys.stderr)
+        if self.lags:
+            percentiles = "  ".join(f"p{q} {self.lag_percentile(q):.1f}" for q in (50, 95, 99))
+            print(f"  {percentiles}  max {max(self.lags):.1f}  ({len(self.lags)} mesures)", file=sys.stderr)
+        print(f"Gestionnaires les plus lents (seuil {self.threshold_ms} ms)", file=sys.stderr)
+        print(f"  {'gestionnaire':<58}{'appels':>8}{'moy.':>9}{'max':>9}{'lents':>7}", file=sys.stderr)
+        ranked = sorted(self.handlers.items(), key=lambda item: -item[1][2])
+        for name, (count, total, worst, slow) in ranked[:limit]:
+            print(f"  {name[:58]:<58}{count:>8}{total / count:>9.1f}{worst:>9.1f}{slow:>7}", file=sys.stderr)
+        if self.profiles:
+            print(f"{self.profiles} profil(s) dans {self.profile_dir} "
+                  "(python -m pstats, snakeviz ou flameprof pour un flame graph)", file=sys.stderr)
+
+
+class MemoryMonitor:
+    """Suivi mémoire d'une session longue, activé avec --memory-report
+
+    Un relevé est pris après chaque navigation et toutes les minutes :
+    widgets par classe, Toplevel (visibles ou masquées), tas Python
+    (tracemalloc), RSS et tailles des caches de l'application. La croissance
+    depuis le relevé précédent est écrite sur stderr ; au-delà du seuil, les
+    lignes de code qui ont le plus alloué sont listées.
+    """
+    def __init__(self, app, interval_ms=60000, growth_kb=512, top=8):
+        self.app = app
+        self.interval_ms = interval_ms
+        self.growth_kb = growth_kb
+        self.top = top
+        self.samples = []
+        self.snapshot = None
+        self.tracemalloc = lazy_import("tracemalloc")
+        if not self.tracemalloc.is_tracing():
+            self.tracemalloc.start()
+
+    def start(self):
+        self.sample("démarrage")
+        self.app.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self.sample("périodique")
+        self.app.root.after(self.interval_ms, self._tick)
+
+    def widget_counts(self):
+        """Widgets par classe et Toplevel (nombre, dont masquées)"""
+        counts = {}
+        toplevels = hidden = 0
+        pending = [self.app.root]
+        while pending:
+            widget = pending.pop()
+            name = type(widget).__name__
+            counts[name] = counts.get(name, 0) + 1
+            if isinstance(widget, tk.Toplevel):
+                toplevels += 1
+                try:
+                    if widget.state() == "withdrawn":
+                        hidden += 1
+                except tk.TclError:
+                    pass
+            pending.extend(widget.children.values())
+        return counts, toplevels, hidden
+
+    @staticmethod
+    def rss_kb():
+        """Mémoire résidente du processus (Linux : /proc ; ailleurs : pic getrusage)"""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+        except (OSError, ValueError, AttributeError):
+            pass
+        resource = optional_import("resource")
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+
+    def sample(self, label):
+        counts, toplevels, hidden = self.widget_counts()
+        current, peak = self.tracemalloc.get_traced_memory()
+        sample = {
+            "label": label,
+            "time": time.monotonic(),
+            "widgets": sum(counts.values()),
+            "classes": counts,
+            "toplevels": toplevels,
+            "hidden_toplevels": hidden,
+            "heap_kb": current // 1024,
+            "peak_kb": peak // 1024,
+            "rss_kb": self.rss_kb(),
+            "caches": self.app.cache_sizes(),
+        }
+        previous = self.samples[-1] if self.samples else None
+        self.samples.append(sample)
+
+        snapshot = self.tracemalloc.take_snapshot().filter_traces([
+            self.tracemalloc.Filter(False, self.tracemalloc.__file__)])
+        self.print_sample(sample, previous)
+        if previous is not None and sample["heap_kb"] - previous["heap_kb"] >= self.growth_kb:
+            self.print_top_growth(snapshot)
+        self.snapshot = snapshot
+        return sample
+
+    def print_sample(self, sample, previous):
+        def delta(key):
+            if previous is None or sample[key] is None or previous[key] is None:
+                return ""
+            return f" ({sample[key] - previous[key]:+d})"
+
+        rss = f"{sample['rss_kb']} Ko{delta('rss_kb')}" if sample["rss_kb"] is not None else "?"
+        print(f"[mémoire] {sample['label']}: widgets {sample['widgets']}{delta('widgets')}, "
+              f"Toplevel {sample['toplevels']}{delta('toplevels')} dont {sample['hidden_toplevels']} masquées, "
+              f"tas Python {sample['heap_kb']} Ko{delta('heap_kb')}, RSS {rss}", file=sys.stderr)
+        if previous is None:
+            return
+        grown = [f"{name} {count - previous['classes'].get(name, 0):+d}"
+                 for name, count in sorted(sample["classes"].items())
+                 if count != previous["classes"].get(name, 0)]
+        if grown:
+            print(f"  widgets : {', '.join(grown)}", file=sys.stderr)
+        caches = []
+        for name, value in sample["caches"].items():
+            change = value - previous["caches"].get(name, 0)
+            caches.append(f"{name} {value}" + (f" ({change:+d})" if change else ""))
+        print(f"  caches : {', '.join(caches)}", file=sys.stderr)
+
+    def print_top_growth(self, snapshot):
+        """Lignes ayant le plus alloué depuis le relevé précédent"""
+        if self.snapshot is None:
+            return
+        print("  allocations en hausse :", file=sys.stderr)
+        for stat in snapshot.compare_to(self.snapshot, "lineno")[:self.top]:
+            frame = stat.traceback[0]
+            print(f"    {stat.size_diff / 1024:+9.1f} Ko  {os.path.basename(frame.filename)}:{frame.lineno}",
+                  file=sys.stderr)
+
+    def report(self):
+        """Bilan de la session : croissance entre le premier et le dernier relevé"""
+        self.sample("fin de session")
+        first, last = self.samples[0], self.samples[-1]
+        minutes = (last["time"] - first["time"]) / 60
+        print(f"Mémoire sur {minutes:.0f} min ({len(self.samples)} relevés) : "
+              f"widgets {first['widgets']} -> {last['widgets']}, "
+              f"Toplevel {first['toplevels']} -> {last['toplevels']}, "
+              f"tas Python {first['heap_kb']} -> {last['heap_kb']} Ko (pic {last['peak_kb']} Ko), "
+              f"RSS {first['rss_kb']} -> {last['rss_kb']} Ko", file=sys.stderr)
+
+
+def main():
+    """Point d'entrée principal de l'application"""
+    # Rapport de démarrage : --startup-report ou NEWS_ADMIN_STARTUP_REPORT=1
+    argv = sys.argv[1:]
+    startup = None
+    if "--startup-report" in argv or os.environ.get("NEWS_ADMIN_STARTUP_REPORT"):
+        argv = [arg for arg in argv if arg != "--startup-report"]
+        startup = StartupTimer()
+        
+    # Surveillance des blocages de l'interface : --ui-profile ou NEWS_ADMIN_UI_PROFILE=1
+    # (seuil NEWS_ADMIN_UI_SLOW_MS, profils cProfile dans NEWS_ADMIN_UI_PROFILE_DIR)
+    ui_monitor = None
+    if "--ui-profile" in argv or os.environ.get("NEWS_ADMIN_UI_PROFILE"):
+        argv = [arg for arg in argv if arg != "--ui-profile"]
+        ui_monitor = UiLagMonitor(threshold_ms=float(os.environ.get("NEWS_ADMIN_UI_SLOW_MS", 100)),
+                                  profile_dir=os.environ.get("NEWS_ADMIN_UI_PROFILE_DIR"))
+        ui_monitor.install()
+        
+    # Suivi mémoire : --memory-report ou NEWS_ADMIN_MEMORY_REPORT=1 (tracemalloc démarré au plus tôt)
+    memory_report = "--memory-report" in argv or bool(os.environ.get("NEWS_ADMIN_MEMORY_REPORT"))
+    if memory_report:
+        argv = [arg for arg in argv if arg != "--memory-report"]
+        lazy_import("tracemalloc").start()
+        
+    # Avec des arguments : mode ligne de commande, sans affichage
+    if argv:
+        sys.exit(run_cli(argv))
+        
+    # Création de la fenêtre principale
+    root = tk.Tk()
+    if startup:
+        startup.mark("fenêtre Tk")
+    if ui_monitor:
+        ui_monitor.start(root)
+    
+    # Configuration de la fenêtre principale
+    root.title("News Platform Admin")
+    root.configure(bg="#000000")
+    
+    # Icône de l'application (si disponible)
+    try:
+        root.iconbitmap("icon.ico")
+    except:
+        pass
+    
+    # Configuration du redimensionnement
+    root.resizable(True, True)
+    root.minsize(1200, 700)
+    
+    # Créer l'application ; traces configurées avant, la reprise de session
+    # pouvant déjà appeler l'API pendant la construction
+    tracer = RequestTracer()
+    configure_tracing(tracer)
+    app = NewsAdminApp(root, tracer=tracer)
+    if memory_report:
+        app.memory_monitor = MemoryMonitor(app)
+        app.memory_monitor.start()
+    
+    if startup:
+        startup.mark("application et écran de connexion")
+        
+        # Les rappels « idle » déjà en file redessinent la fenêtre avant celui-ci
+        def first_paint():
+            startup.mark("premier affichage")
+            startup.report()
+            
+        root.after_idle(first_paint)
+    
+    # Gestionnaire de fermeture
+    def on_closing():
+        if messagebox.askokcancel("Quitter", "Voulez-vous vraiment quitter l'application ?"):
+            if startup and LAZY_IMPORT_TIMES:
+                startup.print_lazy_imports("Imports différés pendant la session (ms)")
+            if ui_monitor:
+                ui_monitor.report()
+            if app.memory_monitor:
+                app.memory_monitor.report()
+            root.destroy()
+    
+    root.protocol("WM_DELETE_WINDOW", on_closing)
+    
+    # Lancer la boucle principale
+    root.mainloop()
+    
+
+if __name__ == "__main__":
+    main()